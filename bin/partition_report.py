@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+
+import numpy as np
+from mirgecom.simutil import get_partition_report
+
+# report on the quality of a mesh partition
+if __name__ == "__main__":
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(
+        description="Report load balance and communication of a mesh partition")
+    parser.add_argument("mesh_file", type=str,
+        help="gmsh mesh file")
+    parser.add_argument("--dim", type=int, required=True,
+        help="mesh dimension")
+    parser.add_argument("--partition", type=str,
+        help="numpy (.npy) file holding the rank of each element")
+    parser.add_argument("--nranks", type=int,
+        help="partition the mesh with pymetis into this many ranks")
+    parser.add_argument("--nranks-per-axis", type=int, nargs="+",
+        help="partition the mesh geometrically with this many ranks per axis")
+    parser.add_argument("--order", type=int, default=1,
+        help="polynomial order of the discretization")
+    parser.add_argument("--nspecies", type=int, default=0,
+        help="number of mixture species")
+    parser.add_argument("--inviscid", action="store_true",
+        help="only count the exchanges of the inviscid operator")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.mesh_file):
+        raise ValueError(f"Mesh file {args.mesh_file} not found")
+
+    from meshmode.mesh.io import read_gmsh
+    mesh = read_gmsh(args.mesh_file, force_ambient_dim=args.dim)
+
+    if args.partition:
+        rank_per_element = np.load(args.partition)
+    elif args.nranks:
+        from meshmode.distributed import get_partition_by_pymetis
+        rank_per_element = get_partition_by_pymetis(mesh, args.nranks)
+    elif args.nranks_per_axis:
+        from mirgecom.simutil import geometric_mesh_partitioner
+        rank_per_element = geometric_mesh_partitioner(
+            mesh, nranks_per_axis=args.nranks_per_axis, auto_balance=True)
+    else:
+        raise ValueError("One of --partition, --nranks or --nranks-per-axis "
+                         "is required")
+
+    report = get_partition_report(
+        mesh, rank_per_element, order=args.order, nspecies=args.nspecies,
+        viscous=not args.inviscid)
+
+    from pytools import Table
+    tbl = Table()
+    tbl.add_row(("Rank", "Elements", "Shared faces", "Neighbors",
+                 "Bytes sent/RHS"))
+    for rank in range(len(report["nelements"])):
+        tbl.add_row((rank, report["nelements"][rank],
+                     report["nfaces_shared"][rank], report["nneighbors"][rank],
+                     report["nbytes_sent"][rank]))
+    print(tbl)
+
+    for key in ["nelements", "nfaces_shared", "nneighbors", "nbytes_sent"]:
+        values = report[key]
+        print(f"{key}: min={np.min(values)} mean={np.mean(values):.4g} "
+              f"max={np.max(values)}")
+    print(f"Element imbalance: {report['element_imbalance']:.4g}")
+    print(f"Communication imbalance: {report['bytes_imbalance']:.4g}")
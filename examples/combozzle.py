@@ -1100,9 +1100,8 @@ def main(actx_class, rst_filename=None, use_tpe=False,
         pre_step_func = my_pre_step
         post_step_func = my_post_step
 
-    from mirgecom.flux import num_flux_central
     from mirgecom.gas_model import make_operator_fluid_states
-    from mirgecom.navierstokes import grad_cv_operator
+    from mirgecom.navierstokes import FluidOperatorContext
 
     def cfd_rhs(t, state):
         cv, tseed = state
@@ -1112,7 +1111,7 @@ def main(actx_class, rst_filename=None, use_tpe=False,
         fluid_operator_states = make_operator_fluid_states(
             dcoll, fluid_state, gas_model, boundaries, quadrature_tag=quadrature_tag)
 
-        grad_cv = None
+        op_ctx = None
         if inviscid_only:
             fluid_rhs = \
                 euler_operator(
@@ -1123,18 +1122,17 @@ def main(actx_class, rst_filename=None, use_tpe=False,
                     operator_states_quad=fluid_operator_states,
                     use_esdg=use_esdg)
         else:
-            grad_cv = grad_cv_operator(dcoll, gas_model, boundaries, fluid_state,
-                                       time=t,
-                                       numerical_flux_func=num_flux_central,
-                                       quadrature_tag=quadrature_tag,
-                                       operator_states_quad=fluid_operator_states)
+            # Shares the states and grad(CV) between the NS and AV operators
+            op_ctx = FluidOperatorContext(
+                dcoll, gas_model, fluid_state, boundaries, time=t,
+                quadrature_tag=quadrature_tag,
+                operator_states_quad=fluid_operator_states)
             fluid_rhs = \
                 ns_operator(
                     dcoll, state=fluid_state, time=t, boundaries=boundaries,
                     gas_model=gas_model, quadrature_tag=quadrature_tag,
                     inviscid_numerical_flux_func=inv_num_flux_func,
-                    operator_states_quad=fluid_operator_states,
-                    use_esdg=use_esdg)
+                    operator_context=op_ctx, use_esdg=use_esdg)
 
         if not inert_only:
             fluid_rhs = fluid_rhs + eos.get_species_source_terms(
@@ -1146,9 +1144,8 @@ def main(actx_class, rst_filename=None, use_tpe=False,
                                              kappa=kappa_sc, s0=s0_sc)
             fluid_rhs = fluid_rhs + av_laplacian_operator(
                 dcoll, fluid_state=fluid_state, boundaries=boundaries, time=t,
-                gas_model=gas_model, grad_cv=grad_cv,
-                operator_states_quad=fluid_operator_states,
-                alpha=alpha_f, s0=s0_sc, kappa=kappa_sc,
+                gas_model=gas_model, quadrature_tag=quadrature_tag,
+                operator_context=op_ctx, alpha=alpha_f, s0=s0_sc, kappa=kappa_sc,
                 indicator=indicator)
 
         if sponge_on:
@@ -274,7 +274,7 @@ def av_laplacian_operator(dcoll, boundaries, fluid_state, alpha, gas_model=None,
                           dd=DD_VOLUME_ALL, boundary_kwargs=None, indicator=None,
                           divergence_numerical_flux=num_flux_central, comm_tag=None,
                           operator_states_quad=None,
-                          grad_cv=None,
+                          grad_cv=None, operator_context=None,
                           **kwargs):
     r"""Compute the artificial viscosity right-hand-side.
 
@@ -322,6 +322,11 @@ def av_laplacian_operator(dcoll, boundaries, fluid_state, alpha, gas_model=None,
     comm_tag: Hashable
         Tag for distributed communication
 
+    operator_context: :class:`~mirgecom.navierstokes.FluidOperatorContext`
+        Optional context providing the quadrature states and the gradient of
+        the fluid conserved quantities, to share them with other operators of
+        the RHS. Replaces *operator_states_quad* and *grad_cv*.
+
     Returns
     -------
     :class:`mirgecom.fluid.ConservedVars`
@@ -356,6 +361,16 @@ def av_laplacian_operator(dcoll, boundaries, fluid_state, alpha, gas_model=None,
     def interp_to_vol_quad(u):
         return op.project(dcoll, dd_vol, dd_vol_quad, u)
 
+    if operator_context is not None:
+        if operator_states_quad is not None or grad_cv is not None:
+            raise ValueError("operator_states_quad and grad_cv must not be "
+                             "given together with operator_context.")
+        operator_context.check_consistent(
+            fluid_state, boundaries, time=time, quadrature_tag=quadrature_tag,
+            dd=dd_vol, comm_tag=comm_tag)
+        operator_states_quad = operator_context.operator_states_quad
+        grad_cv = operator_context.grad_cv
+
     if operator_states_quad is None:
         from mirgecom.gas_model import make_operator_fluid_states
         operator_states_quad = make_operator_fluid_states(
@@ -0,0 +1,309 @@
+""":mod:`mirgecom.chemistry_activity` restricts chemistry to reacting elements.
+
+In many flows, the chemical source terms vanish in most of the domain because
+the gas is cold or chemically frozen, while evaluating them is among the most
+expensive parts of the RHS. :class:`ChemistryActivity` flags the elements in
+which reactions may occur by temperature and composition thresholds, and
+evaluates the source terms only on those elements, with zero source terms
+elsewhere.
+
+The flags are only refreshed by :meth:`ChemistryActivity.update`, which is
+meant to be called every few steps outside of the RHS, e.g. in the
+*pre_step_callback* of :func:`~mirgecom.steppers.advance_state`::
+
+    activity = ChemistryActivity(dcoll, temperature_threshold=800.)
+
+    def my_pre_step(step, t, dt, state):
+        if step % nactivity == 0:
+            activity.update(fluid_state.temperature,
+                            fluid_state.species_mass_fractions)
+        ...
+
+    def my_rhs(t, state):
+        ...
+        return (ns_operator(...)
+                + activity.get_species_source_terms(eos, cv, temperature))
+
+.. important::
+
+    With lazy array contexts, the active elements must be passed to a
+    compiled RHS as an argument, since arrays that are only reached through
+    the :class:`ChemistryActivity` object are captured as constants when the
+    RHS is traced::
+
+        def my_rhs(t, state, active_elements):
+            ...
+            return (ns_operator(...)
+                    + activity.get_species_source_terms(
+                        eos, cv, temperature,
+                        active_elements=active_elements))
+
+        compiled_rhs = actx.compile(my_rhs)
+        ... compiled_rhs(t, state, activity.active_elements)
+
+    The number of active elements is part of the shapes of these arguments,
+    so a change of the active set leads to a new compilation of the RHS.
+    Calling :meth:`ChemistryActivity.update` after the source terms were
+    traced without *active_elements* raises a :class:`RuntimeError` instead
+    of silently keeping the stale active set.
+
+.. autoclass:: ChemistryActivity
+"""
+
+__copyright__ = """
+Copyright (C) 2024 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import numpy as np
+import loopy as lp
+import grudge.op as op
+from arraycontext import make_loopy_program
+from grudge.dof_desc import DD_VOLUME_ALL
+from meshmode.dof_array import DOFArray, rec_map_dof_array_container
+from meshmode.transform_metadata import (
+    ConcurrentElementInameTag,
+    ConcurrentDOFInameTag
+)
+from pytools import memoize_in
+from pytools.obj_array import make_obj_array
+
+from mirgecom.array_context import actx_class_is_lazy
+
+
+def _get_gather_knl(actx):
+    @memoize_in(actx, (_get_gather_knl, "gather_elements_knl"))
+    def knl():
+        t_unit = make_loopy_program(
+            "{[iel, idof]: 0 <= iel < nelements_result and 0 <= idof < ndofs}",
+            "result[iel, idof] = ary[element_indices[iel], idof]",
+            [
+                lp.GlobalArg("result", None,
+                             shape="nelements_result, ndofs"),
+                lp.GlobalArg("ary", None, shape="nelements_ary, ndofs"),
+                lp.ValueArg("nelements_ary", np.int32),
+                "...",
+            ],
+            name="gather_elements")
+        return lp.tag_inames(t_unit, {
+            "iel": ConcurrentElementInameTag(),
+            "idof": ConcurrentDOFInameTag()})
+
+    return knl()
+
+
+def _get_scatter_knl(actx):
+    @memoize_in(actx, (_get_scatter_knl, "scatter_elements_knl"))
+    def knl():
+        t_unit = make_loopy_program(
+            "{[iel, idof]: 0 <= iel < nelements_result and 0 <= idof < ndofs}",
+            """
+            result[iel, idof] = if(compact_indices[iel] >= 0,
+                                   ary[compact_indices[iel], idof], 0)
+            """,
+            [
+                lp.GlobalArg("result", None,
+                             shape="nelements_result, ndofs"),
+                lp.GlobalArg("ary", None, shape="nelements_ary, ndofs"),
+                lp.ValueArg("nelements_ary", np.int32),
+                "...",
+            ],
+            name="scatter_elements")
+        return lp.tag_inames(t_unit, {
+            "iel": ConcurrentElementInameTag(),
+            "idof": ConcurrentDOFInameTag()})
+
+    return knl()
+
+
+class ChemistryActivity:
+    """Evaluate the chemical source terms only on reacting elements.
+
+    An element is active if the maximum temperature over its nodes is at
+    least *temperature_threshold*, and, for each species index *k* in
+    *species_thresholds*, the maximum mass fraction of species *k* over its
+    nodes is at least ``species_thresholds[k]`` (e.g. to require both fuel
+    and oxidizer). Before the first call to :meth:`update`, all elements are
+    active.
+
+    .. attribute:: nactive_elements
+
+        The number of active elements on this rank.
+
+    .. autoattribute:: active_elements
+
+    .. automethod:: update
+    .. automethod:: get_species_source_terms
+    """
+
+    def __init__(self, dcoll, *, temperature_threshold, species_thresholds=None,
+                 dd=DD_VOLUME_ALL):
+        """Initialize the activity flags.
+
+        Parameters
+        ----------
+        dcoll: :class:`~grudge.discretization.DiscretizationCollection`
+            The DG discretization collection to use
+        temperature_threshold: float
+            Temperature below which elements are inactive
+        species_thresholds: dict
+            Optional mapping of species indices to mass fractions below which
+            elements are inactive
+        dd: grudge.dof_desc.DOFDesc
+            The DOF descriptor of the volume on which the fluid state lives
+        """
+        self._dcoll = dcoll
+        self._dd = dd
+        self.temperature_threshold = temperature_threshold
+        self.species_thresholds = (
+            {} if species_thresholds is None else species_thresholds)
+
+        self._element_indices = None
+        self._compact_indices = None
+        self._traced_with_captured_indices = False
+        self.nactive_elements = dcoll.discr_from_dd(dd).mesh.nelements
+
+    @property
+    def active_elements(self):
+        """The index arrays of the active elements, or *None* before :meth:`update`.
+
+        This is an object array of the per-group element indices and the
+        per-group positions of the elements among the active ones, to be passed
+        as the *active_elements* argument of :meth:`get_species_source_terms`.
+        """
+        if self._element_indices is None:
+            return None
+        return make_obj_array([make_obj_array(self._element_indices),
+                               make_obj_array(self._compact_indices)])
+
+    def update(self, temperature, species_mass_fractions):
+        """Recompute the active elements from the current state.
+
+        Transfers the per-element maxima to the host, so this should not be
+        called in every step.
+        """
+        if self._traced_with_captured_indices:
+            raise RuntimeError(
+                "ChemistryActivity.update called after the source terms were "
+                "traced by a lazy array context without 'active_elements'; "
+                "the traced RHS would keep using the previous active "
+                "elements. Pass 'active_elements' as an argument of the "
+                "compiled RHS instead.")
+
+        actx = temperature.array_context
+
+        def get_element_max(field):
+            element_max = actx.to_numpy(
+                op.elementwise_max(self._dcoll, self._dd, field))
+            return [grp_max[:, 0] for grp_max in element_max]
+
+        is_active = [
+            grp_max >= self.temperature_threshold
+            for grp_max in get_element_max(temperature)]
+        for k, threshold in self.species_thresholds.items():
+            is_active = [
+                grp_is_active & (grp_max >= threshold)
+                for grp_is_active, grp_max in zip(
+                    is_active, get_element_max(species_mass_fractions[k]))]
+
+        element_indices = []
+        compact_indices = []
+        for grp_is_active in is_active:
+            grp_element_indices = np.where(grp_is_active)[0].astype(np.int32)
+            grp_compact_indices = np.full(len(grp_is_active), -1, dtype=np.int32)
+            grp_compact_indices[grp_element_indices] = np.arange(
+                len(grp_element_indices), dtype=np.int32)
+            element_indices.append(grp_element_indices)
+            compact_indices.append(grp_compact_indices)
+
+        self.nactive_elements = sum(len(idx) for idx in element_indices)
+        self._element_indices = [actx.from_numpy(idx) for idx in element_indices]
+        self._compact_indices = [actx.from_numpy(idx) for idx in compact_indices]
+
+    @staticmethod
+    def _gather(ary, element_indices):
+        actx = ary.array_context
+        return DOFArray(actx, tuple(
+            actx.call_loopy(
+                _get_gather_knl(actx), ary=grp_ary,
+                element_indices=grp_element_indices,
+                nelements_ary=grp_ary.shape[0])["result"]
+            for grp_ary, grp_element_indices in zip(ary, element_indices)))
+
+    @staticmethod
+    def _scatter(ary, compact_indices):
+        actx = ary.array_context
+        return DOFArray(actx, tuple(
+            actx.call_loopy(
+                _get_scatter_knl(actx), ary=grp_ary,
+                compact_indices=grp_compact_indices,
+                nelements_ary=grp_ary.shape[0])["result"]
+            for grp_ary, grp_compact_indices in zip(ary, compact_indices)))
+
+    def get_species_source_terms(self, eos, cv, temperature, *,
+                                 active_elements=None):
+        """Get the chemistry source terms, evaluated on the active elements.
+
+        Parameters
+        ----------
+        eos: :class:`~mirgecom.eos.MixtureEOS`
+            The mixture EOS providing the source terms
+        cv: :class:`~mirgecom.fluid.ConservedVars`
+            The fluid state
+        temperature: :class:`~meshmode.dof_array.DOFArray`
+            The fluid temperature
+        active_elements: numpy.ndarray
+            Optional index arrays from :attr:`active_elements`. Required to
+            update the active elements of an RHS compiled by a lazy array
+            context. If not given, the index arrays stored by :meth:`update`
+            are used.
+
+        Returns
+        -------
+        :class:`~mirgecom.fluid.ConservedVars`
+            The chemistry source terms on the active elements, and zero
+            elsewhere
+        """
+        if active_elements is None:
+            if actx_class_is_lazy(type(cv.array_context)):
+                self._traced_with_captured_indices = True
+            active_elements = self.active_elements
+
+        if active_elements is None:
+            return eos.get_species_source_terms(cv, temperature)
+
+        element_indices, compact_indices = active_elements
+
+        # Use the shapes rather than *nactive_elements*, which may be stale
+        # for index arrays passed in as arguments
+        if sum(idx.shape[0] for idx in element_indices) == 0:
+            return 0*cv
+
+        def gather(ary):
+            return self._gather(ary, element_indices)
+
+        def scatter(ary):
+            return self._scatter(ary, compact_indices)
+
+        active_sources = eos.get_species_source_terms(
+            rec_map_dof_array_container(gather, cv), gather(temperature))
+        return rec_map_dof_array_container(scatter, active_sources)
@@ -27,10 +27,20 @@ THE SOFTWARE.
 from .explicit_rk import rk4_step                          # noqa: F401
 from .lsrk import euler_step, lsrk54_step, lsrk144_step    # noqa: F401
 from .ssprk import ssprk43_step                            # noqa: F401
+from .embedded_rk import (                                 # noqa: F401
+    bogacki_shampine32_step, dormand_prince54_step, PIStepSizeController)
+from .rosenbrock import ros2_step                          # noqa: F401
+from .splitting import (                                   # noqa: F401
+    strang_split_step, implicit_chemistry_step)
+from .multirate import multirate_step                      # noqa: F401
 
 __doc__ = """
 .. automodule:: mirgecom.integrators.explicit_rk
 .. automodule:: mirgecom.integrators.lsrk
+.. automodule:: mirgecom.integrators.embedded_rk
+.. automodule:: mirgecom.integrators.rosenbrock
+.. automodule:: mirgecom.integrators.splitting
+.. automodule:: mirgecom.integrators.multirate
 """
 
 
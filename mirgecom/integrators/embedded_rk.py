@@ -0,0 +1,267 @@
+"""Timestepping routines for embedded Runge-Kutta pairs with step-size control.
+
+The step functions in this module return both the advanced state and an
+estimate of the local truncation error of the step. Together with a
+:class:`PIStepSizeController`, they can be used with
+:func:`mirgecom.steppers.advance_state` to adapt the timestep size to a
+given error tolerance.
+
+.. autoclass:: EmbeddedRKCoefficients
+.. autofunction:: embedded_rk_step
+.. autofunction:: bogacki_shampine32_step
+.. autofunction:: dormand_prince54_step
+.. autoclass:: PIStepSizeController
+"""
+
+__copyright__ = """
+Copyright (C) 2024 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+from arraycontext import get_container_context_recursively_opt
+
+
+@dataclass(frozen=True)
+class EmbeddedRKCoefficients:
+    """Dataclass which defines an embedded explicit Runge-Kutta pair.
+
+    The method is given by its Butcher tableau `A`, the weights `B` of the
+    solution that advances the state, the weights `B_hat` of the embedded
+    solution used for the error estimate, and the stage times `C`.
+
+    .. attribute:: error_order
+
+        The order of the embedded solution, i.e. the lower order of the pair.
+    """
+
+    A: np.ndarray
+    B: np.ndarray
+    B_hat: np.ndarray
+    C: np.ndarray
+    error_order: int
+
+
+def embedded_rk_step(coefs, state, t, dt, rhs):
+    """Take one step using an embedded Runge-Kutta pair.
+
+    Returns
+    -------
+    state:
+        The advanced state
+    error:
+        An estimate of the local error of the step, of the same type as *state*
+    """
+    k = []
+    for i in range(len(coefs.C)):
+        stage_state = state
+        for j in range(i):
+            if coefs.A[i][j] != 0:
+                stage_state = stage_state + dt*coefs.A[i][j]*k[j]
+        k.append(rhs(t + coefs.C[i]*dt, stage_state))
+
+    new_state = state
+    error = 0
+    for i in range(len(k)):
+        if coefs.B[i] != 0:
+            new_state = new_state + dt*coefs.B[i]*k[i]
+        if coefs.B[i] != coefs.B_hat[i]:
+            error = error + dt*(coefs.B[i] - coefs.B_hat[i])*k[i]
+
+    return new_state, error
+
+
+BogackiShampine32Coefs = EmbeddedRKCoefficients(
+    A=np.array([
+        [0., 0., 0., 0.],
+        [1/2, 0., 0., 0.],
+        [0., 3/4, 0., 0.],
+        [2/9, 1/3, 4/9, 0.]]),
+    B=np.array([2/9, 1/3, 4/9, 0.]),
+    B_hat=np.array([7/24, 1/4, 1/3, 1/8]),
+    C=np.array([0., 1/2, 3/4, 1.]),
+    error_order=2)
+
+
+def bogacki_shampine32_step(state, t, dt, rhs):
+    """Take one step using the 3rd-order Bogacki-Shampine method.
+
+    The error estimate is given by the embedded 2nd-order method. The
+    coefficients are summarized in [Bogacki_1989]_.
+    """
+    return embedded_rk_step(BogackiShampine32Coefs, state, t, dt, rhs)
+
+
+DormandPrince54Coefs = EmbeddedRKCoefficients(
+    A=np.array([
+        [0., 0., 0., 0., 0., 0., 0.],
+        [1/5, 0., 0., 0., 0., 0., 0.],
+        [3/40, 9/40, 0., 0., 0., 0., 0.],
+        [44/45, -56/15, 32/9, 0., 0., 0., 0.],
+        [19372/6561, -25360/2187, 64448/6561, -212/729, 0., 0., 0.],
+        [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656, 0., 0.],
+        [35/384, 0., 500/1113, 125/192, -2187/6784, 11/84, 0.]]),
+    B=np.array([35/384, 0., 500/1113, 125/192, -2187/6784, 11/84, 0.]),
+    B_hat=np.array([5179/57600, 0., 7571/16695, 393/640, -92097/339200,
+                    187/2100, 1/40]),
+    C=np.array([0., 1/5, 3/10, 4/5, 8/9, 1., 1.]),
+    error_order=4)
+
+
+def dormand_prince54_step(state, t, dt, rhs):
+    """Take one step using the 5th-order Dormand-Prince method.
+
+    The error estimate is given by the embedded 4th-order method. The
+    coefficients are summarized in [Dormand_1980]_.
+    """
+    return embedded_rk_step(DormandPrince54Coefs, state, t, dt, rhs)
+
+
+class PIStepSizeController:
+    r"""Proportional-integral controller for the timestep size.
+
+    Measures the error estimate of an embedded Runge-Kutta step as
+
+    .. math::
+
+        \mathrm{err} = \max \frac{|e|}{\mathrm{atol}
+            + \mathrm{rtol} \max(|y_n|, |y_{n+1}|)},
+
+    over all components and DOFs, and accepts the step if
+    $\mathrm{err} \le 1$. The next timestep size is
+
+    .. math::
+
+        \Delta t_{n+1} = \Delta t_n\, s\, \mathrm{err}_n^{-\alpha}\,
+            \mathrm{err}_{n-1}^{\beta},
+
+    limited by *min_factor* and *max_factor*, where $s$ is the safety
+    factor, and $\alpha = 0.7/(q+1)$ and $\beta = 0.4/(q+1)$ by default for
+    an error estimate of order $q$.
+
+    .. automethod:: get_error_norm
+    .. automethod:: adapt_dt
+    """
+
+    def __init__(self, error_order, *, rtol=1e-6, atol=1e-8, safety=0.9,
+                 alpha=None, beta=None, min_factor=0.2, max_factor=5.,
+                 dt_min=0., dt_max=np.inf, comm=None):
+        """Initialize the controller.
+
+        Parameters
+        ----------
+        error_order: int
+            The order of the embedded error estimate, e.g.
+            :attr:`EmbeddedRKCoefficients.error_order`
+        rtol: float
+            Relative error tolerance
+        atol: float
+            Absolute error tolerance
+        safety: float
+            Factor by which to reduce the predicted timestep size
+        alpha: float
+            Exponent of the current error
+        beta: float
+            Exponent of the previous error
+        min_factor: float
+            Smallest factor by which the timestep size may change
+        max_factor: float
+            Largest factor by which the timestep size may change
+        dt_min: float
+            Timestep size below which the controller gives up
+        dt_max: float
+            Largest timestep size the controller proposes
+        comm:
+            Optional MPI communicator over which to reduce the error
+        """
+        self.rtol = rtol
+        self.atol = atol
+        self.safety = safety
+        self.alpha = 0.7/(error_order + 1) if alpha is None else alpha
+        self.beta = 0.4/(error_order + 1) if beta is None else beta
+        self._reject_exponent = 1/(error_order + 1)
+        self.min_factor = min_factor
+        self.max_factor = max_factor
+        self.dt_min = dt_min
+        self.dt_max = dt_max
+        self.comm = comm
+
+        self._prev_error_norm = 1.
+        self._prev_rejected = False
+
+    def get_error_norm(self, state, new_state, error):
+        """Return the scaled maximum norm of the *error* estimate of a step."""
+        actx = get_container_context_recursively_opt(state)
+
+        if actx is None:
+            scale = self.atol + self.rtol*np.maximum(
+                np.abs(state), np.abs(new_state))
+            error_norm = float(np.max(np.abs(error)/scale))
+        else:
+            scale = self.atol + self.rtol*actx.np.maximum(
+                actx.np.abs(state), actx.np.abs(new_state))
+            error_norm = float(actx.to_numpy(
+                actx.np.max(actx.np.abs(error)/scale)))
+
+        if self.comm is not None:
+            from mpi4py import MPI
+            error_norm = self.comm.allreduce(error_norm, op=MPI.MAX)
+
+        return error_norm
+
+    def adapt_dt(self, dt, error_norm):
+        """Decide whether to accept a step and propose the next timestep size.
+
+        Returns
+        -------
+        accepted: bool
+            Whether the step with size *dt* and error *error_norm* is accepted
+        dt: float
+            The timestep size for the next step, or for retrying the step if
+            it was rejected
+        """
+        if not np.isfinite(error_norm):
+            accepted = False
+            factor = self.min_factor
+        elif error_norm <= 1:
+            accepted = True
+            error_norm = max(error_norm, 1e-10)
+            factor = (self.safety * error_norm**(-self.alpha)
+                      * self._prev_error_norm**self.beta)
+            max_factor = 1. if self._prev_rejected else self.max_factor
+            factor = min(max_factor, max(self.min_factor, factor))
+            self._prev_error_norm = max(error_norm, 1e-4)
+        else:
+            accepted = False
+            factor = max(self.min_factor,
+                         self.safety * error_norm**(-self._reject_exponent))
+
+        self._prev_rejected = not accepted
+
+        new_dt = min(dt*factor, self.dt_max)
+        if new_dt < self.dt_min:
+            raise RuntimeError(f"Timestep size {new_dt} fell below the "
+                               f"minimum {self.dt_min}.")
+
+        return accepted, new_dt
@@ -3,6 +3,7 @@
 .. autofunction:: euler_step
 .. autofunction:: lsrk54_step
 .. autofunction:: lsrk144_step
+.. autofunction:: get_lsrk_storage_nbytes
 """
 
 __copyright__ = """
@@ -32,6 +33,12 @@ THE SOFTWARE.
 from dataclasses import dataclass
 
 import numpy as np
+from arraycontext import (
+    get_container_context_recursively_opt,
+    rec_map_array_container,
+    rec_multimap_array_container,
+    rec_map_reduce_array_container,
+)
 
 
 @dataclass(frozen=True)
@@ -46,8 +53,69 @@ class LSRKCoefficients:
     C: np.ndarray
 
 
-def lsrk_step(coefs, state, t, dt, rhs):
-    """Take one step using a low-storage Runge-Kutta method."""
+def _unalias_leaves(ary):
+    """Return *ary* with leaf arrays that occur more than once copied."""
+    seen_ids = set()
+
+    def unalias(leaf):
+        if id(leaf) in seen_ids:
+            return leaf.copy()
+        seen_ids.add(id(leaf))
+        return leaf
+
+    return rec_map_array_container(unalias, ary)
+
+
+def _lsrk_step_in_place(coefs, state, t, dt, rhs):
+    """Take one LSRK step, overwriting the leaf arrays of *state*."""
+    state = _unalias_leaves(state)
+
+    def update_k(a):
+        def update(k_leaf, rhs_leaf):
+            k_leaf *= a
+            k_leaf += dt*rhs_leaf
+            return k_leaf
+        return update
+
+    def update_state(b):
+        def update(state_leaf, k_leaf):
+            state_leaf += b*k_leaf
+            return state_leaf
+        return update
+
+    k = None
+    for i in range(len(coefs.A)):
+        rhs_value = rhs(t + coefs.C[i]*dt, state)
+        if k is None:
+            # k is zero before the first stage
+            k = dt*rhs_value
+        else:
+            k = rec_multimap_array_container(update_k(coefs.A[i]), k, rhs_value)
+        del rhs_value
+        state = rec_multimap_array_container(update_state(coefs.B[i]), state, k)
+
+    return state
+
+
+def lsrk_step(coefs, state, t, dt, rhs, *, in_place=False):
+    """Take one step using a low-storage Runge-Kutta method.
+
+    By default, each stage allocates new arrays for both the ``k`` register and
+    the state. With *in_place*, the two registers are instead updated in place
+    where the array context permits it (e.g. in eager mode, or for
+    :mod:`numpy` arrays), so that, apart from short-lived temporaries, only
+    the state, ``k``, and one RHS evaluation are held at any time (see
+    :func:`get_lsrk_storage_nbytes`). This *overwrites* the arrays of the
+    input *state*, which must therefore not be used after the call. In lazy
+    mode, *in_place* has no effect; compiling whole steps (see
+    *compile_timestepper* in :func:`~mirgecom.steppers.advance_state`) leaves
+    the reuse of buffers to the array context instead.
+    """
+    if in_place:
+        actx = get_container_context_recursively_opt(state)
+        if actx is None or actx.permits_inplace_modification:
+            return _lsrk_step_in_place(coefs, state, t, dt, rhs)
+
     k = 0.0 * state
     for i in range(len(coefs.A)):
         k = coefs.A[i]*k + dt*rhs(t + coefs.C[i]*dt, state)
@@ -62,9 +130,9 @@ EulerCoefs = LSRKCoefficients(
     C=np.array([0.]))
 
 
-def euler_step(state, t, dt, rhs):
+def euler_step(state, t, dt, rhs, *, in_place=False):
     """Take one step using the explicit, 1st-order accurate, Euler method."""
-    return lsrk_step(EulerCoefs, state, t, dt, rhs)
+    return lsrk_step(EulerCoefs, state, t, dt, rhs, in_place=in_place)
 
 
 LSRK54CarpenterKennedyCoefs = LSRKCoefficients(
@@ -88,12 +156,13 @@ LSRK54CarpenterKennedyCoefs = LSRKCoefficients(
         2802321613138/2924317926251]))
 
 
-def lsrk54_step(state, t, dt, rhs):
+def lsrk54_step(state, t, dt, rhs, *, in_place=False):
     """Take one step using an explicit 5-stage, 4th-order, LSRK method.
 
     Coefficients are summarized in [Hesthaven_2008]_, Section 3.4.
     """
-    return lsrk_step(LSRK54CarpenterKennedyCoefs, state, t, dt, rhs)
+    return lsrk_step(LSRK54CarpenterKennedyCoefs, state, t, dt, rhs,
+                     in_place=in_place)
 
 
 LSRK144NiegemannDiehlBuschCoefs = LSRKCoefficients(
@@ -144,11 +213,41 @@ LSRK144NiegemannDiehlBuschCoefs = LSRKCoefficients(
         0.8734213127600976]))
 
 
-def lsrk144_step(state, t, dt, rhs):
+def lsrk144_step(state, t, dt, rhs, *, in_place=False):
     """Take one step using an explicit 14-stage, 4th-order, LSRK method.
 
     This method is derived by Niegemann, Diehl, and Busch (2012), with
     an optimal stability region for advection-dominated flows. The
     LSRK coefficients are summarized in [Niegemann_2012]_, Table 3.
     """
-    return lsrk_step(LSRK144NiegemannDiehlBuschCoefs, state, t, dt, rhs)
+    return lsrk_step(LSRK144NiegemannDiehlBuschCoefs, state, t, dt, rhs,
+                     in_place=in_place)
+
+
+def get_lsrk_storage_nbytes(state, *, in_place=True):
+    """Return the number of bytes held in state-sized registers by an LSRK step.
+
+    Counts the registers that :func:`lsrk_step` keeps alive at its peak,
+    i.e. the state, ``k``, and the RHS evaluation in place, plus the previous
+    state and ``k`` while the new ones are being built out of place.
+    Temporaries of single arrays and the memory used internally by the RHS are
+    not included.
+
+    Parameters
+    ----------
+    state
+        The stepper state
+    in_place: bool
+        Whether to count the registers of the in-place variant
+
+    Returns
+    -------
+    int
+        The estimated storage in bytes
+    """
+    def leaf_nbytes(leaf):
+        return getattr(leaf, "nbytes", np.dtype(type(leaf)).itemsize)
+
+    state_nbytes = rec_map_reduce_array_container(sum, leaf_nbytes, state)
+    nregisters = 3 if in_place else 5
+    return nregisters*state_nbytes
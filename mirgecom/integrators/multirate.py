@@ -0,0 +1,118 @@
+"""Timestepping routines for multirate integration of coupled systems.
+
+For coupled systems whose components evolve on different time scales (e.g. a
+fluid coupled to a solid wall, see
+:mod:`mirgecom.multiphysics.thermally_coupled_fluid_wall`), a single-rate
+stepper evaluates the slow component's operator at the fast component's
+timestep size. :func:`multirate_step` instead takes one step of the slow
+component per macro step and subcycles the fast component.
+
+Both RHS functions act on the full stepper state and return derivatives of
+the full state, with zeros for the components they do not advance. For a
+stepper state ``make_obj_array([fluid_cv, wall_temperature])``, the fluid
+can be subcycled with::
+
+    def fluid_rhs(t, state):
+        fluid_state = make_fluid_state(cv=state[0], gas_model=gas_model)
+        fluid_boundaries_with_interface, _ = add_interface_boundaries(...)
+        return make_obj_array([
+            ns_operator(dcoll, gas_model, fluid_state,
+                        fluid_boundaries_with_interface, ...),
+            0*state[1]])
+
+    def wall_rhs(t, state):
+        ...
+        return make_obj_array([0*state[0], diffusion_operator(...)])
+
+    timestepper = partial(multirate_step, fast_rhs=actx.compile(fluid_rhs),
+                          nsubsteps=10)
+    advance_state(rhs=wall_rhs, timestepper=timestepper, dt=wall_dt, ...)
+
+.. autofunction:: multirate_step
+"""
+
+__copyright__ = """
+Copyright (C) 2024 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+from mirgecom.integrators.explicit_rk import rk4_step
+
+
+def multirate_step(state, t, dt, rhs, *, fast_rhs, nsubsteps,
+                   slow_stepper=rk4_step, fast_stepper=rk4_step):
+    r"""Take one slowest-first multirate step.
+
+    First, the slow components are advanced by one step of size $\Delta t$
+    with *slow_stepper*, with the fast components linearly extrapolated from
+    their time derivative at *t*. Then, the fast components are advanced by
+    *nsubsteps* steps of size $\Delta t/n$ with *fast_stepper*, with the slow
+    components linearly interpolated between their values at the beginning
+    and the end of the step. The coupling is second-order accurate.
+
+    Each macro step thus evaluates *rhs* as often as one step of
+    *slow_stepper* does, and *fast_rhs* as often as *nsubsteps* steps of
+    *fast_stepper*, plus once for the extrapolation.
+
+    Parameters
+    ----------
+    state
+        The stepper state
+    t: float
+        The current time
+    dt: float
+        The (slow) timestep size
+    rhs
+        Function with signature ``rhs(t, state)`` returning the time
+        derivative of the slow components of *state*, and zeros for the fast
+        components
+    fast_rhs
+        Function with signature ``fast_rhs(t, state)`` returning the time
+        derivative of the fast components of *state*, and zeros for the slow
+        components
+    nsubsteps: int
+        The number of fast steps per slow step
+    slow_stepper
+        A stepper function with signature ``stepper(state, t, dt, rhs)`` for
+        the slow components
+    fast_stepper
+        A stepper function with signature ``stepper(state, t, dt, rhs)`` for
+        the fast components
+    """
+    fast_rate = fast_rhs(t, state)
+
+    def extrapolated_slow_rhs(tau, slow_stage_state):
+        return rhs(tau, slow_stage_state + (tau - t)*fast_rate)
+
+    # The slow RHS is zero for the fast components, so they are unchanged
+    slow_increment = (
+        slow_stepper(state, t, dt, extrapolated_slow_rhs) - state)
+
+    def interpolated_fast_rhs(tau, fast_stage_state):
+        return fast_rhs(tau, fast_stage_state + (tau - t)/dt*slow_increment)
+
+    substep_dt = dt / nsubsteps
+    for i in range(nsubsteps):
+        state = fast_stepper(state, t + i*substep_dt, substep_dt,
+                             interpolated_fast_rhs)
+
+    return state + slow_increment
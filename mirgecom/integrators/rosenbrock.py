@@ -0,0 +1,157 @@
+"""Timestepping routines for linearly implicit (Rosenbrock) methods.
+
+The routines in this module advance systems of ODEs whose state is a
+:class:`numpy.ndarray` of *n* components, each of which may itself be an
+array (e.g. a :class:`~meshmode.dof_array.DOFArray`). The Jacobian is a
+:class:`numpy.ndarray` of shape *(n, n)* with entries of the same type, so
+that the linear systems of all points (e.g. DOFs) are solved at once.
+
+.. autofunction:: ros2_step
+.. autofunction:: finite_difference_jacobian
+"""
+
+__copyright__ = """
+Copyright (C) 2024 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import numpy as np
+
+
+def _lu_factor(a):
+    """Return the LU factorization of the dense matrix *a*, without pivoting.
+
+    Both factors are stored in one matrix, with the unit diagonal of the
+    lower factor implied.
+    """
+    n = a.shape[0]
+    lu = np.empty((n, n), dtype=object)
+    for i in range(n):
+        for j in range(n):
+            lu[i, j] = a[i, j]
+
+    for k in range(n):
+        for i in range(k+1, n):
+            lu[i, k] = lu[i, k] / lu[k, k]
+            for j in range(k+1, n):
+                lu[i, j] = lu[i, j] - lu[i, k]*lu[k, j]
+
+    return lu
+
+
+def _lu_solve(lu, b):
+    """Solve the linear system with LU factorization *lu* and right-hand side *b*."""
+    n = lu.shape[0]
+    x = np.empty(n, dtype=object)
+    for i in range(n):
+        x[i] = b[i]
+        for j in range(i):
+            x[i] = x[i] - lu[i, j]*x[j]
+    for i in reversed(range(n)):
+        for j in range(i+1, n):
+            x[i] = x[i] - lu[i, j]*x[j]
+        x[i] = x[i] / lu[i, i]
+
+    return x
+
+
+_ROS2_GAMMA = 1 + 1/np.sqrt(2)
+
+
+def ros2_step(state, t, dt, rhs, jacobian):
+    r"""Take one step using the 2nd-order, L-stable, ROS2 Rosenbrock method.
+
+    The method [Verwer_1999]_ solves two linear systems with the matrix
+    $I - \gamma \Delta t J$ per step, where $J$ is the Jacobian of *rhs*,
+    evaluated once per step. The systems are solved by Gaussian elimination
+    without pivoting, which is stable as long as the matrix is diagonally
+    dominant, as is typical for the (mostly consuming) Jacobians of stiff
+    chemistry at moderate timestep sizes.
+
+    Parameters
+    ----------
+    state: numpy.ndarray
+        The state, with one entry per component
+    t: float
+        The current time
+    dt: float
+        The timestep size
+    rhs
+        Function with signature ``rhs(t, state)`` returning the time
+        derivative of *state*
+    jacobian
+        Function with signature ``jacobian(t, state, rhs_value)`` returning
+        the Jacobian of *rhs* at *state*, where *rhs_value* is the value of
+        ``rhs(t, state)``. See :func:`finite_difference_jacobian`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The advanced state
+    """
+    n = len(state)
+    f0 = rhs(t, state)
+    jac = jacobian(t, state, f0)
+
+    matrix = np.empty((n, n), dtype=object)
+    for i in range(n):
+        for j in range(n):
+            matrix[i, j] = (1. if i == j else 0.) - _ROS2_GAMMA*dt*jac[i, j]
+    lu = _lu_factor(matrix)
+
+    k1 = _lu_solve(lu, f0)
+    f1 = rhs(t + dt, state + dt*k1)
+    k2 = _lu_solve(lu, f1 - 2*k1)
+
+    return state + 1.5*dt*k1 + 0.5*dt*k2
+
+
+def finite_difference_jacobian(rhs, t, state, rhs_value=None, *, rel_eps=1e-7,
+                               abs_eps=1e-12):
+    """Approximate the Jacobian of *rhs* at *state* by forward differences.
+
+    Each column is obtained from one additional evaluation of *rhs* with the
+    corresponding component of *state* perturbed by
+    ``rel_eps*abs(state[j]) + abs_eps``, point by point.
+
+    Returns
+    -------
+    numpy.ndarray
+        Object array of shape *(n, n)* with the derivative of component *i* of
+        *rhs* with respect to component *j* of *state* in entry *(i, j)*
+    """
+    if rhs_value is None:
+        rhs_value = rhs(t, state)
+
+    n = len(state)
+    jac = np.empty((n, n), dtype=object)
+    for j in range(n):
+        eps = rel_eps*abs(state[j]) + abs_eps
+        perturbed_state = np.empty(n, dtype=object)
+        for i in range(n):
+            perturbed_state[i] = state[i]
+        perturbed_state[j] = state[j] + eps
+        perturbed_rhs = rhs(t, perturbed_state)
+        for i in range(n):
+            jac[i, j] = (perturbed_rhs[i] - rhs_value[i]) / eps
+
+    return jac
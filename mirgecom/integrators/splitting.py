@@ -0,0 +1,138 @@
+"""Timestepping routines for operator-split reacting flow.
+
+Chemical source terms are typically much stiffer than the transport
+operators, so that explicit integration of the full RHS is limited to a
+chemistry-imposed timestep size. :func:`strang_split_step` instead advances
+the transport operators with an explicit stepper at the fluid timestep size,
+and the pointwise chemistry with a separate (e.g. implicit) reaction stepper
+such as :func:`implicit_chemistry_step`.
+
+For a stepper state ``make_obj_array([cv, temperature_seed])`` as used in
+the examples, a timestepper for :func:`~mirgecom.steppers.advance_state` can
+be built as::
+
+    def reaction_step(state, t, dt):
+        cv, tseed = state
+        cv, temperature = implicit_chemistry_step(eos, cv, tseed, dt)
+        return make_obj_array([cv, temperature])
+
+    timestepper = partial(strang_split_step, transport_step=lsrk54_step,
+                          reaction_step=actx.compile(reaction_step))
+
+with the chemistry source terms removed from the RHS.
+
+.. autofunction:: strang_split_step
+.. autofunction:: implicit_chemistry_step
+"""
+
+__copyright__ = """
+Copyright (C) 2024 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+from mirgecom.integrators.rosenbrock import ros2_step, finite_difference_jacobian
+
+
+def strang_split_step(state, t, dt, rhs, *, transport_step, reaction_step):
+    r"""Take one step using second-order Strang splitting.
+
+    The state is advanced by the reaction stepper over $\Delta t/2$, then by
+    the transport stepper over $\Delta t$, and again by the reaction stepper
+    over $\Delta t/2$.
+
+    Parameters
+    ----------
+    state
+        The stepper state
+    t: float
+        The current time
+    dt: float
+        The timestep size
+    rhs
+        The RHS of the transport operators, without the reaction terms
+    transport_step
+        A stepper function with signature
+        ``transport_step(state, t, dt, rhs)``, e.g.
+        :func:`~mirgecom.integrators.lsrk.lsrk54_step`
+    reaction_step
+        Function with signature ``reaction_step(state, t, dt)`` advancing
+        *state* by the reaction terms
+    """
+    state = reaction_step(state, t, dt/2)
+    state = transport_step(state, t, dt, rhs)
+    return reaction_step(state, t + dt/2, dt/2)
+
+
+def implicit_chemistry_step(eos, cv, temperature_seed, dt, *, nsubsteps=1):
+    r"""Advance the species densities by the chemical source terms.
+
+    Integrates the pointwise chemistry ODEs
+
+    .. math::
+
+        \frac{\partial (\rho Y_k)}{\partial t} = W_k \dot{\omega}_k
+
+    at constant density, momentum and total energy with *nsubsteps* steps of
+    the L-stable :func:`~mirgecom.integrators.rosenbrock.ros2_step`, using a
+    finite-difference Jacobian. All DOFs are advanced together.
+
+    Parameters
+    ----------
+    eos: :class:`~mirgecom.eos.MixtureEOS`
+        The mixture EOS providing temperature and species source terms
+    cv: :class:`~mirgecom.fluid.ConservedVars`
+        The fluid state
+    temperature_seed: :class:`~meshmode.dof_array.DOFArray`
+        Seed for the temperature computation
+    dt: float
+        The time interval over which to integrate
+    nsubsteps: int
+        The number of implicit steps to take
+
+    Returns
+    -------
+    cv: :class:`~mirgecom.fluid.ConservedVars`
+        The fluid state with advanced species densities
+    temperature: :class:`~meshmode.dof_array.DOFArray`
+        The temperature of the advanced state
+    """
+    temperature = temperature_seed
+
+    def reaction_rhs(t, species_mass):
+        reacting_cv = cv.replace(species_mass=species_mass)
+        reacting_temperature = eos.temperature(reacting_cv, temperature)
+        return eos.get_species_source_terms(
+            reacting_cv, reacting_temperature).species_mass
+
+    def reaction_jacobian(t, species_mass, rhs_value):
+        return finite_difference_jacobian(reaction_rhs, t, species_mass,
+                                          rhs_value)
+
+    species_mass = cv.species_mass
+    substep_dt = dt / nsubsteps
+    for i in range(nsubsteps):
+        species_mass = ros2_step(species_mass, i*substep_dt, substep_dt,
+                                 reaction_rhs, reaction_jacobian)
+        temperature = eos.temperature(cv.replace(species_mass=species_mass),
+                                      temperature)
+
+    return cv.replace(species_mass=species_mass), temperature
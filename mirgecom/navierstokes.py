@@ -31,6 +31,7 @@ RHS Evaluation
 .. autofunction:: grad_cv_operator
 .. autofunction:: grad_t_operator
 .. autofunction:: ns_operator
+.. autoclass:: FluidOperatorContext
 """
 
 __copyright__ = """
@@ -58,6 +59,7 @@ THE SOFTWARE.
 """
 
 from functools import partial
+import numpy as np
 from warnings import warn
 
 from meshmode.discretization.connection import FACE_RESTR_ALL
@@ -345,6 +347,257 @@ def grad_t_operator(
         dcoll, dd_vol_quad, dd_allfaces_quad, vol_state_quad.temperature, t_flux_bnd)
 
 
+class FluidOperatorContext:
+    r"""Fluid data shared by the operators of one RHS evaluation.
+
+    The operators of a RHS (e.g. :func:`ns_operator`,
+    :func:`~mirgecom.euler.euler_operator`, and
+    :func:`~mirgecom.artificial_viscosity.av_laplacian_operator`) all need the
+    fluid states on the quadrature domain and their face trace pairs, and the
+    viscous ones the gradients of the conserved variables and temperature. A
+    context computes the states, including their trace exchanges, when it is
+    created, and each gradient, with its own trace exchange, the first time
+    it is needed, so that one RHS does this work only once::
+
+        def my_rhs(t, state):
+            fluid_state = make_fluid_state(state, gas_model)
+            op_ctx = FluidOperatorContext(
+                dcoll, gas_model, fluid_state, boundaries, time=t,
+                quadrature_tag=quadrature_tag, limiter_func=limiter_func)
+            return (
+                ns_operator(dcoll, gas_model, fluid_state, boundaries, time=t,
+                            quadrature_tag=quadrature_tag,
+                            operator_context=op_ctx)
+                + av_laplacian_operator(
+                    dcoll, boundaries, fluid_state, alpha, gas_model=gas_model,
+                    time=t, quadrature_tag=quadrature_tag,
+                    operator_context=op_ctx))
+
+    Operators that only need the states, such as
+    :func:`~mirgecom.euler.euler_operator`, can be given
+    :attr:`operator_states_quad`. The gradients remain available afterwards
+    (e.g. for logging or visualization) as :attr:`grad_cv` and :attr:`grad_t`.
+
+    .. attribute:: state
+
+        The fluid state on the base discretization
+
+    .. attribute:: quadrature_tag
+    .. attribute:: dd
+    .. attribute:: comm_tag
+
+        The quadrature tag, volume DOF descriptor and communication tag that
+        the context was created with
+
+    .. attribute:: operator_states_quad
+
+        The fluid states on the quadrature domain, as returned by
+        :func:`~mirgecom.gas_model.make_operator_fluid_states`
+
+    .. autoattribute:: grad_cv
+    .. autoattribute:: grad_t
+    .. autoattribute:: grad_cv_interior_pairs
+    .. autoattribute:: grad_t_interior_pairs
+
+    .. automethod:: __init__
+    .. automethod:: check_consistent
+    """
+
+    def __init__(self, dcoll, gas_model, state, boundaries, *, time=0.0,
+                 gradient_numerical_flux_func=num_flux_central,
+                 quadrature_tag=DISCR_TAG_BASE, dd=DD_VOLUME_ALL, comm_tag=None,
+                 limiter_func=None, entropy_stable=False,
+                 operator_states_quad=None, grad_cv=None, grad_t=None):
+        """Create the quadrature states for an RHS evaluation.
+
+        Parameters
+        ----------
+        state: :class:`~mirgecom.gas_model.FluidState`
+
+            Fluid state object with the conserved state, and dependent
+            quantities.
+
+        boundaries
+            Dictionary of boundary functions keyed by btags
+
+        time
+            Time
+
+        gas_model: :class:`~mirgecom.gas_model.GasModel`
+
+            Physical gas model including equation of state, transport,
+            and kinetic properties as required by fluid state
+
+        gradient_numerical_flux_func:
+           Optional callable function to return the numerical flux to be used
+           when computing the gradients.
+
+        quadrature_tag
+            An identifier denoting a particular quadrature discretization to use
+            during operator evaluations.
+
+        dd: grudge.dof_desc.DOFDesc
+            the DOF descriptor of the discretization on which *state* lives. Must
+            be a volume on the base discretization.
+
+        comm_tag: Hashable
+            Tag for distributed communication
+
+        limiter_func:
+            Optional callable function to limit the fluid conserved quantities
+            of the quadrature states
+
+        entropy_stable:
+            Whether to create entropy-projected quadrature states, see
+            :func:`~mirgecom.gas_model.make_operator_fluid_states`
+
+        operator_states_quad
+            Optional quadrature states, if they have already been computed
+
+        grad_cv: :class:`~mirgecom.fluid.ConservedVars`
+            Optional gradient of the fluid conserved quantities, if it has
+            already been computed
+
+        grad_t: numpy.ndarray
+            Optional gradient of the fluid temperature, if it has already been
+            computed
+        """
+        if not isinstance(dd.domain_tag, VolumeDomainTag):
+            raise TypeError("dd must represent a volume")
+        if dd.discretization_tag != DISCR_TAG_BASE:
+            raise ValueError("dd must belong to the base discretization")
+
+        self._dcoll = dcoll
+        self._gas_model = gas_model
+        self._boundaries = normalize_boundaries(boundaries)
+        self._time = time
+        self._gradient_numerical_flux_func = gradient_numerical_flux_func
+        if quadrature_tag is None:
+            quadrature_tag = DISCR_TAG_BASE
+        self.quadrature_tag = quadrature_tag
+        self.dd = dd
+        self.comm_tag = comm_tag
+        self.state = state
+
+        if operator_states_quad is None:
+            if state.is_mixture and limiter_func is None:
+                warn("Mixtures often require species limiting, and a non-limited "
+                     "state is being created for this operator. For mixtures, "
+                     "one should pass the operator_states_quad argument with "
+                     "limited states or provide a limiter_func to this operator.")
+            operator_states_quad = make_operator_fluid_states(
+                dcoll, state, gas_model, self._boundaries, quadrature_tag,
+                limiter_func=limiter_func, dd=dd, comm_tag=comm_tag,
+                entropy_stable=entropy_stable)
+        self.operator_states_quad = operator_states_quad
+
+        self._grad_cv = grad_cv
+        self._grad_t = grad_t
+        self._grad_cv_interior_pairs = None
+        self._grad_t_interior_pairs = None
+
+    def check_consistent(self, state, boundaries, *, time, quadrature_tag, dd,
+                         comm_tag, gradient_numerical_flux_func=None):
+        """Raise a :exc:`ValueError` if the context was created differently.
+
+        Operators given a context call this with their own arguments, since
+        the states and gradients of a context created for a different state,
+        boundaries, time, or communication would silently be wrong. *state*
+        and the boundary objects must be the same objects that the context
+        was created with. A *quadrature_tag* of *None* denotes the base
+        discretization. *gradient_numerical_flux_func* is only checked if
+        given.
+        """
+        def is_same_time(other_time):
+            if other_time is self._time:
+                return True
+            if (np.isscalar(other_time) and np.isscalar(self._time)):
+                return other_time == self._time
+            return False
+
+        if quadrature_tag is None:
+            quadrature_tag = DISCR_TAG_BASE
+
+        boundaries = normalize_boundaries(boundaries)
+        mismatched = [
+            name for name, is_consistent in [
+                ("state", state is self.state),
+                ("boundaries", (
+                    boundaries.keys() == self._boundaries.keys()
+                    and all(bdry is self._boundaries[bdtag]
+                            for bdtag, bdry in boundaries.items()))),
+                ("time", is_same_time(time)),
+                ("quadrature_tag", quadrature_tag == self.quadrature_tag),
+                ("dd", dd == self.dd),
+                ("comm_tag", comm_tag == self.comm_tag),
+                ("gradient_numerical_flux_func", (
+                    gradient_numerical_flux_func is None
+                    or gradient_numerical_flux_func
+                    is self._gradient_numerical_flux_func))]
+            if not is_consistent]
+
+        if mismatched:
+            raise ValueError(
+                "operator_context was created with different "
+                f"{', '.join(mismatched)} than given to the operator.")
+
+    def _gradient_kwargs(self):
+        return dict(
+            time=self._time,
+            numerical_flux_func=self._gradient_numerical_flux_func,
+            quadrature_tag=self.quadrature_tag, dd=self.dd,
+            operator_states_quad=self.operator_states_quad,
+            comm_tag=self.comm_tag)
+
+    def _interior_pairs_on_quad(self, u, comm_tag):
+        return [
+            # Get the interior trace pairs onto the surface quadrature
+            # discretization (if any)
+            tracepair_with_discr_tag(self._dcoll, self.quadrature_tag, tpair)
+            for tpair in interior_trace_pairs(
+                self._dcoll, u, volume_dd=self.dd, comm_tag=comm_tag)]
+
+    @property
+    def grad_cv(self):
+        """Return the gradient of the fluid conserved quantities."""
+        if self._grad_cv is None:
+            self._grad_cv = grad_cv_operator(
+                self._dcoll, self._gas_model, self._boundaries, self.state,
+                **self._gradient_kwargs())
+        return self._grad_cv
+
+    @property
+    def grad_t(self):
+        """Return the gradient of the fluid temperature."""
+        if self._grad_t is None:
+            self._grad_t = grad_t_operator(
+                self._dcoll, self._gas_model, self._boundaries, self.state,
+                **self._gradient_kwargs())
+        return self._grad_t
+
+    @property
+    def grad_cv_interior_pairs(self):
+        """Return the interior face trace pairs of :attr:`grad_cv`.
+
+        The trace pairs live on the face quadrature discretization.
+        """
+        if self._grad_cv_interior_pairs is None:
+            self._grad_cv_interior_pairs = self._interior_pairs_on_quad(
+                self.grad_cv, (_NSGradCVTag, self.comm_tag))
+        return self._grad_cv_interior_pairs
+
+    @property
+    def grad_t_interior_pairs(self):
+        """Return the interior face trace pairs of :attr:`grad_t`.
+
+        The trace pairs live on the face quadrature discretization.
+        """
+        if self._grad_t_interior_pairs is None:
+            self._grad_t_interior_pairs = self._interior_pairs_on_quad(
+                self.grad_t, (_NSGradTemperatureTag, self.comm_tag))
+        return self._grad_t_interior_pairs
+
+
 def ns_operator(dcoll, gas_model, state, boundaries, *, time=0.0,
                 inviscid_fluid_operator=None,
                 inviscid_numerical_flux_func=inviscid_facial_flux_rusanov,
@@ -352,11 +605,9 @@ def ns_operator(dcoll, gas_model, state, boundaries, *, time=0.0,
                 viscous_numerical_flux_func=viscous_facial_flux_central,
                 return_gradients=False, quadrature_tag=DISCR_TAG_BASE,
                 dd=DD_VOLUME_ALL, comm_tag=None, limiter_func=None,
-                # Added to avoid repeated computation
-                # FIXME: See if there's a better way to do this
                 operator_states_quad=None, use_esdg=False,
                 grad_cv=None, grad_t=None, inviscid_terms_on=True,
-                entropy_conserving_flux_func=None):
+                entropy_conserving_flux_func=None, operator_context=None):
     r"""Compute RHS of the Navier-Stokes equations.
 
     Parameters
@@ -429,6 +680,15 @@ def ns_operator(dcoll, gas_model, state, boundaries, *, time=0.0,
         Optional boolean to en/disable inviscid terms in this operator.
         Defaults to ON (True).
 
+    operator_context: :class:`FluidOperatorContext`
+        Optional context providing the quadrature states, the gradients and
+        their trace pairs, to share them with other operators of the RHS.
+        Must be created for the same *state*, *boundaries*, *quadrature_tag*,
+        *dd*, *comm_tag* and *gradient_numerical_flux_func*, and replaces
+        *operator_states_quad*, *grad_cv*, and *grad_t*. The context's states
+        are used as they are, so *limiter_func* must not be given; pass it to
+        the context instead.
+
     Returns
     -------
     :class:`mirgecom.fluid.ConservedVars`
@@ -465,68 +725,35 @@ def ns_operator(dcoll, gas_model, state, boundaries, *, time=0.0,
     #
     # Note: these states will live on the quadrature domain if one is given,
     # otherwise they stay on the interpolatory/base domain.
-    if operator_states_quad is None:
-        if state.is_mixture and limiter_func is None:
-            warn("Mixtures often require species limiting, and a non-limited "
-                 "state is being created for this operator. For mixtures, "
-                 "one should pass the operator_states_quad argument with "
-                 "limited states or provide a limiter_func to this operator.")
-        operator_states_quad = make_operator_fluid_states(
-            dcoll, state, gas_model, boundaries, quadrature_tag,
-            limiter_func=limiter_func, dd=dd_vol, comm_tag=comm_tag)
-
+    #
+    # The gradients of CV and temperature, and their interior face trace pairs
+    # (communicated and put on the quadrature domain) are computed by the
+    # context on first use, unless given.
+    if operator_context is None:
+        operator_context = FluidOperatorContext(
+            dcoll, gas_model, state, boundaries, time=time,
+            gradient_numerical_flux_func=gradient_numerical_flux_func,
+            quadrature_tag=quadrature_tag, dd=dd_vol, comm_tag=comm_tag,
+            limiter_func=limiter_func, operator_states_quad=operator_states_quad,
+            grad_cv=grad_cv, grad_t=grad_t)
+    elif (operator_states_quad is not None or grad_cv is not None
+            or grad_t is not None or limiter_func is not None):
+        raise ValueError("operator_states_quad, grad_cv, grad_t and limiter_func "
+                         "must not be given together with operator_context.")
+    else:
+        operator_context.check_consistent(
+            state, boundaries, time=time, quadrature_tag=quadrature_tag,
+            dd=dd_vol, comm_tag=comm_tag,
+            gradient_numerical_flux_func=gradient_numerical_flux_func)
+
+    operator_states_quad = operator_context.operator_states_quad
     vol_state_quad, inter_elem_bnd_states_quad, domain_bnd_states_quad = \
         operator_states_quad
 
-    # {{{ Local utilities
-
-    # transfer trace pairs to quad grid, update pair dd
-    interp_to_surf_quad = partial(tracepair_with_discr_tag, dcoll, quadrature_tag)
-
-    # }}}
-
-    # {{{ === Compute grad(CV) ===
-
-    if grad_cv is None:
-        grad_cv = grad_cv_operator(
-            dcoll, gas_model, boundaries, state, time=time,
-            numerical_flux_func=gradient_numerical_flux_func,
-            quadrature_tag=quadrature_tag, dd=dd_vol,
-            operator_states_quad=operator_states_quad, comm_tag=comm_tag,
-            use_esdg=use_esdg, limiter_func=limiter_func)
-
-    # Communicate grad(CV) and put it on the quadrature domain
-    grad_cv_interior_pairs = [
-        # Get the interior trace pairs onto the surface quadrature
-        # discretization (if any)
-        interp_to_surf_quad(tpair=tpair)
-        for tpair in interior_trace_pairs(
-            dcoll, grad_cv, volume_dd=dd_vol, comm_tag=(_NSGradCVTag, comm_tag))
-    ]
-
-    # }}} Compute grad(CV)
-
-    # {{{ === Compute grad(temperature) ===
-
-    if grad_t is None:
-        grad_t = grad_t_operator(
-            dcoll, gas_model, boundaries, state, time=time,
-            numerical_flux_func=gradient_numerical_flux_func,
-            quadrature_tag=quadrature_tag, dd=dd_vol,
-            operator_states_quad=operator_states_quad, comm_tag=comm_tag,
-            use_esdg=use_esdg, limiter_func=limiter_func)
-
-    # Create the interior face trace pairs, perform MPI exchange, interp to quad
-    grad_t_interior_pairs = [
-        # Get the interior trace pairs onto the surface quadrature
-        # discretization (if any)
-        interp_to_surf_quad(tpair=tpair)
-        for tpair in interior_trace_pairs(
-            dcoll, grad_t, volume_dd=dd_vol,
-            comm_tag=(_NSGradTemperatureTag, comm_tag))
-    ]
-
-    # }}} compute grad(temperature)
+    grad_cv = operator_context.grad_cv
+    grad_cv_interior_pairs = operator_context.grad_cv_interior_pairs
+    grad_t = operator_context.grad_t
+    grad_t_interior_pairs = operator_context.grad_t_interior_pairs
 
     # {{{ === Navier-Stokes RHS ===
 
@@ -81,6 +81,8 @@ class PyOpenCLProfilingArrayContext(PyOpenCLArrayContext):
     .. automethod:: call_loopy
     .. automethod:: get_profiling_data_for_kernel
     .. automethod:: reset_profiling_data_for_kernel
+    .. automethod:: get_total_kernel_time
+    .. automethod:: reset_profiling_data
 
     Inherits from :class:`arraycontext.PyOpenCLArrayContext`.
 
@@ -213,6 +215,22 @@ class PyOpenCLProfilingArrayContext(PyOpenCLArrayContext):
         """Reset profiling data for kernel `kernel_name`."""
         self.profile_results.pop(kernel_name, None)
 
+    def get_total_kernel_time(self) -> float:
+        """Return the total execution time (in seconds) of all profiled kernels.
+
+        Waits for the completion of all kernels launched so far.
+        """
+        self._wait_and_transfer_profile_events()
+        return 1e-9*sum(
+            r.time
+            for knl_results in self.profile_results.values()
+            for r in knl_results)
+
+    def reset_profiling_data(self) -> None:
+        """Reset profiling data for all kernels, including pending ones."""
+        self._wait_and_transfer_profile_events()
+        self.profile_results.clear()
+
     def tabulate_profiling_data(self) -> pytools.Table:
         """Return a :class:`pytools.Table` with the profiling results."""
         self._wait_and_transfer_profile_events()
@@ -2,6 +2,10 @@
 
 .. autofunction:: read_restart_data
 .. autofunction:: write_restart_file
+.. autofunction:: is_binary_restart_file
+.. autoclass:: AsyncRestartWriter
+.. autoclass:: DeltaRestartWriter
+.. autofunction:: read_repartitioned_restart_data
 """
 
 __copyright__ = """
@@ -29,18 +33,153 @@ THE SOFTWARE.
 """
 
 import pickle
-from meshmode.dof_array import array_context_for_pickling
+from dataclasses import dataclass
+
+import numpy as np
+from meshmode.dof_array import DOFArray, array_context_for_pickling
+
+
+# Binary restart files begin with this signature, followed by a fixed-size
+# header of three little-endian uint64s, the first of which is the format
+# version.
+#
+# Version 1: (version, number of raw buffers, size of the pickled metadata),
+# then the buffer sizes, the metadata, and finally the raw buffers.
+#
+# Version 2 (written by DeltaRestartWriter): (version, size of the pickled
+# buffer table, size of the pickled metadata), then the buffer table, the
+# metadata, and finally the encoded buffers.
+#
+# In both versions, each buffer starts on a *_BINARY_ALIGNMENT*-byte boundary.
+_BINARY_MAGIC = b"MIRGERST"
+_BINARY_VERSION = 1
+_BINARY_DELTA_VERSION = 2
+_BINARY_ALIGNMENT = 64
+
+# Buffer encodings used in version 2 binary restart files
+_ENCODING_RAW = 0
+_ENCODING_COMPRESSED = 1
+_ENCODING_XOR_DELTA = 2
+_ENCODING_QUANTIZED_DELTA = 3
+
+
+def _aligned(nbytes):
+    return -(-nbytes // _BINARY_ALIGNMENT) * _BINARY_ALIGNMENT
+
+
+def _write_padding(f):
+    pos = f.tell()
+    f.write(b"\0" * (_aligned(pos) - pos))
+
+
+def is_binary_restart_file(filename):
+    """Return *True* if *filename* was written with ``binary=True``."""
+    with open(filename, "rb") as f:
+        return f.read(len(_BINARY_MAGIC)) == _BINARY_MAGIC
+
+
+def _serialize_binary(restart_data):
+    """Pickle *restart_data*, keeping its array data out-of-band.
+
+    The restart data is pickled using protocol 5, which hands every contiguous
+    :class:`numpy.ndarray` (including the host copies of the
+    :class:`~meshmode.dof_array.DOFArray` data) to us as a raw buffer instead
+    of copying it into the pickle stream.
+
+    Returns the pickled metadata and the list of raw buffers.
+    """
+    buffers = []
+    metadata = pickle.dumps(restart_data, protocol=5,
+                            buffer_callback=buffers.append)
+    return metadata, [buf.raw() for buf in buffers]
+
+
+def _write_binary(f, metadata, raw_buffers):
+    """Write the output of :func:`_serialize_binary` to *f*."""
+    header = np.array(
+        [_BINARY_VERSION, len(raw_buffers), len(metadata)]
+        + [buf.nbytes for buf in raw_buffers], dtype="<u8")
+
+    f.write(_BINARY_MAGIC)
+    f.write(header.tobytes())
+    f.write(metadata)
+    for buf in raw_buffers:
+        _write_padding(f)
+        f.write(buf)
+
+
+def _read_aligned_buffer(f, nbytes):
+    f.seek(_aligned(f.tell()))
+    buf = bytearray(int(nbytes))
+    if f.readinto(buf) != nbytes:
+        raise ValueError("Truncated binary restart file.")
+    return buf
+
+
+def _read_binary(f, filename):
+    """Read the metadata and decoded buffers of the binary restart file *f*."""
+    if f.read(len(_BINARY_MAGIC)) != _BINARY_MAGIC:
+        raise ValueError("Not a binary restart file.")
+
+    version, nbytes_1, nbytes_2 = np.frombuffer(f.read(3*8), dtype="<u8")
+
+    if version == _BINARY_VERSION:
+        buffer_nbytes = np.frombuffer(f.read(int(nbytes_1)*8), dtype="<u8")
+        metadata = f.read(int(nbytes_2))
+        buffers = [_read_aligned_buffer(f, nbytes) for nbytes in buffer_nbytes]
+
+    elif version == _BINARY_DELTA_VERSION:
+        table = pickle.loads(f.read(int(nbytes_1)))
+        metadata = f.read(int(nbytes_2))
+        stored_buffers = [_read_aligned_buffer(f, stored_nbytes)
+                          for _, stored_nbytes, _ in table["buffers"]]
+
+        ref_buffers = None
+        if table["reference"] is not None:
+            import os
+            ref_filename = os.path.join(os.path.dirname(filename),
+                                        table["reference"])
+            with open(ref_filename, "rb") as ref_f:
+                _, ref_buffers = _read_binary(ref_f, ref_filename)
+
+        _, decompress = _get_codec(table["codec"])
+        buffers = [
+            _decode_buffer(encoding, stored_buf, dtype, decompress,
+                           ref_buffers[ibuf] if ref_buffers is not None else None,
+                           table["tolerance"])
+            for ibuf, ((encoding, _, dtype), stored_buf)
+            in enumerate(zip(table["buffers"], stored_buffers))]
+
+    else:
+        raise ValueError(f"Unsupported binary restart file version {version}.")
+
+    return metadata, buffers
+
+
+def _load_binary(f, filename):
+    """Read restart data from the binary restart file *f*."""
+    metadata, buffers = _read_binary(f, filename)
+    return pickle.loads(metadata, buffers=buffers)
 
 
 def read_restart_data(actx, filename):
-    """Read the raw restart data dictionary from the given pickle restart file."""
+    """Read the raw restart data dictionary from the given restart file.
+
+    Both pickle restart files and binary restart files (see
+    :func:`write_restart_file`) are supported; the format is detected
+    automatically.
+    """
     with array_context_for_pickling(actx):
         with open(filename, "rb") as f:
+            if f.read(len(_BINARY_MAGIC)) == _BINARY_MAGIC:
+                f.seek(0)
+                return _load_binary(f, filename)
+            f.seek(0)
             return pickle.load(f)
 
 
-def write_restart_file(actx, restart_data, filename, comm=None):
-    """Pickle the simulation data into a file for use in restarting."""
+def _make_restart_dir(filename, comm=None):
+    """Create the directory for *filename* on rank 0 of *comm*."""
     rank = 0
     if comm:
         rank = comm.Get_rank()
@@ -51,6 +190,544 @@ def write_restart_file(actx, restart_data, filename, comm=None):
             os.makedirs(rst_dir, exist_ok=True)
     if comm:
         comm.barrier()
+
+
+def write_restart_file(actx, restart_data, filename, comm=None, binary=False):
+    """Pickle the simulation data into a file for use in restarting.
+
+    Parameters
+    ----------
+    actx: :class:`arraycontext.ArrayContext`
+        The array context of the :class:`~meshmode.dof_array.DOFArray` data
+        in *restart_data*
+    restart_data: dict
+        The data to be written
+    filename: str
+        The (rank-local) restart file name
+    comm:
+        Optional MPI communicator. If given, this is a collective routine and
+        must be called by all ranks in *comm*.
+    binary: bool
+        If *True*, write a binary restart file in which the array data
+        (:class:`~meshmode.dof_array.DOFArray` group data, mesh arrays, etc.)
+        is stored as contiguous raw buffers following a small pickled metadata
+        header. This avoids copying the array data through the pickle stream
+        and keeps the write bandwidth-bound. Defaults to *False*.
+    """
+    _make_restart_dir(filename, comm)
     with array_context_for_pickling(actx):
         with open(filename, "wb") as f:
-            pickle.dump(restart_data, f)
+            if binary:
+                _write_binary(f, *_serialize_binary(restart_data))
+            else:
+                pickle.dump(restart_data, f)
+
+
+class AsyncRestartWriter:
+    """Write restart files on a background thread.
+
+    :meth:`write_restart_file` takes a host-side snapshot of the restart data
+    (transferring all :class:`~meshmode.dof_array.DOFArray` data off the
+    device) and returns immediately, leaving the actual file write to a
+    background thread so that it overlaps with subsequent time steps. At most
+    *max_pending* snapshots are held in host memory at any time; once that
+    limit is reached, :meth:`write_restart_file` blocks until a pending write
+    completes.
+
+    Errors raised by a background write are re-raised by the next call to
+    :meth:`write_restart_file`, :meth:`flush`, or :meth:`close`.
+
+    The writer can be used as a context manager, which calls :meth:`close`
+    on exit.
+
+    .. note::
+
+        Non-:class:`~meshmode.dof_array.DOFArray` :mod:`numpy` arrays in the
+        restart data (e.g. mesh data) are referenced by the snapshot rather
+        than copied, and must not be modified in-place until :meth:`flush`
+        returns.
+
+    .. automethod:: __init__
+    .. automethod:: write_restart_file
+    .. automethod:: flush
+    .. automethod:: close
+    """
+
+    def __init__(self, max_pending=1):
+        """Start the background writer thread.
+
+        Parameters
+        ----------
+        max_pending: int
+            Maximum number of snapshots waiting to be written. Defaults to 1.
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1.")
+
+        import queue
+        import threading
+
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._run, name="mirgecom-restart-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                filename, metadata, raw_buffers = item
+                with open(filename, "wb") as f:
+                    if raw_buffers is None:
+                        f.write(metadata)
+                    else:
+                        _write_binary(f, metadata, raw_buffers)
+            except Exception as e:
+                if self._error is None:
+                    self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_pending_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def write_restart_file(self, actx, restart_data, filename, comm=None,
+                           binary=False):
+        """Snapshot *restart_data* and queue it to be written to *filename*.
+
+        Takes the same arguments as :func:`mirgecom.restart.write_restart_file`.
+        If *comm* is given, this is a collective routine and must be called by
+        all ranks in *comm*.
+        """
+        self._raise_pending_error()
+        if self._thread is None:
+            raise RuntimeError("Cannot write to a closed AsyncRestartWriter.")
+
+        _make_restart_dir(filename, comm)
+        with array_context_for_pickling(actx):
+            if binary:
+                metadata, raw_buffers = _serialize_binary(restart_data)
+            else:
+                metadata, raw_buffers = pickle.dumps(restart_data), None
+
+        self._queue.put((filename, metadata, raw_buffers))
+
+    def flush(self):
+        """Block until all queued restart files have been written."""
+        self._queue.join()
+        self._raise_pending_error()
+
+    def close(self):
+        """Write all queued restart files and stop the background thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._raise_pending_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _get_codec(name):
+    """Return the *(compress, decompress)* functions of the codec *name*."""
+    if name == "zlib":
+        import zlib
+        from functools import partial
+        return partial(zlib.compress, level=1), zlib.decompress
+    if name == "zstd":
+        import zstandard  # pylint: disable=import-error
+        return (zstandard.ZstdCompressor().compress,
+                zstandard.ZstdDecompressor().decompress)
+    raise ValueError(f"Unknown codec '{name}'.")
+
+
+def _buffer_dtype(buf):
+    """Return the :class:`numpy.dtype` of the pickle buffer *buf*, if any."""
+    try:
+        return np.dtype(memoryview(buf).format)
+    except TypeError:
+        return None
+
+
+def _xor_buffers(buf, ref_buf):
+    view_dtype = np.uint64 if len(buf) % 8 == 0 else np.uint8
+    return np.bitwise_xor(np.frombuffer(buf, dtype=view_dtype),
+                          np.frombuffer(ref_buf, dtype=view_dtype))
+
+
+def _encode_buffer(buf, dtype, compress, ref_buf, tolerance):
+    """Return the encoding and the encoded data of the raw buffer *buf*."""
+    if ref_buf is None or ref_buf.nbytes != buf.nbytes:
+        return _ENCODING_COMPRESSED, compress(buf)
+
+    if tolerance is not None and dtype is not None and dtype.kind == "f":
+        with np.errstate(all="ignore"):
+            quantized = np.rint(
+                (np.frombuffer(buf, dtype=dtype).astype(np.float64)
+                 - np.frombuffer(ref_buf, dtype=dtype))
+                / (2*tolerance))
+        if np.all(np.abs(quantized) < 2**62):
+            return _ENCODING_QUANTIZED_DELTA, compress(quantized.astype(np.int64))
+
+    return _ENCODING_XOR_DELTA, compress(_xor_buffers(buf, ref_buf))
+
+
+def _decode_buffer(encoding, stored_buf, dtype, decompress, ref_buf, tolerance):
+    """Invert :func:`_encode_buffer`."""
+    if encoding == _ENCODING_RAW:
+        return stored_buf
+    if encoding == _ENCODING_COMPRESSED:
+        return bytearray(decompress(stored_buf))
+
+    if ref_buf is None:
+        raise ValueError("Missing reference data for delta-encoded restart data.")
+
+    if encoding == _ENCODING_XOR_DELTA:
+        return _xor_buffers(decompress(stored_buf), ref_buf)
+    if encoding == _ENCODING_QUANTIZED_DELTA:
+        dtype = np.dtype(dtype)
+        quantized = np.frombuffer(decompress(stored_buf), dtype=np.int64)
+        return (np.frombuffer(ref_buf, dtype=dtype)
+                + quantized*(2*tolerance)).astype(dtype)
+
+    raise ValueError(f"Unknown restart buffer encoding {encoding}.")
+
+
+class DeltaRestartWriter:
+    """Write compressed full and incremental (delta) restart files.
+
+    Every *full_interval*-th call to :meth:`write_restart_file` (starting with
+    the first) writes a *full* restart file in which all array data is
+    compressed losslessly. The calls in between write *delta* restart files,
+    in which each array is stored as its compressed difference to the same
+    array in the most recent full restart file:
+
+    - By default (*tolerance* is *None*), the delta is the bitwise XOR of the
+      two arrays, which is lossless and compresses well since unchanged or
+      slowly-varying values share their leading bits.
+    - If *tolerance* is given, floating point arrays are instead stored as
+      their difference to the full restart data, quantized in steps of
+      2 *tolerance*, so that the restored values differ from the written
+      ones by at most *tolerance* (plus floating point roundoff). Non-floating
+      point arrays are still stored losslessly.
+
+    The written files are binary restart files which can be read with
+    :func:`read_restart_data`. Reading a delta restart file additionally
+    reads the full restart file it refers to, which must be kept alongside it
+    (at the same relative location).
+
+    Each rank must use its own writer, which holds a reference to the array
+    data of the most recent full restart file in host memory.
+
+    .. automethod:: __init__
+    .. automethod:: write_restart_file
+    """
+
+    def __init__(self, full_interval=10, codec="zlib", tolerance=None):
+        """Create the writer.
+
+        Parameters
+        ----------
+        full_interval: int
+            Number of restart files written per full restart file
+        codec: str
+            The compression codec; either ``"zlib"`` (default), or ``"zstd"``,
+            which requires the :mod:`zstandard` package.
+        tolerance: float
+            Optional absolute error tolerance for lossy delta restart files
+        """
+        if full_interval < 1:
+            raise ValueError("full_interval must be at least 1.")
+        if tolerance is not None and tolerance <= 0:
+            raise ValueError("tolerance must be positive.")
+
+        self.full_interval = full_interval
+        self.codec = codec
+        self.tolerance = tolerance
+
+        self._compress, _ = _get_codec(codec)
+        self._nwritten = 0
+        self._ref_filename = None
+        self._ref_buffers = None
+
+    def write_restart_file(self, actx, restart_data, filename, comm=None):
+        """Write *restart_data* to *filename* as a full or delta restart file.
+
+        Takes the same arguments as :func:`write_restart_file`. If *comm* is
+        given, this is a collective routine and must be called by all ranks in
+        *comm*.
+        """
+        import os
+
+        _make_restart_dir(filename, comm)
+
+        buffers = []
+        with array_context_for_pickling(actx):
+            metadata = pickle.dumps(restart_data, protocol=5,
+                                    buffer_callback=buffers.append)
+        dtypes = [_buffer_dtype(buf) for buf in buffers]
+        raw_buffers = [buf.raw() for buf in buffers]
+
+        is_full = self._nwritten % self.full_interval == 0
+        self._nwritten += 1
+
+        if is_full:
+            reference = None
+            ref_buffers = [None]*len(raw_buffers)
+        else:
+            reference = os.path.relpath(
+                self._ref_filename, os.path.dirname(filename) or os.curdir)
+            ref_buffers = (
+                self._ref_buffers
+                + [None]*max(0, len(raw_buffers) - len(self._ref_buffers)))
+
+        encoded_buffers = [
+            _encode_buffer(buf, dtype, self._compress, ref_buf, self.tolerance)
+            for buf, dtype, ref_buf in zip(raw_buffers, dtypes, ref_buffers)]
+
+        table = pickle.dumps({
+            "codec": self.codec,
+            "tolerance": self.tolerance,
+            "reference": reference,
+            "buffers": [
+                (encoding, len(stored_buf),
+                 dtype.str if dtype is not None else None)
+                for (encoding, stored_buf), dtype
+                in zip(encoded_buffers, dtypes)],
+            })
+
+        with open(filename, "wb") as f:
+            f.write(_BINARY_MAGIC)
+            f.write(np.array([_BINARY_DELTA_VERSION, len(table), len(metadata)],
+                             dtype="<u8").tobytes())
+            f.write(table)
+            f.write(metadata)
+            for _, stored_buf in encoded_buffers:
+                _write_padding(f)
+                f.write(stored_buf)
+
+        if is_full:
+            self._ref_filename = filename
+            self._ref_buffers = raw_buffers
+
+
+@dataclass(frozen=True)
+class _DOFArrayPlaceholder:
+    """Stands in for a :class:`~meshmode.dof_array.DOFArray` in restart data."""
+
+    index: int
+    ndofs: int
+    dtype: np.dtype
+
+
+def _map_restart_data(f, data):
+    """Apply *f* to every leaf of the (possibly nested) restart data *data*.
+
+    Recurses into :class:`dict`\\ s, :class:`list`\\ s, :class:`tuple`\\ s and
+    array containers, stopping at :class:`~meshmode.dof_array.DOFArray`\\ s.
+    """
+    if isinstance(data, DOFArray):
+        return f(data)
+    if isinstance(data, dict):
+        return {key: _map_restart_data(f, value) for key, value in data.items()}
+    if type(data) in (list, tuple):
+        return type(data)(_map_restart_data(f, value) for value in data)
+
+    from arraycontext import (
+        serialize_container, deserialize_container, NotAnArrayContainerError)
+    try:
+        iterable = serialize_container(data)
+    except NotAnArrayContainerError:
+        return f(data)
+    return deserialize_container(
+        data, [(key, _map_restart_data(f, value)) for key, value in iterable])
+
+
+def _dof_array_to_elementwise_numpy(actx, ary):
+    """Stack the group arrays of *ary* into a single host array by element."""
+    group_arrays = [actx.to_numpy(grp_ary) for grp_ary in ary]
+    if len({grp_ary.shape[1] for grp_ary in group_arrays}) > 1:
+        raise NotImplementedError("Repartitioning restart data requires all "
+                                  "element groups to have the same number "
+                                  "of DOFs per element.")
+    return np.concatenate(group_arrays)
+
+
+def read_repartitioned_restart_data(actx, filename_pattern, local_mesh,
+                                    global_element_ids, comm=None):
+    """Read restart data written on a different mesh partition.
+
+    Reads a set of rank-local restart files written with any number of ranks
+    and any partitioning of the same global mesh, and redistributes their
+    :class:`~meshmode.dof_array.DOFArray` data onto the current partition.
+    Each restart file must contain the global element numbers of its local
+    elements under the key ``"global_element_ids"`` (as returned by
+    :func:`~mirgecom.simutil.distribute_mesh` with
+    *return_global_element_ids* set).
+
+    All remaining data is taken from the restart file written by rank 0, with
+    the following exceptions: ``"global_element_ids"`` is replaced by
+    *global_element_ids*, and any :class:`meshmode.mesh.Mesh` in the restart
+    data is replaced by *None*, since it describes the old partition.
+
+    Only single-volume restart data is supported.
+
+    .. note::
+        This is a collective routine and must be called by all MPI ranks.
+
+    Parameters
+    ----------
+    actx: :class:`arraycontext.ArrayContext`
+        The array context on which to create the redistributed data
+    filename_pattern: str
+        The restart file name pattern, containing a ``{rank}`` field (e.g.
+        ``"restart_data/run-000100-{rank:04d}.pkl"``). The number of ranks that
+        wrote the restart data is inferred from the files found.
+    local_mesh: :class:`meshmode.mesh.Mesh`
+        The current rank's local mesh
+    global_element_ids: numpy.ndarray
+        The global element numbers of the elements in *local_mesh*
+    comm:
+        Optional MPI communicator over which the data is redistributed
+
+    Returns
+    -------
+    dict
+        The restart data for the elements in *local_mesh*
+    """
+    import os
+    from meshmode.mesh import Mesh
+
+    if comm is not None:
+        from mpi4py.util import pkl5
+        comm = pkl5.Intracomm(comm)
+        rank = comm.Get_rank()
+        nranks = comm.Get_size()
+    else:
+        rank = 0
+        nranks = 1
+
+    global_element_ids = np.asarray(global_element_ids)
+
+    nranks_written = 0
+    if rank == 0:
+        while os.path.exists(filename_pattern.format(rank=nranks_written)):
+            nranks_written += 1
+    if comm is not None:
+        nranks_written = comm.bcast(nranks_written, root=0)
+    if nranks_written == 0:
+        raise FileNotFoundError(
+            f"No restart files found matching '{filename_pattern}'.")
+
+    # Map each global element to the rank that owns it on the current partition
+    if comm is not None:
+        rank_to_global_element_ids = comm.allgather(global_element_ids)
+    else:
+        rank_to_global_element_ids = [global_element_ids]
+    nelements_global = 1 + max(
+        (int(np.max(ids)) for ids in rank_to_global_element_ids if len(ids)),
+        default=-1)
+    element_to_rank = np.full(nelements_global, -1, dtype=np.int32)
+    for irank, ids in enumerate(rank_to_global_element_ids):
+        element_to_rank[ids] = irank
+    del rank_to_global_element_ids
+
+    # Each rank reads a subset of the restart files and sorts their elements by
+    # destination rank
+    skeleton = None
+    rank_to_send_data = [[] for _ in range(nranks)]
+    for irank_written in range(rank, nranks_written, nranks):
+        restart_data = read_restart_data(
+            actx, filename_pattern.format(rank=irank_written))
+
+        if "global_element_ids" not in restart_data:
+            raise ValueError("Restart data must contain 'global_element_ids' "
+                             "to be repartitioned.")
+        written_global_element_ids = np.asarray(
+            restart_data["global_element_ids"])
+
+        leaves = []
+
+        def extract(value):
+            if isinstance(value, DOFArray):
+                leaves.append(_dof_array_to_elementwise_numpy(actx, value))
+                return _DOFArrayPlaceholder(
+                    index=len(leaves) - 1, ndofs=leaves[-1].shape[1],
+                    dtype=leaves[-1].dtype)
+            if isinstance(value, Mesh):
+                return None
+            return value
+
+        restart_skeleton = _map_restart_data(extract, restart_data)
+        if irank_written == 0:
+            skeleton = restart_skeleton
+
+        if np.any(written_global_element_ids >= nelements_global):
+            raise ValueError("Restart data contains elements that are not in "
+                             "the current partition.")
+        dest_ranks = element_to_rank[written_global_element_ids]
+        if np.any(dest_ranks < 0):
+            raise ValueError("Restart data contains elements that are not in "
+                             "the current partition.")
+
+        for dest_rank in np.unique(dest_ranks):
+            sel = np.where(dest_ranks == dest_rank)[0]
+            rank_to_send_data[dest_rank].append(
+                (written_global_element_ids[sel], [leaf[sel] for leaf in leaves]))
+
+    if comm is not None:
+        rank_to_recv_data = comm.alltoall(rank_to_send_data)
+        skeleton = comm.bcast(skeleton, root=0)
+    else:
+        rank_to_recv_data = rank_to_send_data
+    del rank_to_send_data
+
+    placeholders = []
+
+    def collect_placeholders(value):
+        if isinstance(value, _DOFArrayPlaceholder):
+            placeholders.append(value)
+        return value
+
+    _map_restart_data(collect_placeholders, skeleton)
+
+    nelements = len(global_element_ids)
+    local_leaves = [
+        np.empty((nelements, ph.ndofs), dtype=ph.dtype)
+        for ph in sorted(placeholders, key=lambda ph: ph.index)]
+    found = np.zeros(nelements, dtype=bool)
+
+    sorter = np.argsort(global_element_ids)
+    for recv_data in rank_to_recv_data:
+        for recv_global_element_ids, recv_leaves in recv_data:
+            local_element_ids = sorter[np.searchsorted(
+                global_element_ids, recv_global_element_ids, sorter=sorter)]
+            for local_leaf, recv_leaf in zip(local_leaves, recv_leaves):
+                local_leaf[local_element_ids] = recv_leaf
+            found[local_element_ids] = True
+
+    if not np.all(found):
+        raise ValueError("Restart data is missing elements of the current "
+                         "partition.")
+
+    group_starts = np.cumsum([grp.nelements for grp in local_mesh.groups])[:-1]
+
+    def insert(value):
+        if isinstance(value, _DOFArrayPlaceholder):
+            return DOFArray(actx, tuple(
+                actx.from_numpy(np.ascontiguousarray(grp_ary))
+                for grp_ary in np.split(local_leaves[value.index], group_starts)))
+        return value
+
+    restart_data = _map_restart_data(insert, skeleton)
+    restart_data["global_element_ids"] = global_element_ids
+    return restart_data
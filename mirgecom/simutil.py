@@ -5,6 +5,7 @@ General utilities
 
 .. autofunction:: check_step
 .. autofunction:: get_sim_timestep
+.. autoclass:: DeferredTimestepReduction
 .. autofunction:: write_visfile
 .. autofunction:: global_reduce
 .. autofunction:: get_reasonable_memory_pool
@@ -24,6 +25,8 @@ Mesh and element utilities
 
 .. autofunction:: geometric_mesh_partitioner
 .. autofunction:: distribute_mesh
+.. autofunction:: profile_volume_element_costs
+.. autofunction:: get_partition_report
 .. autofunction:: get_number_of_tetrahedron_nodes
 .. autofunction:: get_box_mesh
 
@@ -207,7 +210,7 @@ def check_step(step, interval):
 
 def get_sim_timestep(
         dcoll, state, t, dt, cfl, t_final=0.0, constant_cfl=False,
-        local_dt=False, fluid_dd=DD_VOLUME_ALL):
+        local_dt=False, fluid_dd=DD_VOLUME_ALL, timestep_reduction=None):
     r"""Return the maximum stable timestep for a typical fluid simulation.
 
     This routine returns a constraint-limited timestep size for a fluid
@@ -244,6 +247,10 @@ def get_sim_timestep(
         :class:`~grudge.discretization.DiscretizationCollection` must call this
         routine collectively when using "Constant CFL" mode.
 
+    To avoid the blocking reduction in every step, a
+    :class:`DeferredTimestepReduction` can be passed as *timestep_reduction*,
+    which only reduces every few steps, overlapped with the following step.
+
     Parameters
     ----------
     dcoll: :class:`~grudge.discretization.DiscretizationCollection`
@@ -265,6 +272,9 @@ def get_sim_timestep(
     fluid_dd: grudge.dof_desc.DOFDesc
         the DOF descriptor of the discretization on which *state* lives. Must be a
         volume on the base discretization.
+    timestep_reduction: :class:`DeferredTimestepReduction`
+        Optional object computing the global timestep size in "Constant CFL"
+        mode, instead of a blocking reduction in every call
 
     Returns
     -------
@@ -282,14 +292,114 @@ def get_sim_timestep(
     my_dt = dt
     t_remaining = max(0, t_final - t)
     if constant_cfl:
-        my_dt = state.array_context.to_numpy(
-            cfl * op.nodal_min(
-                dcoll, fluid_dd,
-                get_viscous_timestep(dcoll=dcoll, state=state, dd=fluid_dd)))[()]
+        if timestep_reduction is not None:
+            my_dt = cfl * timestep_reduction.get_timestep(dcoll, state,
+                                                          dd=fluid_dd)
+        else:
+            my_dt = state.array_context.to_numpy(
+                cfl * op.nodal_min(
+                    dcoll, fluid_dd,
+                    get_viscous_timestep(dcoll=dcoll, state=state,
+                                         dd=fluid_dd)))[()]
 
     return min(t_remaining, my_dt)
 
 
+class DeferredTimestepReduction:
+    """Global minimum of the fluid timestep size, reduced every few steps.
+
+    Instead of reducing the timestep size over all ranks in every step, the
+    local minimum of :func:`~mirgecom.viscous.get_viscous_timestep` is only
+    computed every *interval* calls to :meth:`get_timestep`, and its global
+    minimum is computed by a non-blocking allreduce. The result is only
+    collected at the next call, so that the reduction overlaps with the RHS
+    evaluations of the step in between. Between reductions, the most recent
+    global minimum is returned, scaled by *safety_factor* to account for the
+    change of the stable timestep size over the steps for which it is reused.
+    Only the first call blocks on the reduction.
+
+    :meth:`get_timestep` must be called on all ranks once per step.
+
+    .. automethod:: get_timestep
+    """
+
+    def __init__(self, *, interval=10, safety_factor=0.9, comm=None):
+        """Initialize the reduction.
+
+        Parameters
+        ----------
+        interval: int
+            The number of calls between reductions
+        safety_factor: float
+            Factor by which the most recent global minimum is reduced
+        comm:
+            MPI communicator over which to reduce. Defaults to the
+            communicator of the discretization collection.
+        """
+        self.interval = interval
+        self.safety_factor = safety_factor
+        self.comm = comm
+
+        self._ncalls = 0
+        self._global_dt = None
+        self._request = None
+        self._send_buffer = None
+        self._recv_buffer = None
+
+    def _finish_reduction(self):
+        if self._request is not None:
+            self._request.Wait()
+            self._request = None
+        self._global_dt = self._recv_buffer[0]
+
+    def get_timestep(self, dcoll, state, dd=DD_VOLUME_ALL):
+        """Return the global minimum stable timestep size for a CFL of one.
+
+        Parameters
+        ----------
+        dcoll: :class:`~grudge.discretization.DiscretizationCollection`
+            The DG discretization collection to use
+        state: :class:`~mirgecom.gas_model.FluidState`
+            The full fluid conserved and thermal state
+        dd: grudge.dof_desc.DOFDesc
+            the DOF descriptor of the discretization on which *state* lives
+
+        Returns
+        -------
+        float
+            The global minimum timestep size from the most recent completed
+            reduction, scaled by *safety_factor* except in the first call
+        """
+        if self._request is not None:
+            self._finish_reduction()
+
+        is_first_call = self._global_dt is None
+        if self._ncalls % self.interval == 0:
+            actx = state.array_context
+            local_min_dt = actx.to_numpy(
+                op.nodal_min_loc(
+                    dcoll, dd,
+                    get_viscous_timestep(dcoll=dcoll, state=state, dd=dd)))
+            # The buffers must stay alive until the reduction has finished
+            self._send_buffer = np.array([local_min_dt], dtype=np.float64)
+            self._recv_buffer = self._send_buffer.copy()
+
+            comm = self.comm if self.comm is not None else dcoll.mpi_communicator
+            if comm is not None:
+                from mpi4py import MPI
+                self._request = comm.Iallreduce(
+                    self._send_buffer, self._recv_buffer, op=MPI.MIN)
+
+            if is_first_call or comm is None:
+                self._finish_reduction()
+
+        self._ncalls += 1
+
+        if is_first_call:
+            return self._global_dt
+        return self.safety_factor*self._global_dt
+
+
 def write_visfile(dcoll, io_fields, visualizer, vizname,
                   step=0, t=0, overwrite=False, vis_timer=None,
                   comm=None):
@@ -545,14 +655,90 @@ class PartitioningError(Exception):
     pass
 
 
+def _get_element_centroids(mesh):
+    """Return the vertex centroids of all elements in *mesh*, shape (dim, nelem)."""
+    return np.concatenate([
+        np.mean(mesh.vertices[:, group.vertex_indices], axis=2)
+        for group in mesh.groups], axis=1)
+
+
+def _partition_along_axes(centroids, weights, nranks_per_axis, bounds,
+                          auto_balance):
+    """Recursively split elements into slabs along successive coordinate axes.
+
+    Splits the elements with the given *centroids* into *nranks_per_axis[0]*
+    slabs along the first axis, then each slab into *nranks_per_axis[1]* slabs
+    along the second axis, and so on. Slabs are either geometrically uniform
+    over *bounds* or, if *auto_balance* is *True*, chosen such that each holds
+    the same total element weight.
+
+    Returns the partition number of each element, with partitions numbered in
+    lexicographic order of the slab indices (first axis slowest).
+    """
+    nslabs = nranks_per_axis[0]
+    x = centroids[0]
+
+    if nslabs == 1:
+        slab = np.zeros(len(x), dtype=int)
+    elif auto_balance:
+        order = np.argsort(x, kind="stable")
+        sorted_weights = weights[order]
+        cumulative_weight = np.cumsum(sorted_weights)
+        total_weight = cumulative_weight[-1] if len(cumulative_weight) else 0
+        slab = np.empty(len(x), dtype=int)
+        if total_weight > 0:
+            # Assign each element to the slab containing its weight midpoint
+            slab[order] = np.minimum(
+                (nslabs * (cumulative_weight - 0.5*sorted_weights)
+                 / total_weight).astype(int),
+                nslabs - 1)
+        else:
+            slab[order] = np.arange(len(x)) * nslabs // max(len(x), 1)
+    else:
+        x_min, x_max = bounds[0]
+        x_interval = x_max - x_min
+        slab = np.clip(((x - x_min) * nslabs / x_interval).astype(int)
+                       if x_interval > 0 else np.zeros(len(x), dtype=int),
+                       0, nslabs - 1)
+
+    if len(nranks_per_axis) == 1:
+        return slab
+
+    nsubparts = int(np.prod(nranks_per_axis[1:]))
+    part = np.empty(len(x), dtype=int)
+    for islab in range(nslabs):
+        slab_elements = np.where(slab == islab)[0]
+        part[slab_elements] = islab*nsubparts + _partition_along_axes(
+            centroids[1:, slab_elements], weights[slab_elements],
+            nranks_per_axis[1:], bounds[1:], auto_balance)
+    return part
+
+
 def geometric_mesh_partitioner(mesh, num_ranks=None, *, nranks_per_axis=None,
                                auto_balance=False, imbalance_tolerance=.01,
-                               debug=False):
-    """Partition a mesh uniformly along the X coordinate axis.
-
-    The intent is to partition the mesh uniformly along user-specified
-    directions. In this current interation, the capability is demonstrated
-    by splitting along the X axis.
+                               debug=False, element_weights=None,
+                               tag_to_elements=None):
+    """Partition a mesh into slabs along the coordinate axes.
+
+    The mesh is split into *nranks_per_axis[0]* slabs along the X axis, each of
+    those is split into *nranks_per_axis[1]* slabs along the Y axis, and so on
+    (a multi-section variant of recursive coordinate bisection).  Elements are
+    assigned to slabs by their vertex centroids.
+
+    Without *auto_balance*, the slab boundaries are spaced uniformly over the
+    mesh's bounding box. With *auto_balance*, the slab boundaries of each
+    level are chosen to give every slab the same total element weight (see
+    *element_weights*), which balances the partitions to within the weight of
+    a single element.
+
+    To use this partitioner with :func:`distribute_mesh`, pass e.g.::
+
+        def partition_generator_func(mesh, tag_to_elements, num_ranks,
+                                     element_weights=None):
+            return geometric_mesh_partitioner(
+                mesh, nranks_per_axis=nranks_per_axis, auto_balance=True,
+                tag_to_elements=tag_to_elements,
+                element_weights=element_weights)
 
     Parameters
     ----------
@@ -564,14 +750,22 @@ def geometric_mesh_partitioner(mesh, num_ranks=None, *, nranks_per_axis=None,
         How many partitions per specified axis.
     auto_balance: bool
         Indicates whether to perform automatic balancing.  If true, the
-        partitioner will try to balance the number of elements over
+        partitioner will try to balance the element weight over
         the partitions.
     imbalance_tolerance: float
         If *auto_balance* is True, this parameter indicates the acceptable
-        relative difference to the average number of elements per partition.
-        It defaults to balance within 1%.
+        relative difference to the average weight per partition.  A warning
+        is issued if it cannot be met.  It defaults to balance within 1%.
     debug: bool
         En/disable debugging/diagnostic print reporting.
+    element_weights: numpy.ndarray
+        Optional per-element cost estimate used for balancing. Defaults to
+        uniform weights.
+    tag_to_elements: dict
+        Optional :class:`dict` mapping volume tags to arrays of element numbers
+        (as used by :func:`distribute_mesh`). If given with *auto_balance*, the
+        elements of each tag are balanced separately, so that every partition
+        receives a balanced share of each volume.
 
     Returns
     -------
@@ -585,275 +779,72 @@ def geometric_mesh_partitioner(mesh, num_ranks=None, *, nranks_per_axis=None,
         num_ranks = num_ranks or 1
         nranks_per_axis = np.ones(mesh_dimension, dtype=np.int32)
         nranks_per_axis[0] = num_ranks
+    nranks_per_axis = np.asarray(nranks_per_axis, dtype=int)
     if len(nranks_per_axis) != mesh_dimension:
         raise ValueError("nranks_per_axis must match mesh dimension.")
-    num_ranks = np.prod(nranks_per_axis)
-    if np.prod(nranks_per_axis[1:]) != 1:
-        raise NotImplementedError("geometric_mesh_partitioner currently only "
-                                "supports partitioning in the X-dimension."
-                                "(only nranks_per_axis[0] should be > 1).")
-    mesh_verts = mesh.vertices
-    mesh_x = mesh_verts[0]
-
-    x_min = np.min(mesh_x)
-    x_max = np.max(mesh_x)
-    x_interval = x_max - x_min
-    part_loc = np.linspace(x_min, x_max, num_ranks+1)
-
-    part_interval = x_interval / nranks_per_axis[0]
-
-    all_elem_group_centroids = []
-    for group in mesh.groups:
-        elem_group_x = mesh_verts[0, group.vertex_indices]
-        elem_group_centroids = np.sum(elem_group_x, axis=1)/elem_group_x.shape[1]
-        all_elem_group_centroids.append(elem_group_centroids)
-    elem_centroids = np.concatenate(all_elem_group_centroids)
-    global_nelements = len(elem_centroids)
-
-    aver_part_nelem = global_nelements / num_ranks
+    if np.any(nranks_per_axis < 1):
+        raise ValueError("nranks_per_axis must be positive.")
+    num_ranks = int(np.prod(nranks_per_axis))
 
-    if debug:
-        print(f"Partitioning {global_nelements} elements in"
-              f" [{x_min},{x_max}]/{num_ranks}")
-        print(f"Average nelem/part: {aver_part_nelem}")
-        print(f"Initial part locs: {part_loc=}")
+    elem_centroids = _get_element_centroids(mesh)
+    global_nelements = elem_centroids.shape[1]
 
-    # Create geometrically even partitions
-    elem_to_rank = ((elem_centroids-x_min) / part_interval).astype(int)
+    if element_weights is None:
+        element_weights = np.ones(global_nelements)
+    element_weights = np.asarray(element_weights, dtype=np.float64)
+    if element_weights.shape != (global_nelements,):
+        raise ValueError("element_weights must have one entry per element.")
 
-    # map partition id to list of elements in that partition
-    part_to_elements = {r: set(np.where(elem_to_rank == r)[0])
-                        for r in range(num_ranks)}
-    # make an array of the geometrically even partition sizes
-    # avoids calling "len" over and over on the element sets
-    nelem_part = [len(part_to_elements[r]) for r in range(num_ranks)]
+    bounds = [(np.min(mesh.vertices[i]), np.max(mesh.vertices[i]))
+              for i in range(mesh_dimension)]
 
     if debug:
-        print(f"Initial: {nelem_part=}")
-
-    # Automatic load-balancing
-    if auto_balance:
-
-        for r in range(num_ranks-1):
-
-            num_elem_needed = aver_part_nelem - nelem_part[r]
-            part_imbalance = np.abs(num_elem_needed) / float(aver_part_nelem)
-
-            if debug:
-                print(f"Processing part({r=})")
-                print(f"{part_loc[r]=}")
-                print(f"{num_elem_needed=}, {part_imbalance=}")
-                print(f"{nelem_part=}")
-
-            niter = 0
-            total_change = 0
-            moved_elements = set()
-
-            adv_part = r + 1
-            while part_imbalance > imbalance_tolerance:
-                # This partition needs to keep changing in size until it meets the
-                # specified imbalance tolerance, or gives up trying
-
-                # seek out the element reservoir
-                while nelem_part[adv_part] == 0:
-                    adv_part = adv_part + 1
-                    if adv_part >= num_ranks:
-                        raise PartitioningError("Ran out of elements to partition.")
-
-                if debug:
-                    print(f"-{nelem_part[r]=}, adv_part({adv_part}),"
-                          f" {nelem_part[adv_part]=}")
-                    print(f"-{part_loc[r+1]=},{part_loc[adv_part+1]=}")
-                    print(f"-{num_elem_needed=},{part_imbalance=}")
-
-                if niter > 100:
-                    raise PartitioningError("Detected too many iterations in"
-                                            " partitioning.")
-
-                # The purpose of the next block is to populate the "moved_elements"
-                # data structure. Then those elements will be moved between the
-                # current partition being processed and the "reservoir,"
-                # *and* to adjust the position of the "right" side of the current
-                # partition boundary.
-                moved_elements = set()
-                num_elements_added = 0
-
-                if num_elem_needed > 0:
-
-                    # Partition is SMALLER than it should be, grab elements from
-                    # the reservoir
-                    if debug:
-                        print(f"-Grabbing elements from reservoir({adv_part})"
-                              f", {nelem_part[adv_part]=}")
-
-                    portion_needed = (float(abs(num_elem_needed))
-                                      / float(nelem_part[adv_part]))
-                    portion_needed = min(portion_needed, 1.0)
-
-                    if debug:
-                        print(f"--Chomping {portion_needed*100}% of"
-                              f" reservoir({adv_part}) [by nelem].")
-
-                    if portion_needed == 1.0:  # Chomp
-                        new_loc = part_loc[adv_part+1]
-                        moved_elements.update(part_to_elements[adv_part])
-
-                    else:  # Bite
-                        # This is the spatial size of the reservoir
-                        reserv_interval = part_loc[adv_part+1] - part_loc[r+1]
-
-                        # Find what portion of the reservoir to grab spatially
-                        # This part is needed because the elements are not
-                        # distributed uniformly in space.
-                        fine_tuned = False
-                        trial_portion_needed = portion_needed
-                        while not fine_tuned:
-                            pos_update = trial_portion_needed*reserv_interval
-                            new_loc = part_loc[r+1] + pos_update
-
-                            moved_elements = set()
-                            num_elem_mv = 0
-                            for e in part_to_elements[adv_part]:
-                                if elem_centroids[e] <= new_loc:
-                                    moved_elements.add(e)
-                                    num_elem_mv = num_elem_mv + 1
-                            if num_elem_mv < num_elem_needed:
-                                fine_tuned = True
-                            else:
-                                ovrsht = (num_elem_mv - num_elem_needed)
-                                rel_ovrsht = ovrsht/float(num_elem_needed)
-                                if rel_ovrsht > 0.8:
-                                    # bisect the space grabbed and try again
-                                    trial_portion_needed = trial_portion_needed/2.0
-                                else:
-                                    fine_tuned = True
-
-                        portion_needed = trial_portion_needed
-                        new_loc = part_loc[r+1] + pos_update
-                        if debug:
-                            print(f"--Tuned: {portion_needed=} [by spatial volume]")
-                            print(f"--Advancing part({r}) by +{pos_update}")
-
-                    num_elements_added = len(moved_elements)
-                    if debug:
-                        print(f"--Adding {num_elements_added} to part({r}).")
-
-                else:
-
-                    # Partition is LARGER than it should be
-                    # Grab the spatial size of the current partition
-                    # to estimate the portion we need to shave off
-                    # assuming uniform element density
-                    part_interval = part_loc[r+1] - part_loc[r]
-                    num_to_move = -num_elem_needed
-                    portion_needed = num_to_move/float(nelem_part[r])
-
-                    if debug:
-                        print(f"--Shaving off {portion_needed*100}% of"
-                              f" partition({r}) [by nelem].")
-
-                    # Tune the shaved portion to account for
-                    # non-uniform element density
-                    fine_tuned = False
-                    while not fine_tuned:
-                        pos_update = portion_needed*part_interval
-                        new_pos = part_loc[r+1] - pos_update
-                        moved_elements = set()
-                        num_elem_mv = 0
-                        for e in part_to_elements[r]:
-                            if elem_centroids[e] > new_pos:
-                                moved_elements.add(e)
-                                num_elem_mv = num_elem_mv + 1
-                        if num_elem_mv < num_to_move:
-                            fine_tuned = True
-                        else:
-                            ovrsht = (num_elem_mv - num_to_move)
-                            rel_ovrsht = ovrsht/float(num_to_move)
-                            if rel_ovrsht > 0.8:
-                                # bisect and try again
-                                portion_needed = portion_needed/2.0
-                            else:
-                                fine_tuned = True
-
-                    # new "right" wall location of shranken part
-                    # and negative num_elements_added for removal
-                    new_loc = new_pos
-                    num_elements_added = -len(moved_elements)
-                    if debug:
-                        print(f"--Reducing partition size by {portion_needed*100}%"
-                              " [by nelem].")
-                        print(f"--Removing {-num_elements_added} from part({r}).")
-
-                # Now "moved_elements", "num_elements_added", and "new_loc"
-                # are computed.  Update the partition, and reservoir.
-                if debug:
-                    print(f"--Number of elements to ADD: {num_elements_added}.")
-
-                if num_elements_added > 0:
-                    part_to_elements[r].update(moved_elements)
-                    part_to_elements[adv_part].difference_update(
-                        moved_elements)
-                    for e in moved_elements:
-                        elem_to_rank[e] = r
-                else:
-                    part_to_elements[r].difference_update(moved_elements)
-                    part_to_elements[adv_part].update(moved_elements)
-                    for e in moved_elements:
-                        elem_to_rank[e] = adv_part
-
-                total_change = total_change + num_elements_added
-                part_loc[r+1] = new_loc
-                if debug:
-                    print(f"--Before: {nelem_part=}")
-                nelem_part[r] = nelem_part[r] + num_elements_added
-                nelem_part[adv_part] = nelem_part[adv_part] - num_elements_added
-                if debug:
-                    print(f"--After: {nelem_part=}")
-
-                # Compute new nelem_needed and part_imbalance
-                num_elem_needed = num_elem_needed - num_elements_added
-                part_imbalance = \
-                    np.abs(num_elem_needed) / float(aver_part_nelem)
-                niter = niter + 1
-
-            # Summarize the total change and state of the partition
-            # and reservoir
-            if debug:
-                print(f"-Part({r}): {total_change=}")
-                print(f"-Part({r=}): {nelem_part[r]=}, {part_imbalance=}")
-                print(f"-Part({adv_part}): {nelem_part[adv_part]=}")
-
-    # Validate the partitioning before returning
-    total_partitioned_elements = sum([len(part_to_elements[r])
-                                      for r in range(num_ranks)])
-    total_nelem_part = sum([nelem_part[r] for r in range(num_ranks)])
+        print(f"Partitioning {global_nelements} elements in {bounds=}"
+              f" into {nranks_per_axis=}")
+
+    # Groups of elements that are balanced separately
+    if tag_to_elements is not None and auto_balance:
+        is_tagged = np.zeros(global_nelements, dtype=bool)
+        element_groups = []
+        for elements in tag_to_elements.values():
+            elements = np.setdiff1d(elements, np.where(is_tagged)[0])
+            is_tagged[elements] = True
+            element_groups.append(elements)
+        element_groups.append(np.where(~is_tagged)[0])
+    else:
+        element_groups = [np.arange(global_nelements)]
 
-    if debug:
-        print("Validating mesh parts.")
+    elem_to_rank = np.empty(global_nelements, dtype=int)
+    for elements in element_groups:
+        if len(elements) == 0:
+            continue
+        elem_to_rank[elements] = _partition_along_axes(
+            elem_centroids[:, elements], element_weights[elements],
+            nranks_per_axis, bounds, auto_balance)
 
-    if total_partitioned_elements != total_nelem_part:
-        raise PartitioningError("Validator: parted element counts dont match")
-    if total_partitioned_elements != global_nelements:
-        raise PartitioningError("Validator: global element counts dont match.")
+    # Validate the partitioning before returning
     if len(elem_to_rank) != global_nelements:
         raise PartitioningError("Validator: elem-to-rank wrong size.")
-    if np.any(nelem_part) <= 0:
-        raise PartitioningError("Validator: empty partitions.")
+    if np.any(elem_to_rank < 0) or np.any(elem_to_rank >= num_ranks):
+        raise PartitioningError("Validator: invalid partition numbers.")
 
-    for e in range(global_nelements):
-        part = elem_to_rank[e]
-        if e not in part_to_elements[part]:
-            raise PartitioningError("Validator: part/element/part map mismatch.")
+    nelem_part = np.bincount(elem_to_rank, minlength=num_ranks)
+    weight_part = np.bincount(elem_to_rank, weights=element_weights,
+                              minlength=num_ranks)
+    aver_part_weight = np.sum(element_weights) / num_ranks
+    part_imbalance = (np.max(np.abs(weight_part - aver_part_weight))
+                      / aver_part_weight if aver_part_weight > 0 else 0)
 
-    part_counts = np.zeros(global_nelements)
-    for part_elements in part_to_elements.values():
-        for element in part_elements:
-            part_counts[element] = part_counts[element] + 1
+    if debug:
+        print(f"Final: {nelem_part=}")
+        print(f"Final: {weight_part=}, {part_imbalance=}")
 
-    if np.any(part_counts > 1):
-        raise PartitioningError("Validator: degenerate elements")
-    if np.any(part_counts < 1):
-        raise PartitioningError("Validator: orphaned elements")
+    from warnings import warn
+    if np.any(nelem_part == 0):
+        warn("geometric_mesh_partitioner produced empty partitions.")
+    if auto_balance and part_imbalance > imbalance_tolerance:
+        warn(f"geometric_mesh_partitioner could not balance the partitions "
+             f"within {imbalance_tolerance=} (achieved {part_imbalance}).")
 
     return elem_to_rank
 
@@ -890,13 +881,310 @@ def generate_and_distribute_mesh(comm, generate_mesh, **kwargs):
     return distribute_mesh(comm, generate_mesh, **kwargs)
 
 
-def distribute_mesh(comm, get_mesh_data, partition_generator_func=None, logmgr=None):
+def _split_mesh_data(mesh, tag_to_elements, volume_to_tags, rank_per_element,
+                     num_ranks, ranks):
+    """Build the local mesh data for each rank in *ranks*.
+
+    Returns a :class:`list` of the local mesh data and a :class:`list` of the
+    local elements' global element numbers, in the order given by *ranks*.
+    See :func:`distribute_mesh` for the format of the local mesh data.
+    """
+    from meshmode.mesh.processing import partition_mesh
+
+    ranks = list(ranks)
+
+    def partition_mesh_parts(part_id_to_elements, return_parts):
+        if len(ranks) == num_ranks:
+            return partition_mesh(mesh, part_id_to_elements)
+        return partition_mesh(mesh, part_id_to_elements, return_parts=return_parts)
+
+    if tag_to_elements is None:
+        rank_to_elements = {
+            rank: np.where(rank_per_element == rank)[0]
+            for rank in range(num_ranks)}
+
+        rank_to_mesh_data_dict = partition_mesh_parts(rank_to_elements, ranks)
+
+        rank_to_mesh_data = [
+            rank_to_mesh_data_dict[rank]
+            for rank in ranks]
+
+        rank_to_global_element_ids = [
+            rank_to_elements[rank]
+            for rank in ranks]
+
+    else:
+        tag_to_volume = {
+            tag: vol
+            for vol, tags in volume_to_tags.items()
+            for tag in tags}
+
+        volumes = list(volume_to_tags.keys())
+
+        volume_index_per_element = np.full(mesh.nelements, -1, dtype=int)
+        for tag, elements in tag_to_elements.items():
+            volume_index_per_element[elements] = volumes.index(
+                tag_to_volume[tag])
+
+        if np.any(volume_index_per_element < 0):
+            raise ValueError("Missing volume specification "
+                             "for some elements.")
+
+        part_id_to_elements = {
+            PartID(volumes[vol_idx], rank):
+            np.where(
+                (volume_index_per_element == vol_idx)
+                & (rank_per_element == rank))[0]
+            for vol_idx in range(len(volumes))
+            for rank in range(num_ranks)}
+
+        # TODO: Add a public meshmode function to accomplish this? So we're
+        # not depending on meshmode internals
+        part_id_to_part_index = {
+            part_id: part_index
+            for part_index, part_id in enumerate(part_id_to_elements.keys())}
+        from meshmode.mesh.processing import \
+            _compute_global_elem_to_part_elem
+        global_elem_to_part_elem = _compute_global_elem_to_part_elem(
+            mesh.nelements, part_id_to_elements, part_id_to_part_index,
+            mesh.element_id_dtype)
+
+        tag_to_global_to_part = {
+            tag: global_elem_to_part_elem[elements, :]
+            for tag, elements in tag_to_elements.items()}
+
+        return_parts = [PartID(vol, rank) for rank in ranks for vol in volumes]
+
+        part_id_to_tag_to_elements = {}
+        for part_id in return_parts:
+            part_idx = part_id_to_part_index[part_id]
+            part_tag_to_elements = {}
+            for tag, global_to_part in tag_to_global_to_part.items():
+                part_tag_to_elements[tag] = global_to_part[
+                    global_to_part[:, 0] == part_idx, 1]
+            part_id_to_tag_to_elements[part_id] = part_tag_to_elements
+
+        part_id_to_mesh = partition_mesh_parts(part_id_to_elements, return_parts)
+
+        rank_to_mesh_data = [
+            {
+                vol: (
+                    part_id_to_mesh[PartID(vol, rank)],
+                    part_id_to_tag_to_elements[PartID(vol, rank)])
+                for vol in volumes}
+            for rank in ranks]
+
+        rank_to_global_element_ids = [
+            {
+                vol: part_id_to_elements[PartID(vol, rank)]
+                for vol in volumes}
+            for rank in ranks]
+
+    return rank_to_mesh_data, rank_to_global_element_ids
+
+
+def _hash_partition_cache_key_item(item):
+    """Return a :class:`str` identifying *item* for the partition cache key.
+
+    Names of existing files are identified by the hash of the file contents,
+    arrays by the hash of their data, and containers by their items.
+    """
+    import os
+    import hashlib
+    from functools import partial
+
+    if isinstance(item, (str, os.PathLike)) and os.path.isfile(item):
+        file_hash = hashlib.sha256()
+        with open(item, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 24), b""):
+                file_hash.update(chunk)
+        return f"file:{file_hash.hexdigest()}"
+    if isinstance(item, np.ndarray) and item.dtype != object:
+        item = np.ascontiguousarray(item)
+        return "array:" + hashlib.sha256(
+            repr((item.dtype.str, item.shape)).encode()
+            + item.tobytes()).hexdigest()
+    if isinstance(item, (tuple, list, np.ndarray)):
+        return repr(tuple(_hash_partition_cache_key_item(i) for i in item))
+    if isinstance(item, dict):
+        return repr(sorted(
+            (_hash_partition_cache_key_item(key),
+             _hash_partition_cache_key_item(value))
+            for key, value in item.items()))
+    if isinstance(item, partial):
+        return repr((_hash_partition_cache_key_item(item.func),
+                     _hash_partition_cache_key_item(item.args),
+                     _hash_partition_cache_key_item(item.keywords)))
+    if callable(item) and hasattr(item, "__qualname__"):
+        return f"callable:{item.__module__}.{item.__qualname__}"
+    return repr(item)
+
+
+def _get_mesh_data_cache_key(global_data):
+    """Return a :class:`str` identifying the global mesh data."""
+    import hashlib
+    from meshmode.mesh import Mesh
+
+    if isinstance(global_data, Mesh):
+        mesh = global_data
+        tag_to_elements = None
+        volume_to_tags = None
+    else:
+        mesh, tag_to_elements, volume_to_tags = global_data
+
+    mesh_hash = hashlib.sha256()
+
+    def update(item):
+        mesh_hash.update(_hash_partition_cache_key_item(item).encode())
+
+    update(mesh.vertices)
+    for grp in mesh.groups:
+        update((type(grp).__name__, grp.order, grp.vertex_indices, grp.nodes))
+    for fagrp_list in mesh.facial_adjacency_groups:
+        for fagrp in fagrp_list:
+            update((type(fagrp).__name__, getattr(fagrp, "boundary_tag", None),
+                    fagrp.elements, fagrp.element_faces))
+    update(tag_to_elements)
+    update(volume_to_tags)
+
+    return mesh_hash.hexdigest()
+
+
+def _get_partition_cache_path(comm, partition_cache_dir, partition_cache_key, *,
+                              global_data, element_weights,
+                              partition_generator_func):
+    """Return the directory in which the cached partition for *comm* lives.
+
+    The key combines *partition_cache_key*, the element weights, the
+    partitioner, and the number of ranks. If *global_data* is given, the
+    global mesh data (including the volume tags) is part of the key, too.
+    Only rank 0 needs *global_data*.
+    """
+    import os
+    digest = None
+    if comm.Get_rank() == 0:
+        import hashlib
+        digest = hashlib.sha256(repr((
+            _hash_partition_cache_key_item(partition_cache_key),
+            (None if global_data is None
+             else _get_mesh_data_cache_key(global_data)),
+            _hash_partition_cache_key_item(element_weights),
+            _hash_partition_cache_key_item(partition_generator_func),
+            comm.Get_size())).encode()).hexdigest()
+
+    digest = comm.bcast(digest, root=0)
+    return os.path.join(partition_cache_dir, f"{digest}-{comm.Get_size()}")
+
+
+def _get_element_weights(mesh, tag_to_elements, volume_to_tags, element_weights):
+    """Return an array of per-element weights from *element_weights*.
+
+    *element_weights* is either an array with one entry per element of *mesh*
+    or a :class:`dict` mapping volumes in *volume_to_tags* to the cost of one
+    element of that volume.
+    """
+    if not isinstance(element_weights, dict):
+        element_weights = np.asarray(element_weights, dtype=np.float64)
+        if element_weights.shape != (mesh.nelements,):
+            raise ValueError("element_weights must have one entry per element.")
+        return element_weights
+
+    if volume_to_tags is None:
+        raise ValueError("Per-volume element_weights require multi-volume "
+                         "mesh data.")
+
+    weights = np.zeros(mesh.nelements)
+    for vol, cost in element_weights.items():
+        for tag in volume_to_tags[vol]:
+            weights[tag_to_elements[tag]] = cost
+
+    if np.any(weights <= 0):
+        raise ValueError("element_weights must assign a positive weight to "
+                         "every element.")
+
+    return weights
+
+
+def profile_volume_element_costs(actx, volume_to_cost_func, volume_to_nelements,
+                                 *, nrepeats=5, comm=None):
+    """Measure the cost per element of the operators of each volume.
+
+    For each volume, call the corresponding function (e.g. a function
+    evaluating the volume's RHS on the current state) *nrepeats* times after
+    one warm-up call, and divide the total execution time of the profiled
+    kernels by the number of calls and elements. The result can be passed as
+    *element_weights* to :func:`distribute_mesh` to balance the cost, rather
+    than the number, of elements in a subsequent run. The profiling data
+    previously accumulated by *actx* is discarded.
+
+    Parameters
+    ----------
+    actx: :class:`mirgecom.profiling.PyOpenCLProfilingArrayContext`
+        The profiling array context the functions execute in
+    volume_to_cost_func: dict
+        A :class:`dict` mapping volumes to callables of zero arguments
+    volume_to_nelements: dict
+        A :class:`dict` mapping volumes to the number of local elements
+    nrepeats: int
+        The number of timed calls of each function
+    comm:
+        Optional MPI communicator over which to average the costs
+
+    Returns
+    -------
+    volume_to_cost: dict
+        A :class:`dict` mapping volumes to the time (in seconds) spent per
+        element in one call of the volume's function
+    """
+    from mirgecom.profiling import PyOpenCLProfilingArrayContext
+    if not isinstance(actx, PyOpenCLProfilingArrayContext):
+        raise TypeError("profile_volume_element_costs requires a "
+                        "PyOpenCLProfilingArrayContext.")
+
+    def pop_kernel_time():
+        time = actx.get_total_kernel_time()
+        actx.reset_profiling_data()
+        return time
+
+    from mirgecom.utils import force_evaluation
+    volume_to_cost = {}
+    for vol, cost_func in volume_to_cost_func.items():
+        force_evaluation(actx, cost_func())
+        pop_kernel_time()
+
+        for _ in range(nrepeats):
+            force_evaluation(actx, cost_func())
+        time = pop_kernel_time()
+        nelements = volume_to_nelements[vol]
+
+        if comm is not None:
+            from mpi4py import MPI
+            time = comm.allreduce(time, op=MPI.SUM)
+            nelements = comm.allreduce(nelements, op=MPI.SUM)
+
+        volume_to_cost[vol] = time / (nrepeats*max(nelements, 1))
+
+    return volume_to_cost
+
+
+def distribute_mesh(comm, get_mesh_data, partition_generator_func=None, logmgr=None,
+                    return_global_element_ids=False, split_on_node_leaders=False,
+                    partition_cache_dir=None, partition_cache_key=None,
+                    element_weights=None):
     r"""Distribute a mesh among all ranks in *comm*.
 
     Retrieve the global mesh data with the user-supplied function *get_mesh_data*,
     partition the mesh, and distribute it to every rank in the provided MPI
     communicator *comm*.
 
+    By default, rank 0 builds the local meshes of all ranks and scatters them.
+    If *split_on_node_leaders* is *True*, rank 0 only computes the partition
+    and broadcasts it, along with the global mesh data, to one leader rank per
+    compute node. Each node leader then builds the local meshes for the ranks on
+    its node in parallel with the other leaders, and scatters them within the
+    node. This avoids serializing the construction of all local meshes on rank 0
+    at the cost of holding a copy of the global mesh on every node leader.
+
     .. note::
         This is a collective routine and must be called by all MPI ranks.
 
@@ -914,7 +1202,42 @@ def distribute_mesh(comm, get_mesh_data, partition_generator_func=None, logmgr=N
     partition_generator_func:
         Optional callable that takes *mesh*, *tag_to_elements*, and *comm*'s size,
         and returns a :class:`numpy.ndarray` indicating to which rank each element
-        belongs.
+        belongs. If *element_weights* is given, it is passed the per-element
+        weights as an additional keyword argument *element_weights*.
+    return_global_element_ids: bool
+        If *True*, additionally return the global element numbers of the local
+        elements. Defaults to *False*.
+    split_on_node_leaders: bool
+        If *True*, build the local meshes on one leader rank per node instead
+        of on rank 0 only. Defaults to *False*.
+    partition_cache_dir: str
+        Optional directory in which to cache the local mesh data. If the cache
+        holds an entry, each rank loads its local mesh data from the cache,
+        and reading, partitioning, splitting and distributing the mesh are
+        skipped. Otherwise, the mesh is distributed as usual and the result is
+        added to the cache. Entries are identified by *partition_cache_key*,
+        *element_weights*, *partition_generator_func* and *comm*'s size. If no
+        *partition_cache_key* is given, rank 0 calls *get_mesh_data* even for
+        cached entries, and the global mesh (vertices, element groups,
+        boundary tags), *tag_to_elements* and *volume_to_tags* identify the
+        entry instead.
+    partition_cache_key:
+        Optional :class:`tuple` (or single item) that identifies the result of
+        *get_mesh_data*, such as the name of the mesh file, and any other data
+        that the partitioning depends on, such as settings used by a custom
+        *partition_generator_func*. *get_mesh_data* is then only called if the
+        cache has no entry for the key. Items that name existing files (as
+        :class:`str` or :class:`os.PathLike`) are identified by the hash of
+        the file contents, arrays by the hash of their data, callables by
+        their qualified names, and all other items by their :func:`repr`.
+    element_weights:
+        Optional estimate of the computational cost of each element, used to
+        balance the cost rather than the number of elements per rank. Either a
+        :class:`numpy.ndarray` with one entry per element of the global mesh,
+        or a :class:`dict` mapping volumes in *volume_to_tags* to the cost of
+        one element of the volume (see :func:`profile_volume_element_costs`).
+        Only used on rank 0. The default partitioner passes the weights to
+        :mod:`pymetis` after scaling them to integers.
 
     Returns
     -------
@@ -925,7 +1248,64 @@ def distribute_mesh(comm, get_mesh_data, partition_generator_func=None, logmgr=N
         tuples of the form *(local_mesh, local_tag_to_elements)*.
     global_nelements: :class:`int`
         The number of elements in the global mesh
+    local_global_element_ids: :class:`numpy.ndarray` or :class:`dict`
+        Only returned if *return_global_element_ids* is *True*. The global
+        element number of each local element. For multiple volumes, a
+        :class:`dict` mapping volume tags to the global element numbers of the
+        volume's local elements.
     """
+    if partition_cache_dir is not None:
+        import os
+        import pickle
+        # Without a key identifying the mesh data, the key hashes the mesh
+        global_data = None
+        if partition_cache_key is None and comm.Get_rank() == 0:
+            global_data = get_mesh_data()
+        cache_path = _get_partition_cache_path(
+            comm, partition_cache_dir, partition_cache_key,
+            global_data=global_data, element_weights=element_weights,
+            partition_generator_func=partition_generator_func)
+        complete_file = os.path.join(cache_path, "complete")
+        rank_cache_file = os.path.join(cache_path,
+                                       f"rank-{comm.Get_rank():06d}.pkl")
+
+        is_cached = comm.bcast(
+            os.path.exists(complete_file) if comm.Get_rank() == 0 else None,
+            root=0)
+
+        if is_cached:
+            del global_data
+            logger.info(f"Loading cached mesh partition from {cache_path}.")
+            with open(rank_cache_file, "rb") as f:
+                local_mesh_data, global_nelements, local_global_element_ids = \
+                    pickle.load(f)
+        else:
+            local_mesh_data, global_nelements, local_global_element_ids = \
+                distribute_mesh(
+                    comm,
+                    get_mesh_data if global_data is None else lambda: global_data,
+                    partition_generator_func=partition_generator_func,
+                    logmgr=logmgr, return_global_element_ids=True,
+                    split_on_node_leaders=split_on_node_leaders,
+                    element_weights=element_weights)
+
+            if comm.Get_rank() == 0:
+                os.makedirs(cache_path, exist_ok=True)
+            comm.barrier()
+            with open(rank_cache_file, "wb") as f:
+                pickle.dump(
+                    (local_mesh_data, global_nelements, local_global_element_ids),
+                    f, protocol=pickle.HIGHEST_PROTOCOL)
+            comm.barrier()
+            if comm.Get_rank() == 0:
+                with open(complete_file, "w") as f:
+                    f.write(f"{comm.Get_size()}\n")
+                logger.info(f"Cached mesh partition in {cache_path}.")
+
+        if return_global_element_ids:
+            return local_mesh_data, global_nelements, local_global_element_ids
+        return local_mesh_data, global_nelements
+
     from mpi4py.util import pkl5
     comm_wrapper = pkl5.Intracomm(comm)
 
@@ -935,17 +1315,34 @@ def distribute_mesh(comm, get_mesh_data, partition_generator_func=None, logmgr=N
     t_mesh_part = IntervalTimer("t_mesh_part", "Time spent partitioning the mesh.")
     t_mesh_split = IntervalTimer("t_mesh_split", "Time spent splitting mesh parts.")
 
+    if logmgr:
+        logmgr.add_quantity(t_mesh_data)
+        logmgr.add_quantity(t_mesh_part)
+        logmgr.add_quantity(t_mesh_split)
+        logmgr.add_quantity(t_mesh_dist)
+
+    from contextlib import nullcontext
+
+    def timed(timer):
+        return timer.get_sub_timer() if logmgr else nullcontext()
+
     if partition_generator_func is None:
-        def partition_generator_func(mesh, tag_to_elements, num_ranks):
+        def partition_generator_func(mesh, tag_to_elements, num_ranks,
+                                     element_weights=None):
             from meshmode.distributed import get_partition_by_pymetis
-            return get_partition_by_pymetis(mesh, num_ranks)
+            if element_weights is None:
+                return get_partition_by_pymetis(mesh, num_ranks)
+            # METIS requires integer vertex weights
+            vwgt = np.maximum(
+                1, np.rint(1000*element_weights/np.max(element_weights)))
+            return get_partition_by_pymetis(
+                mesh, num_ranks, vwgt=vwgt.astype(np.int64).tolist())
 
-    if comm_wrapper.Get_rank() == 0:
-        if logmgr:
-            logmgr.add_quantity(t_mesh_data)
-            with t_mesh_data.get_sub_timer():
-                global_data = get_mesh_data()
-        else:
+    rank = comm_wrapper.Get_rank()
+
+    global_mesh_data = None
+    if rank == 0:
+        with timed(t_mesh_data):
             global_data = get_mesh_data()
 
         from meshmode.mesh import Mesh
@@ -958,114 +1355,74 @@ def distribute_mesh(comm, get_mesh_data, partition_generator_func=None, logmgr=N
         else:
             raise TypeError("Unexpected result from get_mesh_data")
 
-        if logmgr:
-            logmgr.add_quantity(t_mesh_part)
-            with t_mesh_part.get_sub_timer():
-                rank_per_element = partition_generator_func(mesh, tag_to_elements,
-                                                            num_ranks)
-        else:
-            rank_per_element = partition_generator_func(mesh, tag_to_elements,
-                                                        num_ranks)
-
-        def get_rank_to_mesh_data():
-            from meshmode.mesh.processing import partition_mesh
-            if tag_to_elements is None:
-                rank_to_elements = {
-                    rank: np.where(rank_per_element == rank)[0]
-                    for rank in range(num_ranks)}
+        with timed(t_mesh_part):
+            if element_weights is None:
+                rank_per_element = partition_generator_func(
+                    mesh, tag_to_elements, num_ranks)
+            else:
+                rank_per_element = partition_generator_func(
+                    mesh, tag_to_elements, num_ranks,
+                    element_weights=_get_element_weights(
+                        mesh, tag_to_elements, volume_to_tags, element_weights))
 
-                rank_to_mesh_data_dict = partition_mesh(mesh, rank_to_elements)
+        global_mesh_data = (mesh, tag_to_elements, volume_to_tags,
+                            rank_per_element)
 
-                rank_to_mesh_data = [
-                    rank_to_mesh_data_dict[rank]
-                    for rank in range(num_ranks)]
+    if split_on_node_leaders:
+        from mpi4py import MPI
+        node_comm = comm.Split_type(MPI.COMM_TYPE_SHARED, key=rank)
+        is_node_leader = node_comm.Get_rank() == 0
+        # Ordering by *rank* makes rank 0 the root of the leader communicator
+        leader_comm = comm.Split(0 if is_node_leader else MPI.UNDEFINED, key=rank)
+        node_ranks = node_comm.allgather(rank)
+
+        with timed(t_mesh_dist):
+            if is_node_leader:
+                global_mesh_data = pkl5.Intracomm(leader_comm).bcast(
+                    global_mesh_data, root=0)
+                leader_comm.Free()
+
+        if is_node_leader:
+            with timed(t_mesh_split):
+                rank_to_mesh_data, rank_to_global_element_ids = \
+                    _split_mesh_data(*global_mesh_data, num_ranks=num_ranks,
+                                     ranks=node_ranks)
+            global_nelements = global_mesh_data[0].nelements
+            del global_mesh_data
+        else:
+            rank_to_mesh_data = None
+            rank_to_global_element_ids = None
 
-            else:
-                tag_to_volume = {
-                    tag: vol
-                    for vol, tags in volume_to_tags.items()
-                    for tag in tags}
-
-                volumes = list(volume_to_tags.keys())
-
-                volume_index_per_element = np.full(mesh.nelements, -1, dtype=int)
-                for tag, elements in tag_to_elements.items():
-                    volume_index_per_element[elements] = volumes.index(
-                        tag_to_volume[tag])
-
-                if np.any(volume_index_per_element < 0):
-                    raise ValueError("Missing volume specification "
-                                     "for some elements.")
-
-                part_id_to_elements = {
-                    PartID(volumes[vol_idx], rank):
-                    np.where(
-                        (volume_index_per_element == vol_idx)
-                        & (rank_per_element == rank))[0]
-                    for vol_idx in range(len(volumes))
-                    for rank in range(num_ranks)}
-
-                # TODO: Add a public meshmode function to accomplish this? So we're
-                # not depending on meshmode internals
-                part_id_to_part_index = {
-                    part_id: part_index
-                    for part_index, part_id in enumerate(part_id_to_elements.keys())}
-                from meshmode.mesh.processing import \
-                    _compute_global_elem_to_part_elem
-                global_elem_to_part_elem = _compute_global_elem_to_part_elem(
-                    mesh.nelements, part_id_to_elements, part_id_to_part_index,
-                    mesh.element_id_dtype)
-
-                tag_to_global_to_part = {
-                    tag: global_elem_to_part_elem[elements, :]
-                    for tag, elements in tag_to_elements.items()}
-
-                part_id_to_tag_to_elements = {}
-                for part_id in part_id_to_elements.keys():
-                    part_idx = part_id_to_part_index[part_id]
-                    part_tag_to_elements = {}
-                    for tag, global_to_part in tag_to_global_to_part.items():
-                        part_tag_to_elements[tag] = global_to_part[
-                            global_to_part[:, 0] == part_idx, 1]
-                        part_id_to_tag_to_elements[part_id] = part_tag_to_elements
-
-                part_id_to_mesh = partition_mesh(mesh, part_id_to_elements)
-
-                rank_to_mesh_data = [
-                    {
-                        vol: (
-                            part_id_to_mesh[PartID(vol, rank)],
-                            part_id_to_tag_to_elements[PartID(vol, rank)])
-                        for vol in volumes}
-                    for rank in range(num_ranks)]
-
-            return rank_to_mesh_data
-
-        if logmgr:
-            logmgr.add_quantity(t_mesh_split)
-            with t_mesh_split.get_sub_timer():
-                rank_to_mesh_data = get_rank_to_mesh_data()
+        local_comm = pkl5.Intracomm(node_comm)
+    else:
+        if rank == 0:
+            with timed(t_mesh_split):
+                rank_to_mesh_data, rank_to_global_element_ids = \
+                    _split_mesh_data(*global_mesh_data, num_ranks=num_ranks,
+                                     ranks=range(num_ranks))
+            global_nelements = global_mesh_data[0].nelements
+            del global_mesh_data
         else:
-            rank_to_mesh_data = get_rank_to_mesh_data()
+            rank_to_mesh_data = None
+            rank_to_global_element_ids = None
 
-        global_nelements = comm_wrapper.bcast(mesh.nelements, root=0)
+        local_comm = comm_wrapper
 
-        if logmgr:
-            logmgr.add_quantity(t_mesh_dist)
-            with t_mesh_dist.get_sub_timer():
-                local_mesh_data = comm_wrapper.scatter(rank_to_mesh_data, root=0)
-        else:
-            local_mesh_data = comm_wrapper.scatter(rank_to_mesh_data, root=0)
+    global_nelements = comm_wrapper.bcast(
+        global_nelements if rank == 0 else None, root=0)
 
-    else:
-        global_nelements = comm_wrapper.bcast(None, root=0)
+    with timed(t_mesh_dist):
+        local_mesh_data = local_comm.scatter(rank_to_mesh_data, root=0)
 
-        if logmgr:
-            logmgr.add_quantity(t_mesh_dist)
-            with t_mesh_dist.get_sub_timer():
-                local_mesh_data = comm_wrapper.scatter(None, root=0)
-        else:
-            local_mesh_data = comm_wrapper.scatter(None, root=0)
+    if return_global_element_ids:
+        local_global_element_ids = local_comm.scatter(
+            rank_to_global_element_ids, root=0)
+
+    if split_on_node_leaders:
+        node_comm.Free()
+
+    if return_global_element_ids:
+        return local_mesh_data, global_nelements, local_global_element_ids
 
     return local_mesh_data, global_nelements
 
@@ -1194,6 +1551,111 @@ def boundary_report(dcoll, boundaries, outfile_name, *, dd=DD_VOLUME_ALL,
             comm.barrier()
 
 
+def get_partition_report(mesh, rank_per_element, *, order=1, nspecies=0,
+                         viscous=True, num_ranks=None):
+    r"""Estimate the load balance and communication cost of a mesh partition.
+
+    Counts, for each rank, the elements and the element faces shared with
+    other ranks, and estimates the number of bytes each rank sends per RHS
+    evaluation of a (Navier-Stokes) fluid operator. The estimate assumes one
+    exchange of the conserved variables and, if *viscous*, one exchange each
+    of the temperature, the conserved variable gradient and the temperature
+    gradient, all in double precision.
+
+    Parameters
+    ----------
+    mesh: :class:`meshmode.mesh.Mesh`
+        The global (serial) mesh
+    rank_per_element: numpy.ndarray
+        The rank to which each element of *mesh* belongs
+    order: int
+        The polynomial order of the discretization
+    nspecies: int
+        The number of mixture species
+    viscous: bool
+        Whether to include the exchanges of the viscous operator
+    num_ranks: int
+        The number of ranks; defaults to one more than the largest rank in
+        *rank_per_element*
+
+    Returns
+    -------
+    report: dict
+        A :class:`dict` with the per-rank :class:`numpy.ndarray`\ s
+        *nelements*, *nfaces_shared*, *nneighbors* and *nbytes_sent*, and the
+        :class:`float` imbalance metrics *element_imbalance* and
+        *bytes_imbalance* (maximum over mean, minus one).
+    """
+    from math import comb
+    from meshmode.mesh import (
+        InteriorAdjacencyGroup, SimplexElementGroup, TensorProductElementGroup)
+
+    rank_per_element = np.asarray(rank_per_element)
+    if rank_per_element.shape != (mesh.nelements,):
+        raise ValueError("rank_per_element must have one entry per element.")
+    if num_ranks is None:
+        num_ranks = int(np.max(rank_per_element)) + 1
+
+    dim = mesh.dim
+
+    # Number of nodes on each face of each element
+    face_nnodes = np.empty(mesh.nelements, dtype=np.int64)
+    for igrp, grp in enumerate(mesh.groups):
+        if isinstance(grp, SimplexElementGroup):
+            nnodes = comb(order + dim - 1, dim - 1)
+        elif isinstance(grp, TensorProductElementGroup):
+            nnodes = (order + 1)**(dim - 1)
+        else:
+            raise TypeError(f"Unsupported element group type {type(grp)}.")
+        base_element_nr = mesh.base_element_nrs[igrp]
+        face_nnodes[base_element_nr:base_element_nr + grp.nelements] = nnodes
+
+    elements = []
+    neighbors = []
+    for fagrp_list in mesh.facial_adjacency_groups:
+        for fagrp in fagrp_list:
+            if isinstance(fagrp, InteriorAdjacencyGroup):
+                elements.append(
+                    fagrp.elements + mesh.base_element_nrs[fagrp.igroup])
+                neighbors.append(
+                    fagrp.neighbors
+                    + mesh.base_element_nrs[fagrp.ineighbor_group])
+    elements = np.concatenate(elements) if elements else np.empty(0, np.int64)
+    neighbors = np.concatenate(neighbors) if neighbors else np.empty(0, np.int64)
+
+    rank = rank_per_element[elements]
+    neighbor_rank = rank_per_element[neighbors]
+    is_shared = rank != neighbor_rank
+    rank = rank[is_shared]
+    neighbor_rank = neighbor_rank[is_shared]
+
+    nvars = dim + 2 + nspecies
+    nvalues_per_node = nvars
+    if viscous:
+        nvalues_per_node += 1 + dim*nvars + dim
+
+    nelements = np.bincount(rank_per_element, minlength=num_ranks)
+    nfaces_shared = np.bincount(rank, minlength=num_ranks)
+    rank_pairs = np.unique(rank*num_ranks + neighbor_rank)
+    nneighbors = np.bincount(rank_pairs // num_ranks, minlength=num_ranks)
+    nbytes_sent = 8*nvalues_per_node*np.bincount(
+        rank, weights=face_nnodes[elements[is_shared]],
+        minlength=num_ranks).astype(np.int64)
+
+    def imbalance(values):
+        mean = np.mean(values)
+        return float(np.max(values)/mean - 1) if mean > 0 else 0.
+
+    return {
+        "nelements": nelements,
+        "nfaces_shared": nfaces_shared,
+        "nneighbors": nneighbors,
+        "nbytes_sent": nbytes_sent,
+        "element_imbalance": imbalance(nelements),
+        "bytes_imbalance": imbalance(nbytes_sent),
+    }
+
+
 def force_evaluation(actx, expn):
     """Wrap freeze/thaw forcing evaluation of expressions.
 
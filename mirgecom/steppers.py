@@ -2,6 +2,7 @@
 
 .. autofunction:: advance_state
 .. autofunction:: generate_singlerate_leap_advancer
+.. autoclass:: RollbackBuffer
 """
 
 __copyright__ = """
@@ -28,20 +29,168 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+import logging
+from collections import deque
+
 import numpy as np
 from mirgecom.utils import force_evaluation
 from pytools import memoize_in
 from arraycontext import get_container_context_recursively_opt
 
+logger = logging.getLogger(__name__)
+
+
+class RollbackBuffer:
+    """Ring buffer of recent healthy states for recovering from failed steps.
+
+    Every *interval* steps, :func:`advance_state` calls *health_check* on the
+    current state. If the state is healthy, a host-side copy of it is stored,
+    keeping the *nstates* most recent ones. Otherwise, the run is rolled back
+    to the most recent stored state, and the timestep size is reduced by
+    *dt_backoff*. Each further consecutive failure rolls back to the next older
+    stored state, if any. After *max_retries* consecutive failures,
+    :class:`~mirgecom.simutil.SimulationRuntimeError` is raised.
+
+    After each *recovery_saves* consecutive healthy saves, the timestep size
+    is increased again by *dt_recovery*, up to the original one, so that a
+    transient failure does not slow down the remainder of a long run.
+
+    The timestep size reduction is applied on top of the *dt* given to (and
+    returned by) the callbacks, so that it also applies to a *dt* that is
+    recomputed by the *pre_step_callback* from a constant CFL number.
+
+    .. attribute:: dt_factor
+
+        The factor by which the timestep size is currently reduced.
+
+    .. automethod:: save
+    .. automethod:: roll_back
+    """
+
+    def __init__(self, health_check, *, nstates=2, interval=1, dt_backoff=0.5,
+                 max_retries=3, recovery_saves=10, dt_recovery=None):
+        """Initialize the buffer.
+
+        Parameters
+        ----------
+        health_check
+            Function with signature ``health_check(state, step, t, dt)``
+            returning *True* if *state* failed the check. It is called on all
+            ranks and must return the same (e.g. globally reduced) value on
+            each of them.
+        nstates: int
+            The number of healthy states to keep
+        interval: int
+            The number of steps between health checks. Must be a multiple of
+            *steps_per_call* in :func:`advance_state`.
+        dt_backoff: float
+            Factor by which to reduce the timestep size on each rollback
+        max_retries: int
+            The maximum number of consecutive rollbacks
+        recovery_saves: int
+            The number of consecutive healthy saves after which the timestep
+            size is increased again. If *None*, reductions are permanent.
+        dt_recovery: float
+            Factor by which to increase the timestep size on recovery. Defaults
+            to ``1/dt_backoff``.
+        """
+        if nstates < 1:
+            raise ValueError("At least one state must be kept.")
+
+        self.health_check = health_check
+        self.interval = interval
+        self.dt_backoff = dt_backoff
+        self.max_retries = max_retries
+        self.recovery_saves = recovery_saves
+        self.dt_recovery = 1/dt_backoff if dt_recovery is None else dt_recovery
+
+        self.dt_factor = 1.
+        self._snapshots = deque(maxlen=nstates)
+        self._nfailures = 0
+        self._nhealthy_saves = 0
+
+    def save(self, actx, step, t, state):
+        """Store a host-side copy of the healthy *state* at *step* and *t*."""
+        if actx is None:
+            from copy import deepcopy
+            host_state = deepcopy(state)
+        else:
+            host_state = actx.to_numpy(state)
+
+        self._snapshots.append((step, t, host_state))
+        self._nfailures = 0
+
+        if self.recovery_saves is None or self.dt_factor >= 1:
+            return
+
+        self._nhealthy_saves += 1
+        if self._nhealthy_saves >= self.recovery_saves:
+            self.dt_factor = min(1., self.dt_factor*self.dt_recovery)
+            self._nhealthy_saves = 0
+            logger.info(f"Scaling dt by {self.dt_factor} after "
+                        f"{self.recovery_saves} healthy saves at step {step}.")
+
+    def roll_back(self, actx, step, t):
+        """Reduce the timestep size and return a stored state to restart from.
+
+        Returns
+        -------
+        step: int
+            The step number of the stored state
+        t: float
+            The time of the stored state
+        state
+            The stored state
+        """
+        self._nfailures += 1
+        if self._nfailures > self.max_retries or not self._snapshots:
+            from mirgecom.simutil import SimulationRuntimeError
+            raise SimulationRuntimeError(
+                f"State failed health check at step {step}, t={t}, after "
+                f"{self._nfailures - 1} consecutive rollbacks.")
+
+        if self._nfailures > 1 and len(self._snapshots) > 1:
+            self._snapshots.pop()
+
+        self.dt_factor *= self.dt_backoff
+        self._nhealthy_saves = 0
+
+        rollback_step, rollback_t, host_state = self._snapshots[-1]
+        logger.warning(f"State failed health check at step {step}, t={t}. "
+                       f"Rolling back to step {rollback_step}, t={rollback_t}, "
+                       f"with dt scaled by {self.dt_factor}.")
+
+        if actx is None:
+            from copy import deepcopy
+            state = deepcopy(host_state)
+        else:
+            state = actx.from_numpy(host_state)
+
+        return rollback_step, rollback_t, state
+
+
+def _compile_timestepper(actx, timestepper, rhs, post_step_filter=None,
+                         nsteps=1):
+    """Create lazy evaluation version of the timestepper.
+
+    If given, *post_step_filter* is applied to the advanced state as part of
+    the compiled step. The compiled function takes *nsteps* consecutive steps
+    of size *dt*.
+    """
+    def step(y, t, dt):
+        for i in range(nsteps):
+            y = timestepper(state=y, t=t + i*dt, dt=dt, rhs=rhs)
+            if post_step_filter is not None:
+                y = post_step_filter(y)
+        return y
+
+    if actx is None:
+        return step
 
-def _compile_timestepper(actx, timestepper, rhs):
-    """Create lazy evaluation version of the timestepper."""
     @memoize_in(actx, ("mirgecom_compiled_operator",
-                       timestepper, rhs))
+                       timestepper, rhs, post_step_filter, nsteps))
     def get_timestepper():
-        return actx.compile(lambda y, t, dt: timestepper(state=y, t=t,
-                                                         dt=dt,
-                                                         rhs=rhs))
+        return actx.compile(step)
 
     return get_timestepper()
 
@@ -76,7 +225,9 @@ def _is_unevaluated(actx, ary):
 def _advance_state_stepper_func(rhs, timestepper, state, t_final, dt=0,
                                 t=0.0, istep=0, pre_step_callback=None,
                                 post_step_callback=None, force_eval=None,
-                                local_dt=False, max_steps=None, compile_rhs=True):
+                                local_dt=False, max_steps=None, compile_rhs=True,
+                                compile_timestepper=False, post_step_filter=None,
+                                steps_per_call=1, rollback_buffer=None):
     """Advance state from some time (t) to some time (t_final).
 
     Parameters
@@ -119,6 +270,20 @@ def _advance_state_stepper_func(rhs, timestepper, state, t_final, dt=0,
         the domain.
     compile_rhs
         An optional boolean indicating whether *rhs* can be compiled.
+    compile_timestepper
+        An optional boolean indicating whether to compile the whole step,
+        including all stages of *timestepper* and *post_step_filter*, into a
+        single program.
+    post_step_filter
+        An optional function with signature ``state = post_step_filter(state)``,
+        e.g. a limiter or filter, that is applied to the state after each step.
+    steps_per_call
+        An optional number of consecutive steps to compile into a single
+        program if *compile_timestepper* is set. The callbacks are only called
+        before and after each call.
+    rollback_buffer
+        An optional :class:`RollbackBuffer` that checks the health of the state
+        and rolls back failed steps.
 
     Returns
     -------
@@ -145,7 +310,31 @@ def _advance_state_stepper_func(rhs, timestepper, state, t_final, dt=0,
 
     state = force_evaluation(actx, state)
 
-    if compile_rhs:
+    if steps_per_call > 1 and not compile_timestepper:
+        raise ValueError("steps_per_call requires compile_timestepper.")
+
+    if rollback_buffer is not None:
+        if local_dt:
+            raise ValueError("Rollback is not supported for local_dt mode.")
+        if rollback_buffer.interval % steps_per_call != 0:
+            raise ValueError(
+                f"The rollback interval ({rollback_buffer.interval}) must be a "
+                f"multiple of steps_per_call ({steps_per_call}).")
+        rollback_buffer.save(actx, istep, t, state)
+
+    if compile_timestepper:
+        # The compiled steps return evaluated arrays. Since the loop below
+        # holds no other reference to the previous state, its memory is
+        # returned to the allocator as soon as the step returns, where it can
+        # be reused for the next step.
+        compiled_steps = {
+            nsteps: _compile_timestepper(actx, timestepper, rhs,
+                                         post_step_filter, nsteps=nsteps)
+            for nsteps in {1, steps_per_call}}
+        force_eval = False
+        maybe_compiled_rhs = None
+        post_step_filter = None
+    elif compile_rhs:
         maybe_compiled_rhs = _compile_rhs(actx, rhs)
     else:
         maybe_compiled_rhs = rhs
@@ -161,7 +350,30 @@ def _advance_state_stepper_func(rhs, timestepper, state, t_final, dt=0,
         if force_eval:
             state = force_evaluation(actx, state)
 
-        state = timestepper(state=state, t=t, dt=dt, rhs=maybe_compiled_rhs)
+        step_dt = dt if rollback_buffer is None else dt*rollback_buffer.dt_factor
+
+        nsteps = 1
+        if steps_per_call > 1 and istep % steps_per_call == 0:
+            # Only take multiple steps if they fit into the remaining interval
+            if local_dt:
+                remaining_steps = marching_limit - istep
+            else:
+                remaining_steps = (
+                    steps_per_call if t + steps_per_call*step_dt <= t_final
+                    else 0)
+                if max_steps is not None:
+                    remaining_steps = min(remaining_steps, max_steps - istep)
+            if remaining_steps >= steps_per_call:
+                nsteps = steps_per_call
+
+        if compile_timestepper:
+            state = compiled_steps[nsteps](state, t, step_dt)
+        else:
+            state = timestepper(state=state, t=t, dt=step_dt,
+                                rhs=maybe_compiled_rhs)
+
+        if post_step_filter is not None:
+            state = post_step_filter(state)
 
         if force_eval is None:
             if _is_unevaluated(actx, state):
@@ -178,17 +390,134 @@ def _advance_state_stepper_func(rhs, timestepper, state, t_final, dt=0,
         if force_eval:
             state = force_evaluation(actx, state)
 
-        istep += 1
+        istep += nsteps
 
         if local_dt:
             dt = force_evaluation(actx, dt)
             t = force_evaluation(actx, t)
-            t = t + dt
+            t = t + nsteps*dt
             marching_loc = istep
         else:
-            t += dt
+            t += nsteps*step_dt
             marching_loc = t
 
+        if (rollback_buffer is not None
+                and istep % rollback_buffer.interval == 0):
+            if rollback_buffer.health_check(state=state, step=istep, t=t,
+                                            dt=step_dt):
+                istep, t, state = rollback_buffer.roll_back(actx, istep, t)
+                marching_loc = t
+                continue
+            rollback_buffer.save(actx, istep, t, state)
+
+        if post_step_callback is not None:
+            state, dt = post_step_callback(state=state, step=istep, t=t, dt=dt)
+
+    return istep, t, state
+
+
+def _advance_state_adaptive(rhs, timestepper, state, t_final, step_controller,
+                            dt=0, t=0.0, istep=0, pre_step_callback=None,
+                            post_step_callback=None, force_eval=None,
+                            max_steps=None, compile_rhs=True):
+    """Advance state from some time *t* to some time *t_final* with adaptive dt.
+
+    Parameters
+    ----------
+    rhs
+        Function that should return the time derivative of the state.
+        This function should take time and state as arguments, with
+        a call with signature ``rhs(t, state)``.
+    timestepper
+        Function that advances the state from t=time to t=(time+dt), and
+        returns the advanced state and an estimate of its error. Has a call
+        with signature ``state, error = timestepper(state, t, dt, rhs)``, see
+        e.g. :func:`mirgecom.integrators.embedded_rk.dormand_prince54_step`.
+    state: numpy.ndarray
+        Agglomerated object array containing at least the state variables that
+        will be advanced by this stepper
+    t_final: float
+        Simulated time at which to stop
+    step_controller
+        An instance of
+        :class:`~mirgecom.integrators.embedded_rk.PIStepSizeController` that
+        accepts or rejects steps and proposes the timestep size
+    t: float
+        Time at which to start
+    dt: float
+        Initial timestep size to try
+    istep: int
+        Step number from which to start
+    max_steps: int
+        Optional parameter indicating maximum number of steps to take
+    pre_step_callback
+        An optional user-defined function, with signature:
+        ``state, dt = pre_step_callback(step, t, dt, state)``,
+        to be called before the timestepper is called for that particular step.
+        The returned *dt* is the timestep size that is attempted.
+    post_step_callback
+        An optional user-defined function, with signature:
+        ``state, dt = post_step_callback(step, t, dt, state)``,
+        to be called after an accepted step, with the timestep size proposed
+        for the next step.
+    force_eval
+        An optional boolean indicating whether to force lazy evaluation between
+        timesteps. By default, attempts to deduce whether this is necessary based
+        on the behavior of the timestepper.
+    compile_rhs
+        An optional boolean indicating whether *rhs* can be compiled.
+
+    Returns
+    -------
+    istep: int
+        the current step number
+    t: float
+        the current time
+    state: numpy.ndarray
+    """
+    actx = get_container_context_recursively_opt(state)
+
+    t = np.float64(t)
+    if t >= t_final:
+        return istep, t, state
+
+    if dt <= 0:
+        raise ValueError("An initial dt > 0 is required for adaptive stepping.")
+
+    state = force_evaluation(actx, state)
+
+    if compile_rhs:
+        maybe_compiled_rhs = _compile_rhs(actx, rhs)
+    else:
+        maybe_compiled_rhs = rhs
+
+    while t < t_final:
+        if max_steps is not None:
+            if max_steps <= istep:
+                return istep, t, state
+
+        if pre_step_callback is not None:
+            state, dt = pre_step_callback(state=state, step=istep, t=t, dt=dt)
+
+        accepted = False
+        while not accepted:
+            step_dt = min(dt, t_final - t)
+            new_state, error = timestepper(state=state, t=t, dt=step_dt,
+                                           rhs=maybe_compiled_rhs)
+
+            if force_eval is None:
+                force_eval = _is_unevaluated(actx, new_state)
+
+            if force_eval:
+                new_state = force_evaluation(actx, new_state)
+
+            error_norm = step_controller.get_error_norm(state, new_state, error)
+            accepted, dt = step_controller.adapt_dt(step_dt, error_norm)
+
+        state = new_state
+        istep += 1
+        t += step_dt
+
         if post_step_callback is not None:
             state, dt = post_step_callback(state=state, step=istep, t=t, dt=dt)
 
@@ -350,9 +679,17 @@ def generate_singlerate_leap_advancer(timestepper, component_id, rhs, t, dt,
 def advance_state(rhs, timestepper, state, t_final, t=0, istep=0, dt=0,
                   max_steps=None, component_id="state", pre_step_callback=None,
                   post_step_callback=None, force_eval=None, local_dt=False,
-                  compile_rhs=True):
+                  compile_rhs=True, step_controller=None,
+                  compile_timestepper=False, post_step_filter=None,
+                  steps_per_call=1, rollback_buffer=None):
     """Determine what stepper to use and advance the state from (t) to (t_final).
 
+    If a *step_controller* is given, *timestepper* must be an embedded
+    Runge-Kutta stepper function that also returns an error estimate (see
+    :mod:`mirgecom.integrators.embedded_rk`), and the timestep size is adapted
+    by the controller after every step, starting from *dt*. Rejected steps are
+    repeated with a smaller timestep size.
+
     Parameters
     ----------
     rhs
@@ -399,6 +736,36 @@ def advance_state(rhs, timestepper, state, t_final, t=0, istep=0, dt=0,
         the domain.
     compile_rhs
         An optional boolean indicating whether *rhs* can be compiled.
+    step_controller
+        An optional
+        :class:`~mirgecom.integrators.embedded_rk.PIStepSizeController` that
+        adapts the timestep size to the error estimate of the *timestepper*.
+    compile_timestepper
+        An optional boolean indicating whether to compile the whole step,
+        including all stages of *timestepper* and *post_step_filter*, into a
+        single program, instead of compiling only *rhs*. This reduces the
+        Python overhead and the number of kernel launches per step for lazy
+        array contexts. Only supported for stepper functions.
+    post_step_filter
+        An optional function with signature ``state = post_step_filter(state)``,
+        e.g. a limiter or filter, that is applied to the state after each step
+        (and included in the compiled step if *compile_timestepper* is set).
+        Only supported for stepper functions.
+    steps_per_call
+        An optional number of consecutive steps to compile into a single
+        program if *compile_timestepper* is set, amortizing the Python and
+        kernel launch overhead over several steps. The callbacks are only
+        called before and after each call, i.e. for step numbers that are
+        multiples of *steps_per_call*, so status and visualization intervals
+        should be multiples of it as well. *dt* is held fixed over each call.
+        Single steps are taken to reach the first such step number and where
+        fewer than *steps_per_call* steps remain before *t_final* or
+        *max_steps*.
+    rollback_buffer
+        An optional :class:`RollbackBuffer` that periodically checks the health
+        of the state, keeps copies of recent healthy states, and on failure
+        rolls back and retries with a reduced timestep size. Only supported for
+        stepper functions with uniform *dt*.
 
     Returns
     -------
@@ -423,7 +790,36 @@ def advance_state(rhs, timestepper, state, t_final, t=0, istep=0, dt=0,
             if local_dt:
                 raise ValueError("Local timestepping is not supported for Leap-based"
                                  " integrators.")
-    if leap_timestepper:
+    if leap_timestepper and (compile_timestepper or post_step_filter is not None
+                             or steps_per_call > 1):
+        raise ValueError("compile_timestepper, post_step_filter and "
+                         "steps_per_call > 1 are not supported for Leap-based "
+                         "integrators.")
+
+    if rollback_buffer is not None and (leap_timestepper
+                                        or step_controller is not None):
+        raise ValueError("Rollback is only supported for non-adaptive stepper "
+                         "functions.")
+
+    if step_controller is not None:
+        if (compile_timestepper or post_step_filter is not None
+                or steps_per_call > 1):
+            raise ValueError("compile_timestepper, post_step_filter and "
+                             "steps_per_call > 1 are not supported for adaptive "
+                             "timestepping.")
+        if leap_timestepper or local_dt:
+            raise ValueError("Adaptive timestepping is only supported for "
+                             "uniform dt with stepper functions.")
+        (current_step, current_t, current_state) = \
+            _advance_state_adaptive(
+                rhs=rhs, timestepper=timestepper,
+                state=state, t=t, t_final=t_final, dt=dt, istep=istep,
+                step_controller=step_controller,
+                pre_step_callback=pre_step_callback,
+                post_step_callback=post_step_callback,
+                force_eval=force_eval, max_steps=max_steps, compile_rhs=compile_rhs,
+            )
+    elif leap_timestepper:
         (current_step, current_t, current_state) = \
             _advance_state_leap(
                 rhs=rhs, timestepper=timestepper,
@@ -444,6 +840,10 @@ def advance_state(rhs, timestepper, state, t_final, t=0, istep=0, dt=0,
                 istep=istep, force_eval=force_eval,
                 max_steps=max_steps, local_dt=local_dt,
                 compile_rhs=compile_rhs,
+                compile_timestepper=compile_timestepper,
+                post_step_filter=post_step_filter,
+                steps_per_call=steps_per_call,
+                rollback_buffer=rollback_buffer,
             )
 
     return current_step, current_t, current_state
@@ -11,7 +11,10 @@ and some helper routines to create the wrapper class.
 
     - Lazy eval is currently incapable of dealing with data-dependent
       behavior (like that of an iterative Newton solve). This wrapper allows us to
-      hard-code the number of Newton iterations to *temperature_niter*.
+      hard-code the number of Newton iterations to *temperature_niter*. The
+      number can be overridden per instance, and :func:`get_temperature_niter`
+      measures, outside of any compiled function, how many iterations a given
+      state needs (see below).
 
     - Small species mass fractions can trigger reaction rates which drive species
       fractions significantly negative over a single timestep. The wrapper provides
@@ -21,6 +24,44 @@ and some helper routines to create the wrapper class.
 .. autofunction:: get_pyrometheus_wrapper_class
 .. autofunction:: get_pyrometheus_wrapper_class_from_cantera
 .. autofunction:: get_thermochemistry_class_by_mechanism_name
+.. autofunction:: get_tabulated_thermo_wrapper_class
+.. autofunction:: get_temperature_niter
+
+Adapting the number of Newton iterations
+----------------------------------------
+
+Since the number of Newton iterations is part of the compiled RHS, it can only
+change between calls to the RHS. A driver can check every few steps how many
+iterations the current state needs, and switch between RHS functions compiled
+for each number of iterations:
+
+.. code-block:: python
+
+    compiled_rhs = {}
+
+    def get_rhs(niter):
+        if niter not in compiled_rhs:
+            gas_model = GasModel(eos=PyrometheusMixture(
+                pyro_class(actx.np, temperature_niter=niter),
+                temperature_guess=init_temperature))
+            compiled_rhs[niter] = actx.compile(
+                partial(my_rhs, gas_model=gas_model))
+        return compiled_rhs[niter]
+
+    def my_pre_step(step, t, dt, state):
+        if step % niter_check_interval == 0:
+            cv, tseed = state
+            current_niter[0] = get_temperature_niter(
+                dcoll, pyro_mech, eos.internal_energy(cv)/cv.mass, tseed,
+                cv.species_mass_fractions, tol=1e-10, max_niter=5)
+        return state, dt
+
+    def rhs(t, state):
+        return get_rhs(current_niter[0])(t, state)
+
+Each number of iterations is compiled once and then reused. The *rhs* above
+dispatches on host data, so it cannot be used with the *compile_timestepper*
+option of :func:`~mirgecom.steppers.advance_state`.
 """
 
 __copyright__ = """
@@ -47,6 +88,11 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+import grudge.op as op
+from grudge.dof_desc import DD_VOLUME_ALL
+
+from mirgecom.utils import force_evaluation
+
 
 def get_pyrometheus_wrapper_class(pyro_class, temperature_niter=5, zero_level=0.):
     """Return a MIRGE-compatible wrapper for a :mod:`pyrometheus` mechanism class.
@@ -62,7 +108,9 @@ def get_pyrometheus_wrapper_class(pyro_class, temperature_niter=5, zero_level=0.
 
     - get_temperature: MIRGE-specific interface to use a hard-coded Newton solver
       to find a temperature from an input state. This routine hard-codes the number
-      of Newton solve iterations to *temperature_niter*.
+      of Newton solve iterations to *temperature_niter*, which can be
+      overridden by passing *temperature_niter* to the constructor of the
+      wrapper class.
 
     - get_heat_release:
       evaluate heat release due to reactions.
@@ -72,13 +120,17 @@ def get_pyrometheus_wrapper_class(pyro_class, temperature_niter=5, zero_level=0.
     pyro_class: :class:`~pyrometheus.thermochem_example.Thermochemistry`
         Pyro thermochemical mechanism to wrap
     temperature_niter: int
-        Number of Newton iterations in `get_temperature` (default=5)
+        Default number of Newton iterations in `get_temperature` (default=5)
     zero_level: float
         Squash concentrations below this level to 0. (default=0.)
     """
 
     class PyroWrapper(pyro_class):
 
+        def __init__(self, *args, temperature_niter=temperature_niter, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.temperature_niter = temperature_niter
+
         # This bit disallows negative concentrations (or user-defined floor)
         # and instead pins them to 0. Sometimes, mass_fractions can be slightly
         # negative and that's ok.
@@ -118,12 +170,12 @@ def get_pyrometheus_wrapper_class(pyro_class, temperature_niter=5, zero_level=0.
                 return self.get_temperature_update_energy(e_or_h, t_in, y)
             return self.get_temperature_update_enthalpy(e_or_h, t_in, y)
 
-        # This hard-codes the number of Newton iterations because the convergence
-        # check is not compatible with lazy evaluation. Instead, we plan to check
-        # the temperature residual at simulation health checking time.
+        # This hard-codes the number of Newton iterations for lazy evaluation,
+        # because the convergence check is not compatible with it. Instead, we
+        # plan to check the temperature residual at simulation health checking
+        # time.
         # FIXME: Occasional convergence check is other-than-ideal; revisit asap.
         # - could adapt dt or num_iter on temperature convergence?
-        # - can pass-in num_iter?
         def get_temperature(self, energy_or_enthalpy, temperature_guess,
                             species_mass_fractions, use_energy=True):
             """Compute the temperature of the mixture from thermal energy.
@@ -145,9 +197,10 @@ def get_pyrometheus_wrapper_class(pyro_class, temperature_niter=5, zero_level=0.
             Returns
             -------
             :class:`~meshmode.dof_array.DOFArray`
-                The mixture temperature after a fixed number of Newton iterations.
+                The mixture temperature after a fixed number of Newton
+                iterations.
             """
-            num_iter = temperature_niter
+            num_iter = self.temperature_niter
 
             # if calorically perfect gas (constant heat capacities)
             if num_iter == 0:
@@ -204,18 +257,327 @@ def get_pyrometheus_wrapper_class_from_cantera(cantera_soln, temperature_niter=5
     """
     import pyrometheus as pyro
     pyro_class = pyro.get_thermochem_class(cantera_soln)
-    return get_pyrometheus_wrapper_class(pyro_class,
-                                         temperature_niter=temperature_niter,
-                                         zero_level=zero_level)
+    return get_pyrometheus_wrapper_class(
+        pyro_class, temperature_niter=temperature_niter, zero_level=zero_level)
+
+
+def _get_cached_thermochem_class(mechanism_name, mech_input_source, cache_dir,
+                                 comm=None):
+    """Return the pyrometheus class of a mechanism from an on-disk cache.
+
+    The generated module is stored in *cache_dir* under a name containing a
+    hash of the mechanism input and the :mod:`pyrometheus` version. If it does
+    not exist yet, it is generated by one rank per node of *comm* and written
+    atomically, while the other ranks wait to load it.
+    """
+    import os
+    import socket
+    import hashlib
+    import importlib.util
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        pyro_version = version("pyrometheus")
+    except PackageNotFoundError:
+        pyro_version = "unknown"
+
+    key = hashlib.sha256(
+        (mech_input_source + pyro_version).encode()).hexdigest()[:16]
+    module_name = f"pyro_{mechanism_name}_{key}"
+    module_path = os.path.join(cache_dir, f"{module_name}.py")
+
+    if comm is None:
+        generates_module = True
+        node_comm = None
+    else:
+        from mpi4py import MPI
+        node_comm = comm.Split_type(MPI.COMM_TYPE_SHARED)
+        generates_module = node_comm.rank == 0
+
+    if generates_module and not os.path.exists(module_path):
+        from cantera import Solution
+        from pyrometheus.codegen.python import gen_thermochem_code
+        cantera_soln = Solution(name="gas", yaml=mech_input_source)
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{module_path}.{socket.gethostname()}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as mech_file:
+            print(gen_thermochem_code(cantera_soln), file=mech_file)
+        os.replace(tmp_path, module_path)
+
+    if node_comm is not None:
+        node_comm.Barrier()
+        node_comm.Free()
+
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.Thermochemistry
 
 
 def get_thermochemistry_class_by_mechanism_name(mechanism_name: str,
                                                 temperature_niter=5,
-                                                zero_level=0.):
-    """Grab a pyrometheus mechanism class from the mech name."""
+                                                zero_level=0.,
+                                                cache_dir=None, comm=None):
+    """Grab a pyrometheus mechanism class from the mech name.
+
+    If *cache_dir* is given, the generated :mod:`pyrometheus` module is cached
+    in that directory, keyed on the mechanism input and the :mod:`pyrometheus`
+    version, so that later runs skip parsing the mechanism and generating the
+    code. If the MPI communicator *comm* is given, the module is generated by
+    only one rank per node, and must then be called collectively. The wrapper
+    options are applied when loading and do not affect the cached module, and
+    are described in :func:`get_pyrometheus_wrapper_class`.
+    """
     from mirgecom.mechanisms import get_mechanism_input
     mech_input_source = get_mechanism_input(mechanism_name)
+
+    if cache_dir is not None:
+        pyro_class = _get_cached_thermochem_class(
+            mechanism_name, mech_input_source, cache_dir, comm=comm)
+        return get_pyrometheus_wrapper_class(
+            pyro_class, temperature_niter=temperature_niter,
+            zero_level=zero_level)
+
     from cantera import Solution
     cantera_soln = Solution(name="gas", yaml=mech_input_source)
     return get_pyrometheus_wrapper_class_from_cantera(
         cantera_soln, temperature_niter=temperature_niter, zero_level=zero_level)
+
+
+def _tabulate_species_thermo(pyro_class, temperature_breakpoints, degree, rtol,
+                             npoints):
+    """Fit piecewise polynomials in temperature to the species properties.
+
+    Returns the coefficients of the polynomials for $c_{p,k}/R$ and $h_k/R$ of
+    each species in increasing order of the powers of temperature, in arrays
+    of shape *(nranges, nspecies, degree+1)* and *(nranges, nspecies,
+    degree+2)*.
+    """
+    import numpy as np
+    from numpy.polynomial import polynomial as poly
+
+    pyro_mech = pyro_class(np)
+
+    def eval_species(func, temperature):
+        return np.array([
+            np.broadcast_to(value, temperature.shape)
+            for value in func(temperature)], dtype=np.float64)
+
+    cp_coefs = []
+    h_coefs = []
+    for t_low, t_high in zip(temperature_breakpoints[:-1],
+                             temperature_breakpoints[1:]):
+        # Chebyshev points avoid sampling exactly at the breakpoints
+        temperature = (t_low + t_high)/2 - (t_high - t_low)/2*np.cos(
+            np.pi*(np.arange(npoints) + 0.5)/npoints)
+        cp_r = eval_species(pyro_mech.get_species_specific_heats_r, temperature)
+        h_r = temperature*eval_species(pyro_mech.get_species_enthalpies_rt,
+                                       temperature)
+
+        range_cp_coefs = np.empty((pyro_mech.num_species, degree+1))
+        range_h_coefs = np.empty((pyro_mech.num_species, degree+2))
+        for k in range(pyro_mech.num_species):
+            range_cp_coefs[k] = poly.Polynomial.fit(
+                temperature, cp_r[k], degree).convert().coef
+            # Integrate the fit of cp to keep h consistent with it
+            h_fit = poly.polyint(range_cp_coefs[k])
+            h_fit[0] = np.mean(h_r[k] - poly.polyval(temperature, h_fit))
+            range_h_coefs[k] = h_fit
+
+            for coefs, values in [(range_cp_coefs[k], cp_r[k]),
+                                  (range_h_coefs[k], h_r[k])]:
+                error = (np.max(np.abs(poly.polyval(temperature, coefs) - values))
+                         / np.max(np.abs(values)))
+                if error > rtol:
+                    raise ValueError(
+                        f"Tabulated thermo of species {k} deviates by {error} > "
+                        f"{rtol} from the mechanism on [{t_low}, {t_high}]. Add "
+                        "the species' temperature range midpoints to the "
+                        "breakpoints, or increase the degree.")
+
+        cp_coefs.append(range_cp_coefs)
+        h_coefs.append(range_h_coefs)
+
+    return np.array(cp_coefs), np.array(h_coefs)
+
+
+def get_tabulated_thermo_wrapper_class(pyro_class, *,
+                                       temperature_breakpoints=(200., 1000.,
+                                                                3500.),
+                                       degree=4, rtol=1e-10, npoints=200):
+    r"""Return a wrapper class that evaluates mixture thermo from tabulated data.
+
+    The mixture properties of a :mod:`pyrometheus` mechanism are sums over
+    per-species polynomials (e.g. the NASA polynomials) in each temperature
+    range. This wrapper tabulates the polynomial coefficients of the species
+    heat capacities and enthalpies per temperature range, by fitting
+    polynomials of degree *degree* to the species properties of *pyro_class*
+    sampled on *npoints* temperatures in each range between
+    *temperature_breakpoints*. It then evaluates the mixture heat capacities,
+    enthalpy and internal energy by first summing the coefficients over the
+    species, weighted by the mass fractions, and then evaluating one
+    polynomial per temperature range.
+
+    The cost of evaluating a mixture property after summing the coefficients
+    is independent of the number of species. The Newton iterations of
+    *get_temperature* sum the coefficients once and reuse them in every
+    iteration.
+
+    Any temperature at which a species switches polynomials (typically 1000 K
+    for the NASA polynomials) must be one of the *temperature_breakpoints*.
+    Below the first and above the last breakpoint, the outermost polynomials
+    are extrapolated. The fits are verified against *pyro_class*, and a
+    :class:`ValueError` is raised if their error relative to the maximum of
+    each property over a range exceeds *rtol*.
+
+    Parameters
+    ----------
+    pyro_class: :class:`~pyrometheus.thermochem_example.Thermochemistry`
+        Pyro thermochemical mechanism wrapper to wrap, as returned by
+        :func:`get_pyrometheus_wrapper_class`
+    temperature_breakpoints:
+        Increasing temperatures that delimit the temperature ranges
+    degree: int
+        Degree of the polynomials for the species heat capacities
+    rtol: float
+        Maximum error of the tabulated properties relative to the mechanism
+    npoints: int
+        Number of temperatures per range at which to fit and verify the
+        properties
+    """
+    cp_coefs, h_coefs = _tabulate_species_thermo(
+        pyro_class, temperature_breakpoints, degree, rtol, npoints)
+
+    class MixtureThermoCoefficients:
+        """Species-summed thermo coefficients of a given mixture composition."""
+
+        def __init__(self, pyro_mech, mass_fractions):
+            self.mass_fractions = mass_fractions
+            moles = [mass_fractions[k]*pyro_mech.iwts[k]
+                     for k in range(pyro_mech.num_species)]
+            self.inv_molecular_weight = sum(moles)
+
+            def sum_species(coefs):
+                return [[sum(moles[k]*float(coefs[i, k, j])
+                             for k in range(pyro_mech.num_species))
+                         for j in range(coefs.shape[2])]
+                        for i in range(coefs.shape[0])]
+
+            self.cp_coefs = sum_species(cp_coefs)
+            self.h_coefs = sum_species(h_coefs)
+
+    class TabulatedThermoWrapper(pyro_class):
+
+        def _get_mixture_coefficients(self, mass_fractions):
+            if isinstance(mass_fractions, MixtureThermoCoefficients):
+                return mass_fractions
+            return MixtureThermoCoefficients(self, mass_fractions)
+
+        def _eval_piecewise(self, range_coefs, temperature):
+            result = None
+            for i, coefs in enumerate(range_coefs):
+                value = coefs[-1]
+                for coef in coefs[-2::-1]:
+                    value = value*temperature + coef
+                if result is None:
+                    result = value
+                else:
+                    result = self.usr_np.where(
+                        self.usr_np.greater(temperature,
+                                            temperature_breakpoints[i]),
+                        value, result)
+            return result
+
+        def get_mixture_specific_heat_cp_mass(self, temperature, mass_fractions):
+            mix = self._get_mixture_coefficients(mass_fractions)
+            return self.gas_constant*self._eval_piecewise(mix.cp_coefs,
+                                                          temperature)
+
+        def get_mixture_specific_heat_cv_mass(self, temperature, mass_fractions):
+            mix = self._get_mixture_coefficients(mass_fractions)
+            return self.gas_constant*(
+                self._eval_piecewise(mix.cp_coefs, temperature)
+                - mix.inv_molecular_weight)
+
+        def get_mixture_enthalpy_mass(self, temperature, mass_fractions):
+            mix = self._get_mixture_coefficients(mass_fractions)
+            return self.gas_constant*self._eval_piecewise(mix.h_coefs,
+                                                          temperature)
+
+        def get_mixture_internal_energy_mass(self, temperature, mass_fractions):
+            mix = self._get_mixture_coefficients(mass_fractions)
+            return self.gas_constant*(
+                self._eval_piecewise(mix.h_coefs, temperature)
+                - mix.inv_molecular_weight*temperature)
+
+        def get_temperature(self, energy_or_enthalpy, temperature_guess,
+                            species_mass_fractions, use_energy=True):
+            """Compute the temperature of the mixture from thermal energy.
+
+            Sums the tabulated coefficients over the species once for all
+            Newton iterations. See the wrapped class for the parameters.
+            """
+            return super().get_temperature(
+                energy_or_enthalpy, temperature_guess,
+                self._get_mixture_coefficients(species_mass_fractions),
+                use_energy=use_energy)
+
+    return TabulatedThermoWrapper
+
+
+def get_temperature_niter(dcoll, pyro_mechanism, energy_or_enthalpy,
+                          temperature_guess, species_mass_fractions, *,
+                          tol, max_niter, use_energy=True,
+                          dd=DD_VOLUME_ALL):
+    """Return the number of Newton iterations needed to converge the temperature.
+
+    Performs the Newton iterations of *get_temperature* of *pyro_mechanism* one
+    at a time, and returns the number of iterations after which the maximum
+    relative temperature update over all ranks falls below *tol*, or
+    *max_niter* if it does not. Each iteration transfers the maximum to the
+    host, so this is meant to be called outside of the compiled RHS, e.g. every
+    few steps, to choose the *temperature_niter* of the mechanism used in the
+    RHS. This routine is collective.
+
+    Parameters
+    ----------
+    dcoll: :class:`~grudge.discretization.DiscretizationCollection`
+        The discretization collection
+    pyro_mechanism:
+        Instance of a wrapper class returned by
+        :func:`get_pyrometheus_wrapper_class`
+    energy_or_enthalpy: :class:`~meshmode.dof_array.DOFArray`
+        The internal (thermal) energy or enthalpy of the mixture
+    temperature_guess: :class:`~meshmode.dof_array.DOFArray`
+        The initial starting temperature for the Newton iterations
+    species_mass_fractions: numpy.ndarray
+        Object array of the mass fractions of the mixture species
+    tol: float
+        Tolerance for the relative temperature update
+    max_niter: int
+        Maximum number of Newton iterations
+    use_energy: bool
+        Indicates whether *energy_or_enthalpy* is the energy or the enthalpy
+    dd: grudge.dof_desc.DOFDesc
+        The volume on which the state is defined
+
+    Returns
+    -------
+    int
+        The number of Newton iterations
+    """
+    actx = energy_or_enthalpy.array_context
+    energy_or_enthalpy = force_evaluation(actx, energy_or_enthalpy)
+    species_mass_fractions = force_evaluation(actx, species_mass_fractions)
+    t_i = force_evaluation(actx, temperature_guess)
+
+    for niter in range(1, max_niter+1):
+        t_update = pyro_mechanism.get_temperature_update(
+            energy_or_enthalpy, t_i, species_mass_fractions, use_energy)
+        t_i = force_evaluation(actx, t_i + t_update)
+        max_update = actx.to_numpy(
+            op.nodal_max(dcoll, dd, actx.np.abs(t_update/t_i)))
+        if max_update < tol:
+            return niter
+
+    return max_niter
@@ -335,6 +335,7 @@ class MixtureAveragedTransport(TransportModel):
     .. automethod:: volume_viscosity
     .. automethod:: thermal_conductivity
     .. automethod:: species_diffusivity
+    .. automethod:: transport_vars
     """
 
     def __init__(self, pyrometheus_mech, alpha=0.6, factor=1.0, lewis=None,
@@ -500,6 +501,83 @@ class MixtureAveragedTransport(TransportModel):
 
         return self._factor*diffusivity
 
+    def transport_vars(self, cv: ConservedVars,  # type: ignore[override]
+                       dv: GasDependentVars,
+                       eos: GasEOS) -> GasTransportVars:
+        r"""Compute all transport properties in a single pass.
+
+        Evaluating the individual methods recomputes the mole fractions and
+        pure-species properties for every coefficient, and the mixture
+        viscosity, with its $K^2$ interaction terms $\phi_{kj}$, three times.
+        Here, the mole fractions, the pure-species viscosities and
+        conductivities, and the $\phi_{kj}$ are computed once, and all
+        coefficients are derived from them using the same mixture rules as
+        the individual methods. For the diffusivities, the reciprocals of the
+        (symmetric) binary diffusivities are computed once per species pair.
+        """
+        actx = cv.mass.array_context
+        pyro_mech = self._pyro_mech
+        nspecies = pyro_mech.num_species
+        temperature = dv.temperature
+        y = cv.species_mass_fractions
+
+        mmw = pyro_mech.get_mix_molecular_weight(y)
+        x = pyro_mech.get_mole_fractions(mmw, y)
+        wts = pyro_mech.wts
+
+        # Wilke's rule, with the temperature-independent factors of phi_kj
+        # evaluated on the host and sqrt(mu_k/mu_j) = sqrt(mu_k)/sqrt(mu_j)
+        species_mu = pyro_mech.get_species_viscosities(temperature)
+        sqrt_mu = [actx.np.sqrt(species_mu[k]) for k in range(nspecies)]
+        inv_sqrt_mu = [1/sqrt_mu[k] for k in range(nspecies)]
+        mu = 0
+        for k in range(nspecies):
+            # phi_kk = 1
+            phi_sum = x[k]
+            for j in range(nspecies):
+                if j != k:
+                    phi_sum = phi_sum + x[j] * (
+                        1 + sqrt_mu[k]*inv_sqrt_mu[j]*(wts[j]/wts[k])**0.25
+                    )**2 / np.sqrt(8*(1 + wts[k]/wts[j]))
+            mu = mu + x[k]*species_mu[k]/phi_sum
+        mu = self._factor*mu
+
+        species_kappa = pyro_mech.get_species_thermal_conductivities(temperature)
+        kappa = self._factor*0.5*(
+            sum(x[k]*species_kappa[k] for k in range(nspecies))
+            + 1/sum(x[k]/species_kappa[k] for k in range(nspecies)))
+
+        if self._lewis is not None:
+            diffusivity = kappa/(
+                cv.mass*self._lewis*eos.heat_capacity_cp(cv, temperature))
+        else:
+            bdiff = pyro_mech.get_species_binary_mass_diffusivities(temperature)
+            inv_bdiff = {}
+            for k in range(nspecies):
+                for j in range(k+1, nspecies):
+                    inv_bdiff[k, j] = inv_bdiff[j, k] = 1/bdiff[k][j]
+
+            diffusivity = np.empty(nspecies, dtype=object)
+            for k in range(nspecies):
+                x_sum = sum((x[j]*inv_bdiff[k, j]
+                             for j in range(nspecies) if j != k), 0*mmw)
+                d_k = actx.np.where(
+                    actx.np.greater(x_sum, 0*x_sum),
+                    (mmw - x[k]*wts[k])/(dv.pressure*mmw*x_sum),
+                    bdiff[k][k]/dv.pressure)
+                # where "1-Yi < epsilon" means "Y_i -> 1.0"
+                diffusivity[k] = self._factor*actx.np.where(
+                    actx.np.less(1.0 - y[k], self._epsilon),
+                    self._singular_diffusivity,
+                    d_k)
+
+        return GasTransportVars(
+            bulk_viscosity=self._alpha*mu,
+            viscosity=mu,
+            thermal_conductivity=kappa,
+            species_diffusivity=diffusivity
+        )
+
 
 class ArtificialViscosityTransportDiv(TransportModel):
     r"""Transport model for add artificial viscosity.
@@ -353,3 +353,250 @@ def test_mirgecom_kinetics(ctx_factory, mechname, fuel, rate_tol, reactor_type,
     # check that the reactions progress far enough and are stable
     assert reactor.T > 1800.0
     assert reactor.T < 3200.0
+
+
+def test_implicit_chemistry_step(ctx_factory):
+    """Test the implicit chemistry stepper against a homogeneous reactor.
+
+    Integrates the reactions at constant density and energy with timestep
+    sizes for which explicit RK4 is unstable, and checks the second-order
+    convergence to a constant-volume reactor in Cantera.
+    """
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    actx = PyOpenCLArrayContext(queue)
+
+    dim = 1
+    mesh = generate_regular_rect_mesh(a=(-0.5,) * dim, b=(0.5,) * dim,
+                                      nelements_per_axis=(1,) * dim)
+    dcoll = create_discretization_collection(actx, mesh, order=1)
+    zeros = dcoll.zeros(actx)
+    ones = zeros + 1.0
+
+    def inf_norm(x):
+        return actx.to_numpy(op.norm(dcoll, x, np.inf))
+
+    mech_input = get_mechanism_input("uiuc_7sp")
+    cantera_soln = cantera.Solution(name="gas", yaml=mech_input)
+    pyro_obj = get_pyrometheus_wrapper_class_from_cantera(
+        cantera_soln, temperature_niter=5)(actx.np)
+    nspecies = pyro_obj.num_species
+
+    tempin = 1200.0
+    cantera_soln.set_equivalence_ratio(phi=1.0, fuel="C2H4:1",
+                                       oxidizer="O2:1.0,N2:3.76")
+    cantera_soln.TP = tempin, 101325.0
+
+    eos = PyrometheusMixture(pyro_obj, temperature_guess=tempin)
+
+    tin = tempin * ones
+    rhoin = cantera_soln.density * ones
+    yin = make_obj_array([cantera_soln.Y[i] * ones for i in range(nspecies)])
+    ein = rhoin * eos.get_internal_energy(temperature=tin,
+                                          species_mass_fractions=yin)
+    cv = make_conserved(dim=dim, mass=rhoin, energy=ein,
+                        momentum=make_obj_array([zeros]), species_mass=rhoin*yin)
+
+    # constant density and energy, before the ignition
+    reactor = cantera.IdealGasReactor(  # pylint: disable=no-member
+        cantera_soln, name="Batch Reactor")
+    net = cantera.ReactorNet([reactor])  # pylint: disable=no-member
+    t_final = 5e-5
+    net.advance(t_final)
+
+    from mirgecom.integrators.splitting import implicit_chemistry_step
+    from pytools.convergence import EOCRecorder
+    eoc_rec = EOCRecorder()
+
+    for nsubsteps in [10, 20, 40]:
+        reacted_cv, temperature = implicit_chemistry_step(
+            eos, cv, tin, t_final, nsubsteps=nsubsteps)
+
+        # only the species densities change
+        assert inf_norm(reacted_cv.mass - cv.mass) == 0
+        assert inf_norm(reacted_cv.energy - cv.energy) == 0
+
+        y = reacted_cv.species_mass / reacted_cv.mass
+        error = max(inf_norm(y[i] - reactor.Y[i]) for i in range(nspecies))
+        eoc_rec.add_data_point(t_final/nsubsteps, error)
+
+    print(f"Implicit chemistry EOC:\n{eoc_rec}")
+    assert eoc_rec.order_estimate() >= 2 - .2
+    assert eoc_rec.max_error() < 1e-2
+    assert error < 2e-4
+    assert inf_norm(temperature - reactor.T) < 1e-3*reactor.T
+
+    # explicit RK4 does not remain stable at the coarsest substep size
+    from mirgecom.integrators import rk4_step
+
+    def reaction_rhs(t, species_mass):
+        reacting_cv = cv.replace(species_mass=species_mass)
+        return eos.get_species_source_terms(
+            reacting_cv, eos.temperature(reacting_cv, tin)).species_mass
+
+    species_mass = cv.species_mass
+    nsteps = 10
+    for istep in range(nsteps):
+        species_mass = rk4_step(species_mass, istep*t_final/nsteps,
+                                t_final/nsteps, reaction_rhs)
+    y = species_mass / cv.mass
+    explicit_error = max(inf_norm(y[i] - reactor.Y[i]) for i in range(nspecies))
+    assert not explicit_error < 1e-2
+
+
+def test_chemistry_activity(ctx_factory):
+    """Test that chemistry is only evaluated on the active elements."""
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    actx = PyOpenCLArrayContext(queue)
+
+    dim = 1
+    nel_1d = 8
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(nel_1d,) * dim)
+    dcoll = create_discretization_collection(actx, mesh, order=2)
+
+    mech_input = get_mechanism_input("uiuc_7sp")
+    cantera_soln = cantera.Solution(name="gas", yaml=mech_input)
+    pyro_obj = get_pyrometheus_wrapper_class_from_cantera(cantera_soln)(actx.np)
+    eos = PyrometheusMixture(pyro_obj, temperature_guess=300.)
+    nspecies = pyro_obj.num_species
+
+    cantera_soln.set_equivalence_ratio(phi=1.0, fuel="C2H4:1",
+                                       oxidizer={"O2": 1.0, "N2": 3.76})
+    y0 = cantera_soln.Y
+
+    # Hot in the elements with x > 0, cold elsewhere
+    nodes = actx.thaw(dcoll.nodes())[0]
+    elem_x = op.elementwise_sum(dcoll, "vol", nodes)
+    ones = dcoll.zeros(actx) + 1.
+    temperature = actx.np.where(actx.np.greater(elem_x, 0), 1800.*ones,
+                                300.*ones)
+    mass = ones
+    y = make_obj_array([y0[k]*ones for k in range(nspecies)])
+    energy = mass*eos.get_internal_energy(temperature, y)
+    cv = make_conserved(dim, mass=mass, energy=energy,
+                        momentum=make_obj_array([0*ones]),
+                        species_mass=mass*y)
+
+    from mirgecom.chemistry_activity import ChemistryActivity
+    activity = ChemistryActivity(dcoll, temperature_threshold=1000.,
+                                 species_thresholds={0: 1e-3})
+    activity.update(temperature, y)
+    assert activity.nactive_elements == nel_1d // 2
+
+    expected = eos.get_species_source_terms(cv, temperature)
+    result = activity.get_species_source_terms(eos, cv, temperature)
+
+    def inf_norm(x):
+        return actx.to_numpy(op.norm(dcoll, x, np.inf))
+
+    is_hot = actx.np.greater(temperature, 1000.)
+    for k in range(nspecies):
+        assert inf_norm(
+            result.species_mass[k]
+            - actx.np.where(is_hot, expected.species_mass[k], 0*ones)) \
+            <= 1e-12*inf_norm(expected.species_mass[k])
+
+    # Without enough of species 0 (C2H4), no element is active
+    activity.update(temperature, 0*y)
+    assert activity.nactive_elements == 0
+    assert inf_norm(
+        activity.get_species_source_terms(eos, cv, temperature).species_mass) == 0
+
+
+def test_lazy_chemistry_activity(ctx_factory):
+    """Test that a compiled RHS follows updates of the active elements."""
+    from arraycontext import PytatoPyOpenCLArrayContext
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    actx = PytatoPyOpenCLArrayContext(queue)
+
+    dim = 1
+    nel_1d = 8
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(nel_1d,) * dim)
+    dcoll = create_discretization_collection(actx, mesh, order=2)
+
+    mech_input = get_mechanism_input("uiuc_7sp")
+    cantera_soln = cantera.Solution(name="gas", yaml=mech_input)
+    pyro_obj = get_pyrometheus_wrapper_class_from_cantera(cantera_soln)(actx.np)
+    eos = PyrometheusMixture(pyro_obj, temperature_guess=300.)
+    nspecies = pyro_obj.num_species
+
+    cantera_soln.set_equivalence_ratio(phi=1.0, fuel="C2H4:1",
+                                       oxidizer={"O2": 1.0, "N2": 3.76})
+    y0 = cantera_soln.Y
+
+    nodes = actx.thaw(dcoll.nodes())[0]
+    elem_x = op.elementwise_sum(dcoll, "vol", nodes)
+    ones = dcoll.zeros(actx) + 1.
+    temperature = actx.np.where(actx.np.greater(elem_x, 0), 1800.*ones,
+                                300.*ones)
+    y = make_obj_array([y0[k]*ones for k in range(nspecies)])
+    energy = eos.get_internal_energy(temperature, y)
+    cv = make_conserved(dim, mass=ones, energy=energy,
+                        momentum=make_obj_array([0*ones]), species_mass=y)
+    cv, temperature = actx.thaw(actx.freeze((cv, temperature)))
+
+    from mirgecom.chemistry_activity import ChemistryActivity
+    activity = ChemistryActivity(dcoll, temperature_threshold=1000.,
+                                 species_thresholds={0: 1e-3})
+
+    def get_sources(cv, temperature, active_elements):
+        return activity.get_species_source_terms(
+            eos, cv, temperature, active_elements=active_elements)
+
+    compiled_get_sources = actx.compile(get_sources)
+
+    def inf_norm(x):
+        return actx.to_numpy(op.norm(dcoll, x, np.inf))
+
+    expected = eos.get_species_source_terms(cv, temperature)
+    is_hot = actx.np.greater(temperature, 1000.)
+
+    activity.update(temperature, y)
+    assert activity.nactive_elements == nel_1d // 2
+    result = compiled_get_sources(cv, temperature, activity.active_elements)
+    for k in range(nspecies):
+        assert inf_norm(
+            result.species_mass[k]
+            - actx.np.where(is_hot, expected.species_mass[k], 0*ones)) \
+            <= 1e-12*inf_norm(expected.species_mass[k])
+
+    # Without enough of species 0 (C2H4), no element is active
+    activity.update(temperature, 0*y)
+    assert activity.nactive_elements == 0
+    result = compiled_get_sources(cv, temperature, activity.active_elements)
+    assert inf_norm(result.species_mass) == 0
+
+    # Tracing with the stored index arrays captures them, so updating them
+    # afterwards is an error
+    activity.get_species_source_terms(eos, cv, temperature)
+    with pytest.raises(RuntimeError):
+        activity.update(temperature, y)
+
+
+def test_thermochemistry_class_cache(tmp_path):
+    """Test that cached mechanism modules are reused and match the original."""
+    from mirgecom.thermochemistry import (
+        get_thermochemistry_class_by_mechanism_name)
+
+    pyro_obj = get_thermochemistry_class_by_mechanism_name("uiuc_7sp")(np)
+    cached_pyro_obj = get_thermochemistry_class_by_mechanism_name(
+        "uiuc_7sp", cache_dir=str(tmp_path))(np)
+
+    cached_files = list(tmp_path.iterdir())
+    assert len(cached_files) == 1
+
+    # The second call loads the existing module
+    get_thermochemistry_class_by_mechanism_name(
+        "uiuc_7sp", cache_dir=str(tmp_path))
+    assert list(tmp_path.iterdir()) == cached_files
+
+    temperature = 1500.
+    y = np.ones(pyro_obj.num_species)/pyro_obj.num_species
+    assert cached_pyro_obj.species_names == pyro_obj.species_names
+    assert np.isclose(
+        cached_pyro_obj.get_mixture_enthalpy_mass(temperature, y),
+        pyro_obj.get_mixture_enthalpy_mass(temperature, y), rtol=1e-14, atol=0)
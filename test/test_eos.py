@@ -48,7 +48,10 @@ from mirgecom.gas_model import GasModel, make_fluid_state
 from mirgecom.initializers import Vortex2D, Lump, Uniform
 from mirgecom.discretization import create_discretization_collection
 from mirgecom.mechanisms import get_mechanism_input
-from mirgecom.thermochemistry import get_pyrometheus_wrapper_class_from_cantera
+from mirgecom.thermochemistry import (
+    get_pyrometheus_wrapper_class_from_cantera,
+    get_temperature_niter
+)
 
 logger = logging.getLogger(__name__)
 
@@ -359,6 +362,119 @@ def test_pyrometheus_mechanisms(ctx_factory, mechname, output_mechanism=True):
             assert inf_norm(conc[spec]) < 1e-14
 
 
+def test_pyrometheus_temperature_niter(ctx_factory):
+    """Test measuring and overriding the number of temperature iterations."""
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    actx = PyOpenCLArrayContext(queue)
+
+    dim = 1
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(2,) * dim)
+    dcoll = create_discretization_collection(actx, mesh, order=2)
+
+    mech_input = get_mechanism_input("uiuc_7sp")
+    cantera_soln = cantera.Solution(name="gas", yaml=mech_input)
+    nspecies = cantera_soln.n_species
+
+    pyro_class = get_pyrometheus_wrapper_class_from_cantera(
+        cantera_soln, temperature_niter=5)
+
+    niter = 0
+
+    class CountingWrapper(pyro_class):
+        def get_temperature_update(self, *args, **kwargs):
+            nonlocal niter
+            niter += 1
+            return super().get_temperature_update(*args, **kwargs)
+
+    cantera_soln.TPY = 1200., 101325., np.ones(nspecies)/nspecies
+    ones = dcoll.zeros(actx) + 1.0
+    yin = make_obj_array([cantera_soln.Y[i] * ones for i in range(nspecies)])
+    energy = cantera_soln.int_energy_mass * ones
+
+    def temperature_err(temperature):
+        return actx.to_numpy(op.norm(dcoll, temperature - 1200., np.inf))
+
+    max_niter = 20
+    pyro_mechanism = CountingWrapper(actx.np)
+    measured_niter = get_temperature_niter(
+        dcoll, pyro_mechanism, energy, 300.*ones, yin, tol=1e-12,
+        max_niter=max_niter)
+    assert niter == measured_niter
+    assert 1 < measured_niter < max_niter
+
+    # A seed at the solution converges in a single iteration
+    assert get_temperature_niter(
+        dcoll, pyro_mechanism, energy, 1200.*ones, yin, tol=1e-12,
+        max_niter=max_niter) == 1
+
+    # An unreachable tolerance takes the maximum number of iterations
+    assert get_temperature_niter(
+        dcoll, pyro_mechanism, energy, 300.*ones, yin, tol=0.,
+        max_niter=3) == 3
+
+    # The class default and the per-instance override
+    niter = 0
+    temperature = pyro_mechanism.get_temperature(energy, 300.*ones, yin)
+    assert niter == 5
+
+    niter = 0
+    pyro_mechanism = CountingWrapper(actx.np, temperature_niter=measured_niter)
+    temperature = pyro_mechanism.get_temperature(energy, 300.*ones, yin)
+    assert niter == measured_niter
+    assert temperature_err(temperature) < 1e-8
+
+
+@pytest.mark.parametrize("mechname", ["uiuc_7sp", "uiuc_20sp"])
+def test_tabulated_thermo(ctx_factory, mechname):
+    """Test that tabulated thermo reproduces the mechanism's mixture thermo."""
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    actx = PyOpenCLArrayContext(queue)
+
+    dim = 1
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(2,) * dim)
+    dcoll = create_discretization_collection(actx, mesh, order=2)
+
+    def inf_norm(x):
+        return actx.to_numpy(op.norm(dcoll, x, np.inf))
+
+    mech_input = get_mechanism_input(mechname)
+    cantera_soln = cantera.Solution(name="gas", yaml=mech_input)
+    pyro_class = get_pyrometheus_wrapper_class_from_cantera(
+        cantera_soln, temperature_niter=10)
+
+    from mirgecom.thermochemistry import get_tabulated_thermo_wrapper_class
+    pyro_mechanism = pyro_class(actx.np)
+    tabulated_mechanism = get_tabulated_thermo_wrapper_class(pyro_class)(actx.np)
+
+    nspecies = pyro_mechanism.num_species
+    nodes = actx.thaw(dcoll.nodes())[0]
+    ones = dcoll.zeros(actx) + 1.0
+    temperature = 1000. + 1800.*nodes
+    y = make_obj_array([1. + k*(nodes + 0.5) for k in range(nspecies)])
+    y = y/sum(y)
+
+    for func_name in ["get_mixture_specific_heat_cp_mass",
+                      "get_mixture_specific_heat_cv_mass",
+                      "get_mixture_enthalpy_mass",
+                      "get_mixture_internal_energy_mass"]:
+        expected = getattr(pyro_mechanism, func_name)(temperature, y)
+        result = getattr(tabulated_mechanism, func_name)(temperature, y)
+        assert inf_norm(result - expected) < 1e-9*inf_norm(expected)
+
+    energy = pyro_mechanism.get_mixture_internal_energy_mass(temperature, y)
+    tabulated_temperature = tabulated_mechanism.get_temperature(
+        energy, 1100.*ones, y)
+    assert inf_norm(tabulated_temperature - temperature) < 1e-8
+
+    with pytest.raises(ValueError):
+        get_tabulated_thermo_wrapper_class(
+            pyro_class, temperature_breakpoints=(200., 3500.))
+
+
 @pytest.mark.parametrize("mechname", ["uiuc_7sp", "sandiego"])
 @pytest.mark.parametrize("dim", [1, 2, 3])
 @pytest.mark.parametrize("y0", [0, 1])
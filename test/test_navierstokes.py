@@ -732,6 +732,192 @@ def test_shear_flow(actx_factory, dim, flow_direction, order):
     assert eoc_energy.order_estimate() >= expected_eoc
 
 
+@pytest.mark.parametrize("order", [1, 2])
+def test_operator_context(actx_factory, order):
+    """Test that the NS operator reuses the data of an operator context."""
+    actx = actx_factory()
+    dim = 2
+
+    eos = IdealSingleGas(gamma=3/2, gas_const=287.0)
+    transport = SimpleTransport(viscosity=.01, thermal_conductivity=.1)
+    gas_model = GasModel(eos=eos, transport=transport)
+
+    from mirgecom.initializers import ShearFlow as ExactShearFlow
+    exact_soln = ExactShearFlow(dim=dim, flow_dir=0, trans_dir=1)
+
+    def _boundary_state_func(dcoll, dd_bdry, gas_model, state_minus, time=0,
+                             **kwargs):
+        actx = state_minus.array_context
+        nodes = actx.thaw(dcoll.discr_from_dd(dd_bdry).nodes())
+        return make_fluid_state(exact_soln(x_vec=nodes), gas_model)
+
+    boundaries = {
+        BTAG_ALL:
+        PrescribedFluidBoundary(boundary_state_func=_boundary_state_func)
+    }
+
+    mesh = get_box_mesh(dim, (0,)*dim, (1,)*dim, n=(4,)*dim)
+    dcoll = create_discretization_collection(actx, mesh, order)
+    nodes = actx.thaw(dcoll.nodes())
+
+    # perturb the exact solution to get nonzero RHS and gradients
+    cv = exact_soln(x_vec=nodes)
+    cv = cv.replace(energy=cv.energy*(1 + 0.1*actx.np.sin(np.pi*nodes[0])))
+    fluid_state = make_fluid_state(cv=cv, gas_model=gas_model)
+
+    rhs, grad_cv, grad_t = ns_operator(
+        dcoll, gas_model=gas_model, state=fluid_state, boundaries=boundaries,
+        return_gradients=True)
+
+    from mirgecom.navierstokes import FluidOperatorContext
+    op_ctx = FluidOperatorContext(dcoll, gas_model, fluid_state, boundaries)
+    ctx_rhs, ctx_grad_cv, ctx_grad_t = ns_operator(
+        dcoll, gas_model=gas_model, state=fluid_state, boundaries=boundaries,
+        return_gradients=True, operator_context=op_ctx)
+
+    # the gradients are computed once, and kept by the context
+    assert ctx_grad_cv is op_ctx.grad_cv
+    assert ctx_grad_t is op_ctx.grad_t
+
+    def inf_norm(x):
+        from arraycontext import flatten
+        return np.max(actx.to_numpy(
+            flatten(componentwise_norms(dcoll, x, np.inf), actx)))
+
+    tol = 1e-12
+    assert inf_norm(ctx_rhs - rhs) < tol*inf_norm(rhs)
+    assert inf_norm(ctx_grad_cv - grad_cv) < tol*inf_norm(grad_cv)
+    assert inf_norm(ctx_grad_t - grad_t) < tol*inf_norm(grad_t)
+
+    with pytest.raises(ValueError):
+        ns_operator(dcoll, gas_model=gas_model, state=fluid_state,
+                    boundaries=boundaries, operator_context=op_ctx,
+                    grad_cv=grad_cv)
+
+    # a context for another state must not be used
+    other_state = make_fluid_state(cv=exact_soln(x_vec=nodes),
+                                   gas_model=gas_model)
+    with pytest.raises(ValueError):
+        ns_operator(dcoll, gas_model=gas_model, state=other_state,
+                    boundaries=boundaries, operator_context=op_ctx)
+    with pytest.raises(ValueError):
+        ns_operator(dcoll, gas_model=gas_model, state=fluid_state,
+                    boundaries=boundaries, operator_context=op_ctx,
+                    comm_tag="other")
+    with pytest.raises(ValueError):
+        ns_operator(dcoll, gas_model=gas_model, state=fluid_state,
+                    boundaries=boundaries, operator_context=op_ctx, time=1.0)
+
+    from mirgecom.artificial_viscosity import av_laplacian_operator
+    with pytest.raises(ValueError):
+        av_laplacian_operator(dcoll, boundaries, other_state, alpha=1.,
+                              gas_model=gas_model, operator_context=op_ctx)
+    with pytest.raises(ValueError):
+        ns_operator(dcoll, gas_model=gas_model, state=fluid_state,
+                    boundaries=boundaries, operator_context=op_ctx,
+                    limiter_func=lambda cv, **kwargs: cv)
+
+    # the gradients of the context used a different numerical flux
+    from mirgecom.flux import num_flux_central
+
+    def other_gradient_flux(f_minus_normal, f_plus_normal):
+        return num_flux_central(f_minus_normal, f_plus_normal)
+
+    with pytest.raises(ValueError):
+        ns_operator(dcoll, gas_model=gas_model, state=fluid_state,
+                    boundaries=boundaries, operator_context=op_ctx,
+                    gradient_numerical_flux_func=other_gradient_flux)
+
+
+@pytest.mark.parametrize("order", [1, 2])
+def test_operator_context_quadrature(actx_factory, order):
+    """Test sharing an operator context between the NS and AV operators."""
+    actx = actx_factory()
+    dim = 2
+
+    eos = IdealSingleGas(gamma=3/2, gas_const=287.0)
+    transport = SimpleTransport(viscosity=.01, thermal_conductivity=.1)
+    gas_model = GasModel(eos=eos, transport=transport)
+
+    from mirgecom.initializers import ShearFlow as ExactShearFlow
+    exact_soln = ExactShearFlow(dim=dim, flow_dir=0, trans_dir=1)
+
+    def _boundary_state_func(dcoll, dd_bdry, gas_model, state_minus, time=0,
+                             **kwargs):
+        actx = state_minus.array_context
+        nodes = actx.thaw(dcoll.discr_from_dd(dd_bdry).nodes())
+        return make_fluid_state(exact_soln(x_vec=nodes), gas_model)
+
+    boundaries = {
+        BTAG_ALL:
+        PrescribedFluidBoundary(boundary_state_func=_boundary_state_func)
+    }
+
+    mesh = get_box_mesh(dim, (0,)*dim, (1,)*dim, n=(4,)*dim)
+    dcoll = create_discretization_collection(actx, mesh, order,
+                                             quadrature_order=2*order+1)
+    nodes = actx.thaw(dcoll.nodes())
+
+    from grudge.dof_desc import DISCR_TAG_QUAD
+    quadrature_tag = DISCR_TAG_QUAD
+
+    cv = exact_soln(x_vec=nodes)
+    cv = cv.replace(energy=cv.energy*(1 + 0.1*actx.np.sin(np.pi*nodes[0])))
+    fluid_state = make_fluid_state(cv=cv, gas_model=gas_model)
+
+    from mirgecom.artificial_viscosity import av_laplacian_operator
+    indicator = 1 + 0*nodes[0]
+
+    ns_rhs = ns_operator(
+        dcoll, gas_model=gas_model, state=fluid_state, boundaries=boundaries,
+        quadrature_tag=quadrature_tag)
+    av_rhs = av_laplacian_operator(
+        dcoll, boundaries, fluid_state, alpha=1e-2, gas_model=gas_model,
+        quadrature_tag=quadrature_tag, indicator=indicator)
+
+    from mirgecom.navierstokes import FluidOperatorContext
+    op_ctx = FluidOperatorContext(dcoll, gas_model, fluid_state, boundaries,
+                                  quadrature_tag=quadrature_tag)
+    ctx_ns_rhs = ns_operator(
+        dcoll, gas_model=gas_model, state=fluid_state, boundaries=boundaries,
+        quadrature_tag=quadrature_tag, operator_context=op_ctx)
+    ctx_av_rhs = av_laplacian_operator(
+        dcoll, boundaries, fluid_state, alpha=1e-2, gas_model=gas_model,
+        quadrature_tag=quadrature_tag, indicator=indicator,
+        operator_context=op_ctx)
+
+    def inf_norm(x):
+        from arraycontext import flatten
+        return np.max(actx.to_numpy(
+            flatten(componentwise_norms(dcoll, x, np.inf), actx)))
+
+    tol = 1e-12
+    assert inf_norm(ctx_ns_rhs - ns_rhs) < tol*inf_norm(ns_rhs)
+    assert inf_norm(ctx_av_rhs - av_rhs) < tol*inf_norm(av_rhs)
+
+    # the AV operator must not be given the base discretization
+    with pytest.raises(ValueError):
+        av_laplacian_operator(
+            dcoll, boundaries, fluid_state, alpha=1e-2, gas_model=gas_model,
+            indicator=indicator, operator_context=op_ctx)
+
+    # None denotes the base discretization
+    from grudge.dof_desc import DISCR_TAG_BASE
+    base_ctx = FluidOperatorContext(dcoll, gas_model, fluid_state, boundaries,
+                                    quadrature_tag=None)
+    assert base_ctx.quadrature_tag == DISCR_TAG_BASE
+    base_ctx.check_consistent(
+        fluid_state, boundaries, time=0.0, quadrature_tag=DISCR_TAG_BASE,
+        dd=base_ctx.dd, comm_tag=None)
+    op_ctx.check_consistent(
+        fluid_state, boundaries, time=0.0, quadrature_tag=quadrature_tag,
+        dd=op_ctx.dd, comm_tag=None)
+    with pytest.raises(ValueError):
+        op_ctx.check_consistent(
+            fluid_state, boundaries, time=0.0, quadrature_tag=None,
+            dd=op_ctx.dd, comm_tag=None)
+
+
 class RoySolution(FluidManufacturedSolution):
     """CNS manufactured solution from [Roy_2017]__."""
 
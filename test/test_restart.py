@@ -39,7 +39,8 @@ logger = logging.getLogger(__name__)
 
 
 @pytest.mark.parametrize("nspecies", [0, 10])
-def test_restart_cv(actx_factory, nspecies):
+@pytest.mark.parametrize("binary", [False, True])
+def test_restart_cv(actx_factory, nspecies, binary):
     """Test that restart can read a CV array container."""
     actx = actx_factory()
     nel_1d = 4
@@ -61,7 +62,7 @@ def test_restart_cv(actx_factory, nspecies):
         mass_fractions = make_obj_array([i*nodes[0] for i in range(nspecies)])
         species_mass = mass * mass_fractions
 
-    rst_filename = f"test_{nspecies}.pkl"
+    rst_filename = f"test_{nspecies}_{binary}.pkl"
 
     from mirgecom.fluid import make_conserved
     test_state = make_conserved(dim, mass=mass, energy=energy, momentum=mom,
@@ -69,7 +70,10 @@ def test_restart_cv(actx_factory, nspecies):
 
     rst_data = {"state": test_state}
     from mirgecom.restart import write_restart_file
-    write_restart_file(actx, rst_data, rst_filename)
+    write_restart_file(actx, rst_data, rst_filename, binary=binary)
+
+    from mirgecom.restart import is_binary_restart_file
+    assert is_binary_restart_file(rst_filename) == binary
 
     from mirgecom.restart import read_restart_data
     restart_data = read_restart_data(actx, rst_filename)
@@ -77,3 +81,113 @@ def test_restart_cv(actx_factory, nspecies):
     resid = test_state - restart_data["state"]
     from mirgecom.simutil import max_component_norm
     assert max_component_norm(dcoll, resid, np.inf) == 0
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_async_restart_writer(actx_factory, binary):
+    """Test that restart files written in the background can be read back."""
+    actx = actx_factory()
+    dim = 2
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(4,) * dim
+    )
+    dcoll = create_discretization_collection(actx, mesh, order=2)
+    nodes = actx.thaw(dcoll.nodes())
+
+    from mirgecom.restart import AsyncRestartWriter, read_restart_data
+    from mirgecom.simutil import max_component_norm
+
+    with AsyncRestartWriter(max_pending=2) as writer:
+        for step in range(3):
+            field = (step + 1)*nodes[0]
+            writer.write_restart_file(
+                actx, {"field": field, "step": step},
+                f"test_async_{binary}_{step}.pkl", binary=binary)
+        writer.flush()
+
+        for step in range(3):
+            restart_data = read_restart_data(
+                actx, f"test_async_{binary}_{step}.pkl")
+            assert restart_data["step"] == step
+            resid = restart_data["field"] - (step + 1)*nodes[0]
+            assert max_component_norm(dcoll, resid, np.inf) == 0
+
+
+def test_repartitioned_restart(actx_factory):
+    """Test reading restart data written on a different partition."""
+    actx = actx_factory()
+    dim = 2
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(4,) * dim
+    )
+    dcoll = create_discretization_collection(actx, mesh, order=2)
+    nodes = actx.thaw(dcoll.nodes())
+
+    from mirgecom.fluid import make_conserved
+    cv = make_conserved(dim, mass=1 + nodes[0]**2, energy=2 + nodes[1],
+                        momentum=nodes)
+
+    # Write the state as if it had been computed on two ranks, each owning
+    # every other element
+    from meshmode.dof_array import DOFArray
+    from mirgecom.restart import write_restart_file
+
+    def restrict(ary, elements):
+        return DOFArray(actx, (actx.from_numpy(actx.to_numpy(ary[0])[elements]),))
+
+    rst_pattern = "test_repart-{rank:04d}.pkl"
+    for rank in range(2):
+        elements = np.arange(rank, mesh.nelements, 2)
+        rank_cv = make_conserved(
+            dim, mass=restrict(cv.mass, elements),
+            energy=restrict(cv.energy, elements),
+            momentum=make_obj_array([restrict(mom_i, elements)
+                                     for mom_i in cv.momentum]))
+        write_restart_file(
+            actx, {"cv": rank_cv, "t": 1.5, "global_element_ids": elements},
+            rst_pattern.format(rank=rank), binary=True)
+
+    from mirgecom.restart import read_repartitioned_restart_data
+    restart_data = read_repartitioned_restart_data(
+        actx, rst_pattern, mesh, np.arange(mesh.nelements))
+
+    assert restart_data["t"] == 1.5
+    from mirgecom.simutil import max_component_norm
+    assert max_component_norm(dcoll, restart_data["cv"] - cv, np.inf) == 0
+
+
+@pytest.mark.parametrize("tolerance", [None, 1e-8])
+def test_delta_restart(actx_factory, tolerance):
+    """Test that full and delta restart files restore the written state."""
+    actx = actx_factory()
+    dim = 2
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(4,) * dim
+    )
+    dcoll = create_discretization_collection(actx, mesh, order=2)
+    nodes = actx.thaw(dcoll.nodes())
+
+    from mirgecom.restart import DeltaRestartWriter, read_restart_data
+    from mirgecom.simutil import max_component_norm
+
+    writer = DeltaRestartWriter(full_interval=2, tolerance=tolerance)
+    fields = []
+    for step in range(4):
+        fields.append(nodes[0] + 1e-3*step*nodes[1]**2)
+        writer.write_restart_file(
+            actx, {"field": fields[-1], "local_mesh": mesh, "step": step},
+            f"test_delta_{tolerance}_{step}.pkl")
+
+    for step in range(4):
+        restart_data = read_restart_data(actx, f"test_delta_{tolerance}_{step}.pkl")
+        assert restart_data["step"] == step
+        assert np.all(restart_data["local_mesh"].vertices == mesh.vertices)
+        err = max_component_norm(dcoll, restart_data["field"] - fields[step],
+                                 np.inf)
+        if tolerance is None:
+            assert err == 0
+        else:
+            assert err <= 1.01*tolerance
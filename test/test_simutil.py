@@ -104,6 +104,51 @@ def test_basic_cfd_healthcheck(actx_factory):
                                  max_value=np.inf)
 
 
+def test_deferred_timestep_reduction(actx_factory):
+    """Test that the deferred reduction reuses and updates the timestep size."""
+    actx = actx_factory()
+    dim = 2
+
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(
+        a=(1.0,) * dim, b=(2.0,) * dim, nelements_per_axis=(4,) * dim)
+    dcoll = create_discretization_collection(actx, mesh, order=2)
+    zeros = dcoll.zeros(actx)
+
+    from mirgecom.gas_model import GasModel, make_fluid_state
+    from mirgecom.transport import SimpleTransport
+    gas_model = GasModel(eos=IdealSingleGas(),
+                         transport=SimpleTransport(viscosity=1e-3))
+
+    from pytools.obj_array import make_obj_array
+
+    def make_state(speed):
+        momentum = make_obj_array([zeros + speed, zeros])
+        cv = make_conserved(dim, mass=zeros + 1., momentum=momentum,
+                            energy=zeros + 2.5 + .5*speed**2)
+        return make_fluid_state(cv, gas_model)
+
+    from mirgecom.simutil import get_sim_timestep, DeferredTimestepReduction
+    slow_state = make_state(0.)
+    fast_state = make_state(10.)
+    slow_dt = get_sim_timestep(dcoll, slow_state, t=0., dt=0., cfl=1.,
+                               t_final=1., constant_cfl=True)
+    fast_dt = get_sim_timestep(dcoll, fast_state, t=0., dt=0., cfl=1.,
+                               t_final=1., constant_cfl=True)
+    assert fast_dt < slow_dt
+
+    reduction = DeferredTimestepReduction(interval=2, safety_factor=0.5)
+
+    def get_dt(state):
+        return get_sim_timestep(dcoll, state, t=0., dt=0., cfl=1., t_final=1.,
+                                constant_cfl=True, timestep_reduction=reduction)
+
+    assert np.isclose(get_dt(slow_state), slow_dt)
+    assert np.isclose(get_dt(fast_state), 0.5*slow_dt)
+    assert np.isclose(get_dt(fast_state), 0.5*fast_dt)
+    assert np.isclose(get_dt(slow_state), 0.5*fast_dt)
+
+
 def test_analytic_comparison(actx_factory):
     """Quick test of state comparison routine."""
     from mirgecom.initializers import Vortex2D
@@ -142,3 +187,229 @@ def test_analytic_comparison(actx_factory):
 
     errors = compare_fluid_solutions(dcoll, cv, vortex_soln)
     assert errors == expected_errors
+
+
+@pytest.mark.parametrize("nranks_per_axis", [(4, 1), (2, 3), (2, 2, 2)])
+@pytest.mark.parametrize("auto_balance", [False, True])
+def test_geometric_mesh_partitioner(nranks_per_axis, auto_balance):
+    """Check that the multi-axis geometric partitioner balances a box mesh."""
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    from mirgecom.simutil import geometric_mesh_partitioner
+
+    dim = len(nranks_per_axis)
+    nel_1d = 12
+    mesh = generate_regular_rect_mesh(
+        a=(0,)*dim, b=(1,)*dim, nelements_per_axis=(nel_1d,)*dim)
+
+    elem_to_rank = geometric_mesh_partitioner(
+        mesh, nranks_per_axis=nranks_per_axis, auto_balance=auto_balance)
+
+    num_ranks = np.prod(nranks_per_axis)
+    nelem_part = np.bincount(elem_to_rank, minlength=num_ranks)
+    assert len(nelem_part) == num_ranks
+    assert np.all(nelem_part == mesh.nelements // num_ranks)
+
+
+def test_geometric_mesh_partitioner_weights():
+    """Check that the geometric partitioner balances weighted elements."""
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    from mirgecom.simutil import geometric_mesh_partitioner
+
+    mesh = generate_regular_rect_mesh(
+        a=(0, 0), b=(1, 1), nelements_per_axis=(16, 16))
+
+    from mirgecom.simutil import _get_element_centroids
+    centroids = _get_element_centroids(mesh)
+    element_weights = np.where(centroids[0] < 0.5, 3., 1.)
+
+    elem_to_rank = geometric_mesh_partitioner(
+        mesh, nranks_per_axis=(4, 2), auto_balance=True,
+        element_weights=element_weights)
+
+    weight_part = np.bincount(elem_to_rank, weights=element_weights)
+    aver_part_weight = np.sum(element_weights) / 8
+    assert np.max(np.abs(weight_part - aver_part_weight)) <= 3
+
+
+def test_partition_cache(tmp_path):
+    """Check that cached partitions are reused and invalidated."""
+    from mpi4py import MPI
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    from mirgecom.simutil import distribute_mesh
+
+    comm = MPI.COMM_WORLD
+    cache_dir = str(tmp_path / "cache")
+    mesh_file = tmp_path / "mesh.txt"
+
+    npartitions = 0
+    nmesh_reads = 0
+
+    def partition_generator_func(mesh, tag_to_elements, num_ranks,
+                                 element_weights=None):
+        nonlocal npartitions
+        npartitions += 1
+        return np.zeros(mesh.nelements, dtype=np.int32)
+
+    def get_mesh_data():
+        nonlocal nmesh_reads
+        nmesh_reads += 1
+        nel_1d = int(mesh_file.read_text())
+        return generate_regular_rect_mesh(
+            a=(0, 0), b=(1, 1), nelements_per_axis=(nel_1d, nel_1d))
+
+    def distribute(nel_1d, element_weights=None, use_key=True):
+        mesh_file.write_text(str(nel_1d))
+        local_mesh, global_nelements = distribute_mesh(
+            comm, get_mesh_data,
+            partition_generator_func=partition_generator_func,
+            partition_cache_dir=cache_dir,
+            partition_cache_key=(str(mesh_file),) if use_key else None,
+            element_weights=element_weights)
+        assert global_nelements == 2*nel_1d**2
+        assert local_mesh.nelements == 2*nel_1d**2
+        return local_mesh
+
+    mesh = distribute(4)
+    assert (npartitions, nmesh_reads) == (1, 1)
+
+    # Loaded from the cache without reading the mesh
+    cached_mesh = distribute(4)
+    assert (npartitions, nmesh_reads) == (1, 1)
+    assert np.array_equal(cached_mesh.vertices, mesh.vertices)
+
+    # A changed mesh file or different weights invalidate the entry
+    distribute(5)
+    assert (npartitions, nmesh_reads) == (2, 2)
+    distribute(4, element_weights=np.ones(32))
+    assert (npartitions, nmesh_reads) == (3, 3)
+    distribute(4, element_weights=2*np.ones(32))
+    assert (npartitions, nmesh_reads) == (4, 4)
+
+    # Previous entries are still valid
+    distribute(5)
+    assert (npartitions, nmesh_reads) == (4, 4)
+    assert len(list((tmp_path / "cache").iterdir())) == 4
+
+    # Without a key, the mesh is read and identifies the entry
+    distribute(4, use_key=False)
+    assert (npartitions, nmesh_reads) == (5, 5)
+    distribute(4, use_key=False)
+    assert (npartitions, nmesh_reads) == (5, 6)
+    distribute(5, use_key=False)
+    assert (npartitions, nmesh_reads) == (6, 7)
+
+
+def test_distribute_mesh_element_weights():
+    """Check that per-volume element weights reach the partitioner."""
+    from mpi4py import MPI
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    from mirgecom.simutil import distribute_mesh, _get_element_centroids
+
+    mesh = generate_regular_rect_mesh(
+        a=(0, 0), b=(1, 1), nelements_per_axis=(4, 4))
+    is_left = _get_element_centroids(mesh)[0] < 0.5
+    tag_to_elements = {
+        "left": np.where(is_left)[0],
+        "right": np.where(~is_left)[0]}
+    volume_to_tags = {"fluid": ["left"], "wall": ["right"]}
+
+    def get_mesh_data():
+        return mesh, tag_to_elements, volume_to_tags
+
+    received_weights = []
+
+    def weighted_partition_generator_func(mesh, tag_to_elements, num_ranks,
+                                          element_weights):
+        received_weights.append(element_weights)
+        return np.zeros(mesh.nelements, dtype=np.int32)
+
+    def partition_generator_func(mesh, tag_to_elements, num_ranks):
+        return np.zeros(mesh.nelements, dtype=np.int32)
+
+    comm = MPI.COMM_WORLD
+    local_mesh_data, global_nelements = distribute_mesh(
+        comm, get_mesh_data,
+        partition_generator_func=weighted_partition_generator_func,
+        element_weights={"fluid": 3., "wall": 1.})
+    assert global_nelements == mesh.nelements
+    assert set(local_mesh_data.keys()) == {"fluid", "wall"}
+    assert len(received_weights) == 1
+    assert np.array_equal(received_weights[0], np.where(is_left, 3., 1.))
+
+    # Partitioners are only passed weights if there are any
+    distribute_mesh(
+        comm, get_mesh_data, partition_generator_func=partition_generator_func)
+
+    with pytest.raises(ValueError):
+        distribute_mesh(
+            comm, get_mesh_data,
+            partition_generator_func=weighted_partition_generator_func,
+            element_weights={"fluid": 3.})
+
+
+def test_profile_volume_element_costs(ctx_factory):
+    """Check the per-element costs measured by the profiler."""
+    import pyopencl as cl
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    from grudge import op
+    from mirgecom.profiling import PyOpenCLProfilingArrayContext
+    from mirgecom.simutil import profile_volume_element_costs
+
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(
+        cl_ctx, properties=cl.command_queue_properties.PROFILING_ENABLE)
+    actx = PyOpenCLProfilingArrayContext(queue)
+
+    mesh = generate_regular_rect_mesh(
+        a=(0, 0), b=(1, 1), nelements_per_axis=(4, 4))
+    dcoll = create_discretization_collection(actx, mesh, order=2)
+    u = actx.thaw(dcoll.nodes())[0]
+
+    ncalls = 0
+
+    def cost_func():
+        nonlocal ncalls
+        ncalls += 1
+        return op.local_grad(dcoll, u)
+
+    volume_to_cost = profile_volume_element_costs(
+        actx, {"fluid": cost_func}, {"fluid": mesh.nelements}, nrepeats=3)
+    assert ncalls == 4
+    assert volume_to_cost["fluid"] > 0
+
+    # The profiling data is consumed
+    assert actx.get_total_kernel_time() == 0
+
+    op.local_grad(dcoll, u)
+    assert actx.get_total_kernel_time() > 0
+    actx.reset_profiling_data()
+    assert actx.get_total_kernel_time() == 0
+
+    from arraycontext import PyOpenCLArrayContext
+    with pytest.raises(TypeError):
+        profile_volume_element_costs(
+            PyOpenCLArrayContext(queue), {"fluid": cost_func},
+            {"fluid": mesh.nelements})
+
+
+def test_partition_report():
+    """Check the partition report for a box mesh split in halves."""
+    from meshmode.mesh import TensorProductElementGroup
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    from mirgecom.simutil import get_partition_report, _get_element_centroids
+
+    dim = 2
+    order = 2
+    mesh = generate_regular_rect_mesh(
+        a=(0, 0), b=(1, 1), nelements_per_axis=(4, 4),
+        group_cls=TensorProductElementGroup)
+    rank_per_element = (_get_element_centroids(mesh)[0] > 0.5).astype(int)
+
+    report = get_partition_report(mesh, rank_per_element, order=order,
+                                  viscous=False)
+
+    assert np.all(report["nelements"] == 8)
+    assert np.all(report["nfaces_shared"] == 4)
+    assert np.all(report["nneighbors"] == 1)
+    assert np.all(report["nbytes_sent"] == 8*4*(order+1)*(dim+2))
+    assert report["element_imbalance"] == 0
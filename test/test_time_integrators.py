@@ -34,8 +34,13 @@ from meshmode.array_context import (  # noqa
 
 from mirgecom.integrators import (
     euler_step, lsrk54_step, lsrk144_step,
-    rk4_step, ssprk43_step
+    rk4_step, ssprk43_step,
+    bogacki_shampine32_step, dormand_prince54_step,
+    PIStepSizeController, ros2_step, strang_split_step,
+    multirate_step
 )
+from mirgecom.integrators.rosenbrock import finite_difference_jacobian
+from mirgecom.steppers import advance_state
 
 logger = logging.getLogger(__name__)
 
@@ -136,6 +141,425 @@ def test_state_advancer(integrator, method_order, local_dt):
     assert integrator_eoc.order_estimate() >= method_order - .01
 
 
+@pytest.mark.parametrize("integrator", [euler_step, lsrk54_step, lsrk144_step])
+def test_lsrk_in_place(integrator):
+    """Test that the in-place LSRK update matches the out-of-place one."""
+    from pytools.obj_array import make_obj_array
+    from mirgecom.integrators.lsrk import get_lsrk_storage_nbytes
+
+    def rhs(t, state):
+        return make_obj_array([-state[0] + np.cos(t), state[0] - 2*state[1]])
+
+    def make_state():
+        shared = np.linspace(1., 2., 10)
+        # Aliased components must be updated independently
+        return make_obj_array([shared, shared])
+
+    state = make_state()
+    in_place_state = make_state()
+    input_array = in_place_state[0]
+
+    dt = 0.1
+    for istep in range(5):
+        state = integrator(state, istep*dt, dt, rhs)
+        in_place_state = integrator(in_place_state, istep*dt, dt, rhs,
+                                    in_place=True)
+
+    assert in_place_state[0] is input_array
+    for i in range(2):
+        assert np.allclose(in_place_state[i], state[i], rtol=1e-14, atol=0)
+
+    assert get_lsrk_storage_nbytes(state) == 3*2*10*8
+    assert get_lsrk_storage_nbytes(state, in_place=False) == 5*2*10*8
+
+
+@pytest.mark.parametrize("compile_timestepper", [False, True])
+def test_state_advancer_post_step_filter(compile_timestepper):
+    """Test that the post-step filter is applied after every step."""
+
+    def rhs(t, state):
+        return -state
+
+    def post_step_filter(state):
+        return np.maximum(state, 0.5)
+
+    dt = 0.1
+    t_final = 2.
+
+    _, t, state = advance_state(
+        rhs=rhs, timestepper=rk4_step, state=np.float64(1.), t=0.,
+        t_final=t_final, dt=dt, force_eval=False,
+        compile_timestepper=compile_timestepper,
+        post_step_filter=post_step_filter)
+
+    assert np.isclose(t, t_final)
+    assert state == 0.5
+
+
+@pytest.mark.parametrize("istep", [0, 2])
+def test_state_advancer_steps_per_call(istep):
+    """Test that taking multiple steps per call matches single steps."""
+
+    def rhs(t, state):
+        return -state + np.sin(t)
+
+    callback_steps = []
+
+    def post_step_callback(state, step, t, dt):
+        callback_steps.append(step)
+        return state, dt
+
+    dt = 0.1
+    t_final = 2.3
+
+    results = [
+        advance_state(
+            rhs=rhs, timestepper=rk4_step, state=np.float64(1.), t=istep*dt,
+            t_final=t_final, dt=dt, istep=istep, force_eval=False,
+            compile_timestepper=True, steps_per_call=steps_per_call,
+            post_step_callback=post_step_callback)
+        for steps_per_call in [1, 4]]
+
+    (step, t, state), (step_multi, t_multi, state_multi) = results
+    assert step == step_multi
+    assert np.isclose(t, t_multi)
+    assert np.isclose(state, state_multi)
+
+    nsteps = step - istep
+    multi_callback_steps = [istep] + callback_steps[nsteps:]
+    assert len(multi_callback_steps) < nsteps
+    # Multiple steps are only taken between multiples of steps_per_call
+    assert all(
+        prev_step % 4 == 0 and step == prev_step + 4
+        for prev_step, step in zip(multi_callback_steps[:-1],
+                                   multi_callback_steps[1:])
+        if step - prev_step > 1)
+
+
+@pytest.mark.parametrize("max_retries", [1, 3])
+def test_state_advancer_rollback(max_retries):
+    """Test that failed steps are rolled back and retried with a smaller dt."""
+    from mirgecom.steppers import RollbackBuffer
+    from mirgecom.simutil import SimulationRuntimeError
+
+    def rhs(t, state):
+        return -state
+
+    def health_check(state, step, t, dt):
+        return state < 0
+
+    # Euler steps only keep the solution positive for dt < 1
+    rollback_buffer = RollbackBuffer(health_check, nstates=2,
+                                     max_retries=max_retries,
+                                     recovery_saves=None)
+    dt = 2.5
+    t_final = 10.
+
+    if max_retries < 2:
+        with pytest.raises(SimulationRuntimeError):
+            advance_state(
+                rhs=rhs, timestepper=euler_step, state=np.float64(1.), t=0.,
+                t_final=t_final, dt=dt, force_eval=False,
+                rollback_buffer=rollback_buffer)
+        return
+
+    istep, t, state = advance_state(
+        rhs=rhs, timestepper=euler_step, state=np.float64(1.), t=0.,
+        t_final=t_final, dt=dt, force_eval=False,
+        rollback_buffer=rollback_buffer)
+
+    assert rollback_buffer.dt_factor == 0.25
+    assert istep == 16
+    assert np.isclose(t, t_final)
+    assert np.isclose(state, (1 - 0.625)**16)
+
+
+def test_state_advancer_rollback_steps_per_call():
+    """Test that the rollback interval must match the steps per call."""
+    from mirgecom.steppers import RollbackBuffer
+
+    def rhs(t, state):
+        return -state
+
+    def health_check(state, step, t, dt):
+        return state < 0
+
+    def advance(interval):
+        return advance_state(
+            rhs=rhs, timestepper=rk4_step, state=np.float64(1.), t=0.,
+            t_final=1., dt=0.1, force_eval=False, compile_timestepper=True,
+            steps_per_call=4,
+            rollback_buffer=RollbackBuffer(health_check, interval=interval))
+
+    for interval in [3, 6]:
+        with pytest.raises(ValueError):
+            advance(interval)
+
+    _, t, state = advance(8)
+    assert np.isclose(state, np.exp(-t), rtol=1e-5)
+
+
+def test_state_advancer_rollback_recovery():
+    """Test that the timestep size recovers after a transient failure."""
+    from mirgecom.steppers import RollbackBuffer
+
+    def rhs(t, state):
+        return 0*state + 1
+
+    failed_steps = []
+
+    def health_check(state, step, t, dt):
+        # fail once, at step 3
+        if step == 3 and not failed_steps:
+            failed_steps.append(step)
+            return True
+        return False
+
+    dt_factors = []
+
+    def post_step(step, t, dt, state):
+        dt_factors.append(rollback_buffer.dt_factor)
+        return state, dt
+
+    rollback_buffer = RollbackBuffer(health_check, nstates=2, dt_backoff=0.5,
+                                     recovery_saves=4)
+    istep, t, state = advance_state(
+        rhs=rhs, timestepper=euler_step, state=np.float64(0.), t=0.,
+        t_final=10., dt=0.5, force_eval=False,
+        post_step_callback=post_step, rollback_buffer=rollback_buffer)
+
+    assert failed_steps == [3]
+    assert 0.5 in dt_factors
+    # back to the original timestep size after 4 healthy saves
+    assert rollback_buffer.dt_factor == 1.
+    assert dt_factors[-1] == 1.
+    assert np.isclose(t, 10.)
+    assert np.isclose(state, t)
+
+
+@pytest.mark.parametrize(("integrator", "method_order"),
+                         [(bogacki_shampine32_step, 3),
+                          (dormand_prince54_step, 5)])
+def test_embedded_integrator_order(integrator, method_order):
+    """Test that embedded time integrators have the correct order."""
+
+    def exact_soln(t):
+        return np.exp(-t)
+
+    def rhs(t, state):
+        return -state
+
+    from pytools.convergence import EOCRecorder
+    integrator_eoc = EOCRecorder()
+    error_estimate_eoc = EOCRecorder()
+
+    dt = 1.0
+    max_steps = 5
+
+    for refine in [1, 2, 4, 8]:
+        dt = dt / refine
+        t = 0
+        state = exact_soln(t)
+
+        if refine > 1:
+            _, error_estimate = integrator(state, t, dt, rhs)
+            error_estimate_eoc.add_data_point(dt, np.abs(error_estimate))
+
+        for _ in range(max_steps):
+            state, _ = integrator(state, t, dt, rhs)
+            t = t + dt
+
+        error = np.abs(state - exact_soln(t)) / exact_soln(t)
+        integrator_eoc.add_data_point(dt, error)
+
+    logger.info(f"Time Integrator EOC:\n = {integrator_eoc}")
+    assert integrator_eoc.order_estimate() >= method_order - .01
+    # The local error estimate is of the order of the embedded method plus one
+    assert error_estimate_eoc.order_estimate() >= method_order - .5
+
+
+@pytest.mark.parametrize(("integrator", "error_order"),
+                         [(bogacki_shampine32_step, 2),
+                          (dormand_prince54_step, 4)])
+def test_adaptive_state_advancer(integrator, error_order):
+    """Test that adaptive time stepping meets the requested tolerance."""
+
+    def exact_soln(t):
+        return np.exp(-t)
+
+    def rhs(t, state):
+        return -state
+
+    t_final = 4
+    rtol = 1e-8
+    controller = PIStepSizeController(error_order=error_order, rtol=rtol,
+                                      atol=1e-12)
+
+    step, t, state = advance_state(
+        rhs=rhs, timestepper=integrator, state=exact_soln(0), t=0,
+        t_final=t_final, dt=1e-3, step_controller=controller)
+
+    assert np.isclose(t, t_final)
+    assert np.abs(state - exact_soln(t)) / exact_soln(t) < 100*rtol
+
+    # Same accuracy with a fixed dt requires many more steps
+    assert step < t_final / 1e-3
+
+
+def test_ros2_order():
+    """Test that the Rosenbrock integrator has the correct order."""
+
+    def exact_soln(t):
+        return np.array([
+            (1 - 1/999)*np.exp(-1000*t) + np.exp(-t)/999,
+            np.exp(-t)])
+
+    def rhs(t, state):
+        return np.array([-1000*state[0] + state[1], -state[1]], dtype=object)
+
+    def jacobian(t, state, rhs_value):
+        return finite_difference_jacobian(rhs, t, state, rhs_value)
+
+    from pytools.convergence import EOCRecorder
+    integrator_eoc = EOCRecorder()
+
+    t_final = 1
+    for nsteps in [10, 20, 40, 80]:
+        dt = t_final / nsteps
+        state = np.array([1., 1.], dtype=object)
+        for istep in range(nsteps):
+            state = ros2_step(state, istep*dt, dt, rhs, jacobian)
+
+        state = np.array(state, dtype=np.float64)
+        error = np.max(np.abs(state - exact_soln(t_final))
+                       / exact_soln(t_final))
+        integrator_eoc.add_data_point(dt, error)
+
+    logger.info(f"Time Integrator EOC:\n = {integrator_eoc}")
+    assert integrator_eoc.order_estimate() >= 2 - .2
+
+
+def test_strang_split_order():
+    """Test that Strang splitting has the correct order."""
+    transport_rate = -1.
+    reaction_rate = -2.
+
+    def exact_soln(t):
+        return np.exp((transport_rate + reaction_rate)*t)
+
+    def rhs(t, state):
+        return transport_rate*state
+
+    def reaction_step(state, t, dt):
+        return ros2_step(
+            np.array([state], dtype=object), t, dt,
+            lambda t, y: reaction_rate*y,
+            lambda t, y, f: np.array([[reaction_rate]], dtype=object))[0]
+
+    from functools import partial
+    timestepper = partial(strang_split_step, transport_step=rk4_step,
+                          reaction_step=reaction_step)
+
+    from pytools.convergence import EOCRecorder
+    integrator_eoc = EOCRecorder()
+
+    t_final = 1
+    for nsteps in [10, 20, 40, 80]:
+        dt = t_final / nsteps
+        state = exact_soln(0)
+        for istep in range(nsteps):
+            state = timestepper(state, istep*dt, dt, rhs)
+
+        error = np.abs(state - exact_soln(t_final)) / exact_soln(t_final)
+        integrator_eoc.add_data_point(dt, error)
+
+    logger.info(f"Time Integrator EOC:\n = {integrator_eoc}")
+    assert integrator_eoc.order_estimate() >= 2 - .2
+
+
+def test_strang_split_noncommuting_order():
+    """Test that Strang splitting of non-commuting operators is second order."""
+    transport_matrix = np.array([[-1., 2.], [0., -3.]])
+    reaction_matrix = np.array([[-2., 0.], [1., -1.]])
+
+    def matrix_exp(matrix, t):
+        eigvals, eigvecs = np.linalg.eig(matrix)
+        return np.real(
+            eigvecs @ np.diag(np.exp(eigvals*t)) @ np.linalg.inv(eigvecs))
+
+    def exact_soln(t):
+        return (matrix_exp(transport_matrix + reaction_matrix, t)
+                @ np.array([1., 1.]))
+
+    # Advance each operator exactly, so that only the splitting error remains
+    def transport_step(state, t, dt, rhs):
+        return matrix_exp(transport_matrix, dt) @ state
+
+    def reaction_step(state, t, dt):
+        return matrix_exp(reaction_matrix, dt) @ state
+
+    from functools import partial
+    timestepper = partial(strang_split_step, transport_step=transport_step,
+                          reaction_step=reaction_step)
+
+    from pytools.convergence import EOCRecorder
+    integrator_eoc = EOCRecorder()
+
+    t_final = 1
+    for nsteps in [10, 20, 40, 80]:
+        dt = t_final / nsteps
+        state = exact_soln(0)
+        for istep in range(nsteps):
+            state = timestepper(state, istep*dt, dt, None)
+
+        error = np.max(np.abs(state - exact_soln(t_final))
+                       / np.abs(exact_soln(t_final)))
+        integrator_eoc.add_data_point(dt, error)
+
+    logger.info(f"Time Integrator EOC:\n = {integrator_eoc}")
+    # The operators do not commute, so there is a splitting error
+    assert integrator_eoc.max_error() > 1e-3
+    assert integrator_eoc.order_estimate() >= 2 - .1
+
+
+@pytest.mark.parametrize("nsubsteps", [1, 4])
+def test_multirate_order(nsubsteps):
+    """Test that multirate stepping of a coupled system has the correct order."""
+    coupling_matrix = np.array([[-10., 1.], [1., -1.]])
+    eigvals, eigvecs = np.linalg.eig(coupling_matrix)
+
+    def exact_soln(t):
+        return (eigvecs @ np.diag(np.exp(eigvals*t)) @ np.linalg.inv(eigvecs)
+                @ np.array([1., 1.]))
+
+    def fast_rhs(t, state):
+        return np.array([coupling_matrix[0] @ state, 0.])
+
+    def slow_rhs(t, state):
+        return np.array([0., coupling_matrix[1] @ state])
+
+    from functools import partial
+    timestepper = partial(multirate_step, fast_rhs=fast_rhs,
+                          nsubsteps=nsubsteps)
+
+    from pytools.convergence import EOCRecorder
+    integrator_eoc = EOCRecorder()
+
+    t_final = 1
+    for nsteps in [10, 20, 40, 80]:
+        dt = t_final / nsteps
+        state = exact_soln(0)
+        for istep in range(nsteps):
+            state = timestepper(state, istep*dt, dt, slow_rhs)
+
+        error = np.max(np.abs(state - exact_soln(t_final))
+                       / np.abs(exact_soln(t_final)))
+        integrator_eoc.add_data_point(dt, error)
+
+    logger.info(f"Time Integrator EOC:\n = {integrator_eoc}")
+    assert integrator_eoc.order_estimate() >= 2 - .1
+
+
 leap_spec = importlib.util.find_spec("leap")
 found = leap_spec is not None
 if found:
@@ -148,7 +572,6 @@ if found:
         SSPRK22MethodBuilder, SSPRK33MethodBuilder,
         )
     from leap.rk.imex import KennedyCarpenterIMEXARK4MethodBuilder
-    from mirgecom.steppers import advance_state
 
     @pytest.mark.parametrize(("method", "method_order"), [
         (ODE23MethodBuilder("y", use_high_order=False), 2),
@@ -206,3 +206,67 @@ def test_pyrometheus_transport(ctx_factory, mechname, dim, order, use_lewis,
             diff_ct = cantera_soln.mix_diff_coeffs
             for i in range(nspecies):
                 assert inf_norm(diff[i] - diff_ct[i]) < 2.0e-11
+
+
+@pytest.mark.parametrize("use_lewis", [True, False])
+def test_mixture_averaged_transport_vars(ctx_factory, use_lewis):
+    """Test the fused transport properties against the individual methods."""
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    actx = PyOpenCLArrayContext(queue)
+
+    dim = 2
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(4,) * dim
+    )
+    dcoll = create_discretization_collection(actx, mesh, order=2)
+    ones = dcoll.zeros(actx) + 1.0
+    zeros = dcoll.zeros(actx)
+
+    def inf_norm(x):
+        return actx.to_numpy(op.norm(dcoll, x, np.inf))
+
+    cantera_soln = cantera.Solution(name="gas",
+                                    yaml=get_mechanism_input("uiuc_7sp"))
+    pyro_obj = get_pyrometheus_wrapper_class_from_cantera(
+        cantera_soln, temperature_niter=3)(actx.np)
+    nspecies = pyro_obj.num_species
+
+    lewis = 1.2*np.ones(nspecies,) if use_lewis else None
+    transport_model = MixtureAveragedTransport(pyro_obj, factor=1.5,
+                                               lewis=lewis)
+    eos = PyrometheusMixture(pyro_obj, temperature_guess=666.)
+    gas_model = GasModel(eos=eos, transport=transport_model)
+
+    cantera_soln.set_equivalence_ratio(phi=1.0, fuel="C2H4:1",
+                                       oxidizer="O2:1.0,N2:3.76")
+    cantera_soln.TP = 1500.0, 101325.0
+    cantera_soln.equilibrate("TP")
+    can_t, can_rho, can_y = cantera_soln.TDY
+
+    # vary the state in space to exercise the pointwise mixture rules
+    x_coord = actx.thaw(dcoll.nodes())[0]
+    tin = can_t * (ones + 0.2*x_coord)
+    rhoin = can_rho * ones
+    yin = can_y * ones
+
+    cv = make_conserved(dim=dim, mass=rhoin,
+            momentum=make_obj_array([zeros for _ in range(dim)]),
+            energy=rhoin*gas_model.eos.get_internal_energy(tin, yin),
+            species_mass=rhoin*yin)
+    fluid_state = make_fluid_state(cv, gas_model, tin)
+    cv = fluid_state.cv
+    dv = fluid_state.dv
+
+    tv = transport_model.transport_vars(cv, dv, eos)
+
+    mu = transport_model.viscosity(cv, dv, eos)
+    assert inf_norm(tv.viscosity - mu)/inf_norm(mu) < 1e-12
+    mu_b = transport_model.bulk_viscosity(cv, dv, eos)
+    assert inf_norm(tv.bulk_viscosity - mu_b)/inf_norm(mu_b) < 1e-12
+    kappa = transport_model.thermal_conductivity(cv, dv, eos)
+    assert inf_norm(tv.thermal_conductivity - kappa)/inf_norm(kappa) < 1e-12
+    diff = transport_model.species_diffusivity(cv, dv, eos)
+    for i in range(nspecies):
+        assert inf_norm(tv.species_diffusivity[i] - diff[i]) \
+            < 1e-12*inf_norm(diff[i])